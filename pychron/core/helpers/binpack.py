@@ -18,8 +18,68 @@
 # ============= standard library imports ========================
 # ============= local library imports  ==========================
 import base64
+import re
 import struct
 
+from numpy import dtype as npdtype, frombuffer, asarray, empty
+
+# struct format character -> numpy kind, size
+STRUCT_CODES = {
+    "b": "i1",
+    "B": "u1",
+    "h": "i2",
+    "H": "u2",
+    "i": "i4",
+    "I": "u4",
+    "q": "i8",
+    "Q": "u8",
+    "f": "f4",
+    "d": "f8",
+}
+BYTE_ORDERS = {"<": "<", ">": ">", "!": ">", "=": "=", "@": "="}
+FMT_REGEX = re.compile(r"(\d*)([a-zA-Z])")
+
+_DTYPES = {}
+
+
+def fmt_to_dtype(fmt):
+    """
+    convert a struct format string e.g. ">ff" to an equivalent numpy structured dtype.
+
+    returns None if the format cannot be represented by a packed numpy dtype (unsupported codes,
+    or native alignment padding between mixed types)
+    """
+    try:
+        return _DTYPES[fmt]
+    except KeyError:
+        pass
+
+    dt = None
+    order = "@"
+    body = fmt
+    if fmt and fmt[0] in BYTE_ORDERS:
+        order, body = fmt[0], fmt[1:]
+
+    codes = []
+    for count, c in FMT_REGEX.findall(body):
+        if c not in STRUCT_CODES:
+            codes = None
+            break
+        codes.extend([c] * int(count or 1))
+
+    if codes:
+        dt = npdtype(
+            [
+                ("f{}".format(i), "{}{}".format(BYTE_ORDERS[order], STRUCT_CODES[c]))
+                for i, c in enumerate(codes)
+            ]
+        )
+        if dt.itemsize != struct.calcsize(fmt):
+            dt = None
+
+    _DTYPES[fmt] = dt
+    return dt
+
 
 def format_blob(blob):
     return base64.b64decode(blob)
@@ -40,11 +100,59 @@ def pack(fmt, data):
     @param data:
     @return:
     """
-    # if len(args) > 1:
-    #     args = zip(args)
-    # b = b''
+    dt = fmt_to_dtype(fmt)
+    if dt is None:
+        return b"".join([struct.pack(fmt, *datum) for datum in data])
+
+    if not hasattr(data, "__len__"):
+        data = list(data)
 
-    return b"".join([struct.pack(fmt, *datum) for datum in data])
+    data = asarray(data)
+    if not data.size:
+        return b""
+
+    if data.dtype.kind == "O":
+        return b"".join([struct.pack(fmt, *datum) for datum in data])
+
+    data = data.reshape(-1, len(dt.names))
+    rec = empty(data.shape[0], dtype=dt)
+    for i, name in enumerate(dt.names):
+        rec[name] = data[:, i]
+
+    return rec.tobytes()
+
+
+def pack_columns(fmt, *columns):
+    """
+    pack equal length column arrays, e.g. pack_columns('>ff', xs, ys).
+    equivalent to pack(fmt, zip(*columns))
+    """
+    dt = fmt_to_dtype(fmt)
+    if dt is None:
+        return pack(fmt, zip(*columns))
+
+    n = min(len(c) for c in columns) if columns else 0
+    rec = empty(n, dtype=dt)
+    for name, c in zip(dt.names, columns):
+        rec[name] = c[:n]
+
+    return rec.tobytes()
+
+
+def unpack_columns(blob, fmt=">ff", step=None):
+    """
+    decode a blob into a tuple of numpy arrays, one per field in ``fmt``.
+
+    a trailing partial record is ignored
+    """
+    dt = fmt_to_dtype(fmt)
+    if dt is None or (step is not None and step != dt.itemsize):
+        cols = _unpack_struct(blob, fmt, step or struct.calcsize(fmt))
+        return tuple(asarray(c) for c in cols)
+
+    n = len(blob) // dt.itemsize
+    rec = frombuffer(blob, dtype=dt, count=n)
+    return tuple(rec[name] for name in dt.names)
 
 
 def unpack(blob, fmt=">ff", step=8, decode=False):
@@ -52,27 +160,37 @@ def unpack(blob, fmt=">ff", step=8, decode=False):
         blob = format_blob(blob)
 
     if blob:
-        try:
-            return list(
-                zip(
-                    *[
-                        struct.unpack(fmt, blob[i : i + step])
-                        for i in range(0, len(blob), step)
-                    ]
-                )
-            )
-        except struct.error:
-            ret = []
-            for i in range(0, len(blob), step):
-                try:
-                    args = struct.unpack(fmt, blob[i : i + step])
-                except struct.error:
-                    break
-                ret.append(args)
-            return list(zip(*ret))
+        dt = fmt_to_dtype(fmt)
+        if dt is None or step != dt.itemsize:
+            return _unpack_struct(blob, fmt, step)
 
+        if len(blob) < dt.itemsize:
+            return []
+
+        return [tuple(c.tolist()) for c in unpack_columns(blob, fmt)]
     else:
-        return [[] for _ in fmt.count("f")]
+        return [[] for _ in range(fmt.count("f"))]
+
+
+def _unpack_struct(blob, fmt, step):
+    try:
+        return list(
+            zip(
+                *[
+                    struct.unpack(fmt, blob[i : i + step])
+                    for i in range(0, len(blob), step)
+                ]
+            )
+        )
+    except struct.error:
+        ret = []
+        for i in range(0, len(blob), step):
+            try:
+                args = struct.unpack(fmt, blob[i : i + step])
+            except struct.error:
+                break
+            ret.append(args)
+        return list(zip(*ret))
 
 
 # ============= EOF =============================================
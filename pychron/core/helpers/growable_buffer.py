@@ -0,0 +1,83 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+from numpy import empty, float64
+
+
+class GrowableBuffer(object):
+    """
+    Preallocated x,y sample buffer with geometric growth.
+
+    Appending is amortized O(1). ``xs`` and ``ys`` are views of the first ``n`` samples. Views
+    handed out earlier are never modified by later appends since samples are only written past
+    the end of any existing view
+    """
+
+    def __init__(self, xs=None, ys=None, capacity=256, growth=2, dtype=float64):
+        self._growth = growth
+        self._dtype = dtype
+        self._n = 0
+
+        n = 0 if xs is None else len(xs)
+        capacity = max(capacity, int(n * growth))
+        self._xs = empty(capacity, dtype=dtype)
+        self._ys = empty(capacity, dtype=dtype)
+        if n:
+            self._xs[:n] = xs
+            self._ys[:n] = ys
+            self._n = n
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def capacity(self):
+        return self._xs.shape[0]
+
+    @property
+    def xs(self):
+        return self._xs[: self._n]
+
+    @property
+    def ys(self):
+        return self._ys[: self._n]
+
+    def append(self, x, y):
+        n = self._n
+        if n == self._xs.shape[0]:
+            self._grow()
+
+        self._xs[n] = x
+        self._ys[n] = y
+        self._n = n + 1
+
+    def freeze(self):
+        """
+        return trimmed copies of the data. the copies do not keep the preallocated capacity alive
+
+        :return: xs, ys
+        """
+        return self.xs.copy(), self.ys.copy()
+
+    def _grow(self):
+        n = self._n
+        capacity = max(n + 1, int(n * self._growth))
+        for attr in ("_xs", "_ys"):
+            a = empty(capacity, dtype=self._dtype)
+            a[:n] = getattr(self, attr)[:n]
+            setattr(self, attr, a)
+
+
+# ============= EOF =============================================
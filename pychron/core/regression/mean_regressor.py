@@ -17,13 +17,20 @@
 # ============= enthought library imports =======================
 # ============= standard library imports ========================
 
-from numpy import average, where, full
+from numpy import average, where, full, repeat, newaxis, asarray
 
 from pychron.core.helpers.formatting import floatfmt
 from pychron.pychron_constants import SEM, MSEM
 from .base_regressor import BaseRegressor
 
 
+def _repeat_means(means, exog):
+    exog = asarray(exog)
+    # exog is either (npts, ...) or one matrix per trial (ntrials, npts, k)
+    npts = exog.shape[1] if exog.ndim == 3 else exog.shape[0]
+    return repeat(means[:, newaxis], npts, axis=1)
+
+
 class MeanRegressor(BaseRegressor):
     _fit = "average"
 
@@ -33,6 +40,9 @@ class MeanRegressor(BaseRegressor):
     def fast_predict2(self, endog, exog):
         return full(exog.shape[0], endog.mean())
 
+    def fast_predict_batch(self, endogs, exog):
+        return _repeat_means(endogs.mean(axis=1), exog)
+
     def calculate(self, filtering=False, **kw):
         # cxs, cys = self.pre_clean_ys, self.pre_clean_ys
         if not filtering:
@@ -165,6 +175,10 @@ class WeightedMeanRegressor(MeanRegressor):
         mean = average(endog, weights=ws)
         return full(exog.shape[0], mean)
 
+    def fast_predict_batch(self, endogs, exog):
+        ws = self._get_weights()
+        return _repeat_means(average(endogs, axis=1, weights=ws), exog)
+
     @property
     def se(self):
         """
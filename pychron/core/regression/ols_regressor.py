@@ -26,6 +26,7 @@ from numpy import (
     hstack,
     ones_like,
     array,
+    einsum,
 )
 from statsmodels.api import OLS
 from traits.api import Int, Property
@@ -90,6 +91,22 @@ class OLSRegressor(BaseRegressor):
 
         return dot(exog, beta)
 
+    def fast_predict_batch(self, endogs, pexog):
+        """
+        solve many fits that share the same exog matrix in one pass. used by the monte carlo
+        estimator
+
+        :param endogs: (ntrials, n) array. one set of ys per trial
+        :param pexog: (npts, k) exog matrix or (ntrials, npts, k) array, one matrix per trial
+        :return: (ntrials, npts) array of predicted values
+        """
+        ols = self._ols
+        betas = dot(linalg.pinv(ols.wexog), ols.whiten(endogs.T))
+        if pexog.ndim == 2:
+            return dot(pexog, betas).T
+        else:
+            return einsum("tpk,kt->tp", pexog, betas)
+
     def determine_fit(self):
         if self._fit == AUTO_LINEAR_PARABOLIC:
             self.set_degree("linear", refresh=False)
@@ -17,39 +17,55 @@
 # ============= enthought library imports =======================
 # ============= standard library imports ========================
 
-from numpy import zeros, percentile, array, random, abs as nabs, column_stack
-from scipy.stats import norm
-
+from numpy import zeros, percentile, random, abs as nabs, column_stack
 
 # ============= local library imports  ==========================
 
 
 class MonteCarloEstimator(object):
-    def __init__(self, ntrials, regressor, seed=None):
+    """
+    Estimate prediction errors by refitting ``ntrials`` perturbed copies of the data.
+
+    Regressors that implement ``fast_predict_batch`` (the least squares regressors) solve all
+    trials in a chunk with a single matrix product. Others fall back to one ``fast_predict2``
+    call per trial. Trials are processed in chunks to bound memory use
+    """
+
+    # approximate maximum number of floats allocated per chunk
+    max_chunk_elements = 2**22
+
+    def __init__(self, ntrials, regressor, seed=None, chunk_size=None):
         self.regressor = regressor
         self.ntrials = ntrials
         self.seed = seed
+        self.chunk_size = chunk_size
 
     def _calculate(self, nominal_ys, ps):
         res = nominal_ys - ps
         pct = (15.87, 84.13)
 
-        a, b = array([percentile(ri, pct) for ri in res.T]).T
+        a, b = percentile(res, pct, axis=0)
         a, b = nabs(a), nabs(b)
         return (a + b) * 0.5
 
-    def _get_dist(self, n, npts):
-        if self.seed:
-            random.seed(self.seed)
+    def _get_rng(self):
+        return random.RandomState(self.seed)
 
-        ndist = norm()
+    def _chunks(self, n, npts):
         ntrials = self.ntrials
+        size = self.chunk_size
+        if not size:
+            # perturbed ys, predictions and (possibly) a per trial exog matrix
+            size = max(1, self.max_chunk_elements // (n + 10 * npts))
 
-        ga = ndist.rvs((ntrials, n))
-        ps = zeros((ntrials, npts))
-        return ndist, ga, ps
+        for s in range(0, ntrials, size):
+            yield s, min(s + size, ntrials)
 
     def _estimate(self, pts, pexog, ys=None, yserr=None):
+        """
+        :param pexog: exog matrix for pts or a callable ``pexog(rng, m)`` that returns an
+        (m, npts, k) array, one exog matrix per trial
+        """
         reg = self.regressor
         nominal_ys = reg.predict(pts)
 
@@ -60,17 +76,25 @@ class MonteCarloEstimator(object):
 
         n, npts = len(ys), len(pts)
 
-        ntrials = self.ntrials
-        ndist, ga, ps = self._get_dist(n, npts)
-        pred = reg.fast_predict2
-        yp = ys + yserr * ga
+        rng = self._get_rng()
+        ps = zeros((self.ntrials, npts))
 
-        if hasattr(pexog, "__call__"):
-            for i in range(ntrials):
-                ps[i] = pred(yp[i], pexog(i))
-        else:
-            for i in range(ntrials):
-                ps[i] = pred(yp[i], pexog)
+        batch = getattr(reg, "fast_predict_batch", None)
+        pred = reg.fast_predict2
+        per_trial = hasattr(pexog, "__call__")
+        for s, e in self._chunks(n, npts):
+            m = e - s
+            yp = ys + yserr * rng.standard_normal((m, n))
+            cpexog = pexog(rng, m) if per_trial else pexog
+
+            if batch is not None:
+                ps[s:e] = batch(yp, cpexog)
+            elif per_trial:
+                for i in range(m):
+                    ps[s + i] = pred(yp[i], cpexog[i])
+            else:
+                for i in range(m):
+                    ps[s + i] = pred(yp[i], cpexog)
 
         return nominal_ys, self._calculate(nominal_ys, ps)
 
@@ -87,20 +111,14 @@ class FluxEstimator(MonteCarloEstimator):
     def estimate_position_err(self, pts, error):
         reg = self.regressor
         ox, oy = pts.T
+        npts = len(pts)
 
-        n, npts = len(reg.ys), len(pts)
-
-        ntrials = self.ntrials
-        ndist, ga, ps = self._get_dist(n, npts)
-
-        pgax = ndist.rvs((ntrials, npts))
-        pgay = ndist.rvs((ntrials, npts))
-
-        pgax *= error
-        pgay *= error
+        def get_pexog(rng, m):
+            pgax = rng.standard_normal((m, npts)) * error
+            pgay = rng.standard_normal((m, npts)) * error
 
-        def get_pexog(i):
-            return reg.get_exog(column_stack((ox + pgax[i], oy + pgay[i])))
+            xy = column_stack(((ox + pgax).ravel(), (oy + pgay).ravel()))
+            return reg.get_exog(xy).reshape(m, npts, -1)
 
         return self._estimate(pts, get_pexog, yserr=0)
 
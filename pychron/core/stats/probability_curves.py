@@ -17,32 +17,192 @@
 # ============= enthought library imports =======================
 
 # ============= standard library imports ========================
-from numpy import linspace, zeros, exp, pi, full
-
+from numpy import (
+    linspace,
+    zeros,
+    exp,
+    pi,
+    asarray,
+    abs as nabs,
+    sqrt,
+    log,
+    concatenate,
+    unique,
+    maximum,
+    argmax,
+    argsort,
+    dot,
+    searchsorted,
+)
 
 # ============= local library imports  ==========================
 
-
-def cumulative_probability(ages, errors, xmi, xma, n=100):
-    x = linspace(xmi, xma, n)
-    probs = zeros(n)
-
-    for ai, ei in zip(ages, errors):
-        if abs(ai) < 1e-10 or abs(ei) < 1e-10:
+# limit on the number of elements of the intermediate (ages x points) arrays
+MAX_CHUNK_ELEMENTS = 2**22
+CHUNK_SIZE = 64
+# contributions further than this from an analysis are < 1e-30 of its peak and are ignored
+TRUNCATE_SIGMA = 12
+
+
+def _valid(ages, errors):
+    ages = asarray(ages, dtype=float)
+    errors = asarray(errors, dtype=float)
+    mask = (nabs(ages) >= 1e-10) & (nabs(errors) >= 1e-10)
+    return ages[mask], nabs(errors[mask])
+
+
+def probability_density(x, ages, errors):
+    """
+    sum of the normal distributions ages +/- errors evaluated at ``x``
+
+    p=1/(2*pi*sigma2) *exp (-(x-u)**2)/(2*sigma2)
+    see http://en.wikipedia.org/wiki/Normal_distribution
+
+    analyses are sorted and processed in chunks. each chunk is only evaluated at the points
+    within TRUNCATE_SIGMA of its analyses, so the cost for many narrow, well separated analyses,
+    e.g. detrital crystals, is far less than (ages x points)
+    """
+    x = asarray(x, dtype=float)
+    ages, errors = _valid(ages, errors)
+
+    if x.shape[0] <= 16:
+        # a few points, e.g. when bisecting. windowing is not worth it
+        es2 = 2 * errors**2
+        d = x - ages[:, None]
+        return dot((es2 * pi) ** -0.5, exp(-(d * d) / es2[:, None]))
+
+    xorder = argsort(x)
+    sx = x[xorder]
+    order = argsort(ages)
+    ages, errors = ages[order], errors[order]
+
+    es2 = 2 * errors**2
+    coeffs = (es2 * pi) ** -0.5
+    scales = -1 / es2
+    lows = searchsorted(sx, ages - TRUNCATE_SIGMA * errors)
+    highs = searchsorted(sx, ages + TRUNCATE_SIGMA * errors, side="right")
+
+    probs = zeros(x.shape[0])
+    chunk = max(1, min(CHUNK_SIZE, MAX_CHUNK_ELEMENTS // max(1, x.shape[0])))
+    for i in range(0, ages.shape[0], chunk):
+        s = slice(i, i + chunk)
+        lo, hi = lows[s].min(), highs[s].max()
+        if lo == hi:
             continue
 
-        # calculate probability curve for ai+/-ei
-        # p=1/(2*pi*sigma2) *exp (-(x-u)**2)/(2*sigma2)
-        # see http://en.wikipedia.org/wiki/Normal_distribution
-        ds = (x - full(n, ai)) ** 2
-        es2 = full(n, 2 * ei * ei)
-        gs = (es2 * pi) ** -0.5 * exp(-ds / es2)
+        d = sx[lo:hi] - ages[s, None]
+        d *= d
+        d *= scales[s, None]
+        exp(d, out=d)
+        probs[lo:hi] += dot(coeffs[s], d)
+
+    ret = zeros(x.shape[0])
+    ret[xorder] = probs
+    return ret
 
-        # cumulate probabilities
-        # numpy element_wise addition
-        probs += gs
 
-    return x, probs
+def cumulative_probability(ages, errors, xmi, xma, n=100, adaptive=False):
+    """
+    :param adaptive: add points around analyses too narrow to be resolved by the ``n`` point
+        grid. the returned x values are not evenly spaced
+    :return: x, probs
+    """
+    x = linspace(xmi, xma, n)
+    if adaptive and n > 1:
+        x = _adaptive_grid(x, ages, errors)
+
+    return x, probability_density(x, ages, errors)
+
+
+def _adaptive_grid(x, ages, errors, offsets=(-2, -1, -0.5, 0, 0.5, 1, 2)):
+    xmi, xma = x[0], x[-1]
+    dx = x[1] - x[0]
+
+    ages, errors = _valid(ages, errors)
+    mask = errors < 2 * dx
+    if not mask.any():
+        return x
+
+    ages, errors = ages[mask], errors[mask]
+    extra = concatenate([ages + o * errors for o in offsets])
+    extra = extra[(extra > xmi) & (extra < xma)]
+    return unique(concatenate((x, extra)))
+
+
+def asymptotic_limits(ages, errors, tol=0.1, xmi=None, xma=None, n=256, nmax=256):
+    """
+    x limits beyond which the probability curve stays below ``tol`` * its maximum.
+
+    computed from the tails of the individual analyses instead of by repeatedly evaluating the
+    curve over a widening range. a single analysis drops below a level t at
+    a +/- e*sqrt(2*ln(c/t)), c=(2*pi*e**2)**-0.5. the outermost crossing of the summed curve
+    is bracketed by the crossings for t (each analysis alone) and t/n_analyses (all analyses
+    together), located on a grid and refined by bisection
+
+    :param tol: fraction of the maximum
+    :param xmi: the limits are never narrower than xmi,xma
+    :return: x1, x2
+    """
+    ages, errors = _valid(ages, errors)
+    if not ages.shape[0]:
+        return xmi, xma
+
+    # the maximum of the curve is at, or near, the peak of one of the analyses. check a grid
+    # and the peaks of the narrowest analyses
+    c = (2 * pi * errors**2) ** -0.5
+    peaks = ages[argsort(c)[-nmax:]]
+    x = concatenate((linspace(ages.min(), ages.max(), n * 4), peaks))
+    ys = probability_density(x, ages, errors)
+    i = argmax(ys)
+    xpeak, t = x[i], tol * ys[i]
+
+    def tails(level):
+        return errors * sqrt(2 * log(maximum(c / level, 1)))
+
+    # the curve is >= t where any single analysis is >= t, and at xpeak
+    high = c > t
+    inner = tails(t)[high]
+    outer = tails(t / ages.shape[0])
+    lend, hend = xpeak, xpeak
+    if high.any():
+        lend = min(lend, (ages[high] - inner).min())
+        hend = max(hend, (ages[high] + inner).max())
+
+    x1 = _crossing(ages, errors, t, min((ages - outer).min(), lend), lend, n)
+    x2 = _crossing(ages, errors, t, max((ages + outer).max(), hend), hend, n)
+
+    if xmi is not None:
+        x1 = min(x1, xmi)
+    if xma is not None:
+        x2 = max(x2, xma)
+    return x1, x2
+
+
+def _crossing(ages, errors, t, start, end, n, niter=30):
+    """
+    first point going from ``start`` towards ``end`` where the curve reaches ``t``
+    """
+    if start == end:
+        return start
+
+    xs = linspace(start, end, n)
+    ys = probability_density(xs, ages, errors)
+    above = ys >= t
+    if not above.any():
+        return end
+
+    i = argmax(above)
+    if i == 0:
+        return start
+
+    a, b = xs[i - 1], xs[i]
+    for _ in range(niter):
+        m = (a + b) / 2.0
+        if probability_density((m,), ages, errors)[0] >= t:
+            b = m
+        else:
+            a = m
+    return a
 
 
 def kernel_density(ages, errors, xmi, xma, n=100):
@@ -0,0 +1,72 @@
+import unittest
+
+from numpy import full, linspace
+from numpy.random import RandomState
+from numpy.testing import assert_allclose
+
+from pychron.core.regression.flux_regressor import BowlFluxRegressor
+from pychron.core.regression.ols_regressor import PolynomialRegressor
+from pychron.core.stats.monte_carlo import FluxEstimator, RegressionEstimator
+
+
+class PerTrialEstimator(FluxEstimator):
+    """
+    disable the batched path
+    """
+
+    def _estimate(self, pts, pexog, ys=None, yserr=None):
+        batch = self.regressor.fast_predict_batch
+        self.regressor.fast_predict_batch = None
+        try:
+            return super(PerTrialEstimator, self)._estimate(pts, pexog, ys, yserr)
+        finally:
+            self.regressor.fast_predict_batch = batch
+
+
+class MonteCarloTestCase(unittest.TestCase):
+    def setUp(self):
+        rs = RandomState(1)
+        xy = rs.uniform(-1, 1, (30, 2))
+        z = 1 + 0.1 * xy[:, 0] + 0.05 * xy[:, 1] ** 2 + rs.normal(0, 0.001, 30)
+
+        self.reg = BowlFluxRegressor(xs=xy, ys=z, yserr=full(30, 0.001))
+        self.reg.calculate()
+        self.pts = rs.uniform(-1, 1, (20, 2))
+
+    def test_batch(self):
+        _, a = FluxEstimator(500, self.reg, seed=7).estimate(self.pts)
+        _, b = PerTrialEstimator(500, self.reg, seed=7).estimate(self.pts)
+        assert_allclose(a, b, rtol=1e-9)
+
+    def test_batch_position_err(self):
+        _, a = FluxEstimator(500, self.reg, seed=7).estimate_position_err(self.pts, 0.01)
+        _, b = PerTrialEstimator(500, self.reg, seed=7).estimate_position_err(
+            self.pts, 0.01
+        )
+        assert_allclose(a, b, rtol=1e-9)
+
+    def test_seed(self):
+        _, a = FluxEstimator(200, self.reg, seed=3).estimate(self.pts)
+        _, b = FluxEstimator(200, self.reg, seed=3).estimate(self.pts)
+        assert_allclose(a, b, rtol=0)
+
+    def test_chunks(self):
+        _, a = FluxEstimator(200, self.reg, seed=3).estimate(self.pts)
+        _, b = FluxEstimator(200, self.reg, seed=3, chunk_size=30).estimate(self.pts)
+        assert_allclose(a, b, rtol=1e-12)
+
+    def test_regression(self):
+        rs = RandomState(2)
+        xs = linspace(0, 10, 30)
+        ys = 2 * xs + 1 + rs.normal(0, 0.1, 30)
+        reg = PolynomialRegressor(xs=xs, ys=ys, yserr=full(30, 0.1), fit="linear")
+        reg.calculate()
+
+        pts = linspace(0, 5, 3)
+        _, es = RegressionEstimator(5000, reg, seed=3).estimate(pts)
+        ci = reg.predict_error(pts, error_calc="CI")
+        assert_allclose(es, ci, rtol=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
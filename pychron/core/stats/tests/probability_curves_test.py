@@ -0,0 +1,77 @@
+import unittest
+
+from numpy import linspace, zeros, exp, pi, random, abs as nabs, concatenate
+
+from pychron.core.stats.probability_curves import (
+    cumulative_probability,
+    probability_density,
+    asymptotic_limits,
+)
+
+
+def reference_cumulative_probability(ages, errors, xmi, xma, n=100):
+    x = linspace(xmi, xma, n)
+    probs = zeros(n)
+    for ai, ei in zip(ages, errors):
+        if abs(ai) < 1e-10 or abs(ei) < 1e-10:
+            continue
+        es2 = 2 * ei * ei
+        probs += (es2 * pi) ** -0.5 * exp(-((x - ai) ** 2) / es2)
+    return x, probs
+
+
+class ProbabilityCurvesTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = random.RandomState(7)
+        self.ages = concatenate(
+            (rng.normal(28.2, 0.05, 300), rng.normal(30, 0.5, 200), rng.uniform(20, 60, 100))
+        )
+        self.errors = rng.uniform(0.01, 0.3, self.ages.shape[0])
+        self.ages[0] = 0
+
+    def test_cumulative_probability(self):
+        x, ys = cumulative_probability(self.ages, self.errors, 15, 65, n=500)
+        rx, rys = reference_cumulative_probability(
+            self.ages, self.errors, 15, 65, n=500
+        )
+        self.assertTrue((x == rx).all())
+        self.assertLess(nabs(ys - rys).max(), 1e-12 * rys.max())
+
+    def test_unsorted_points(self):
+        x = random.RandomState(1).uniform(15, 65, 200)
+        ys = probability_density(x, self.ages, self.errors)
+        for xi, yi in zip(x[:10], ys[:10]):
+            _, ry = reference_cumulative_probability(
+                self.ages, self.errors, xi, xi, n=1
+            )
+            self.assertAlmostEqual(yi, ry[0])
+
+    def test_adaptive(self):
+        ages, errors = [10, 30], [0.001, 1]
+        x, ys = cumulative_probability(ages, errors, 0, 40, n=50, adaptive=True)
+        self.assertIn(10, x)
+        self.assertTrue((x[1:] > x[:-1]).all())
+        self.assertAlmostEqual(ys.max(), (2 * pi * 0.001**2) ** -0.5, 3)
+
+    def test_asymptotic_limits(self):
+        tol = 0.1
+        x1, x2 = asymptotic_limits(self.ages, self.errors, tol)
+        x, ys = cumulative_probability(self.ages, self.errors, x1, x2, n=2000)
+        t = tol * ys.max()
+
+        self.assertAlmostEqual(ys[0] / t, 1, 2)
+        self.assertAlmostEqual(ys[-1] / t, 1, 2)
+
+        # nothing outside the limits reaches the threshold
+        _, lys = cumulative_probability(self.ages, self.errors, x1 - 20, x1, n=2000)
+        _, hys = cumulative_probability(self.ages, self.errors, x2, x2 + 20, n=2000)
+        self.assertLessEqual(lys[:-1].max(), t)
+        self.assertLessEqual(hys[1:].max(), t)
+
+    def test_asymptotic_limits_nominal(self):
+        x1, x2 = asymptotic_limits([10, 11], [0.1, 0.1], 0.1, xmi=5, xma=20)
+        self.assertEqual((x1, x2), (5, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from numpy import array
+
+from pychron.core.helpers.growable_buffer import GrowableBuffer
+from pychron.processing.isotope import Isotope
+
+
+class GrowableBufferTestCase(unittest.TestCase):
+    def test_append(self):
+        b = GrowableBuffer(capacity=2)
+        for i in range(5):
+            b.append(i, i * 10)
+
+        self.assertEqual(len(b), 5)
+        self.assertEqual(b.capacity, 8)
+        self.assertEqual(list(b.xs), [0, 1, 2, 3, 4])
+        self.assertEqual(list(b.ys), [0, 10, 20, 30, 40])
+
+    def test_seed(self):
+        b = GrowableBuffer(array([1.0, 2.0]), array([3.0, 4.0]))
+        b.append(5, 6)
+        self.assertEqual(list(b.xs), [1, 2, 5])
+        self.assertEqual(list(b.ys), [3, 4, 6])
+
+    def test_views_unchanged(self):
+        b = GrowableBuffer(capacity=4)
+        b.append(1, 1)
+        xs = b.xs
+        b.append(2, 2)
+        self.assertEqual(list(xs), [1])
+
+    def test_freeze(self):
+        b = GrowableBuffer()
+        b.append(1, 2)
+        xs, ys = b.freeze()
+        self.assertEqual(xs.shape, (1,))
+        self.assertIsNone(xs.base)
+
+
+class IsotopeAppendTestCase(unittest.TestCase):
+    def setUp(self):
+        self.iso = Isotope("Ar40", "H1")
+
+    def test_append(self):
+        for i in range(300):
+            self.iso.append_data(i, 2 * i)
+
+        self.assertEqual(self.iso.n, 300)
+        self.assertEqual(self.iso.ys[-1], 598)
+
+        self.iso.freeze_data()
+        self.assertEqual(self.iso.xs.shape, (300,))
+        self.assertIsNone(self.iso.xs.base)
+
+    def test_reseed(self):
+        self.iso.append_data(0, 0)
+        self.iso.xs, self.iso.ys = array([10.0]), array([20.0])
+        self.iso.append_data(11, 21)
+        self.assertEqual(list(self.iso.xs), [10, 11])
+        self.assertEqual(list(self.iso.ys), [20, 21])
+
+    def test_baseline(self):
+        self.iso.baseline.append_data(1, 2)
+        self.iso.baseline.freeze_data()
+        self.assertEqual(list(self.iso.baseline.ys), [2])
+        self.assertEqual(self.iso.n, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -69,6 +69,7 @@ class myTabularEditor(TabularEditor):
     autoscroll = Bool(False)
     scroll_to_bottom = Str
     scroll_to_top = Str
+    scrolled_to_end = Str
 
     def _get_klass(self):
         return _TabularEditor
@@ -571,6 +572,7 @@ class _TabularEditor(qtTabularEditor):
 
     scroll_to_bottom = Event
     scroll_to_top = Event
+    scrolled_to_end = Event
 
     def init(self, layout):
         factory = self.factory
@@ -631,6 +633,15 @@ class _TabularEditor(qtTabularEditor):
             self.sync_value(factory.scroll_to_bottom, "scroll_to_bottom", "from")
             self.sync_value(factory.scroll_to_top, "scroll_to_top", "from")
 
+        if factory.scrolled_to_end:
+            self.sync_value(factory.scrolled_to_end, "scrolled_to_end", "to")
+            control.verticalScrollBar().valueChanged.connect(self._on_vertical_scroll)
+            # rows that fit without a scroll bar can never be scrolled to the end
+            control.verticalScrollBar().rangeChanged.connect(self._on_vertical_range)
+            model = control.model()
+            model.modelReset.connect(self._check_scroll_range)
+            model.rowsInserted.connect(self._check_scroll_range)
+
         # Connect other signals as necessary
         # signal = QtCore.SIGNAL('activated(QModelIndex)')
         # QtCore.QObject.connect(control, signal, self._on_activate)
@@ -769,6 +780,26 @@ class _TabularEditor(qtTabularEditor):
         super(_TabularEditor, self)._scroll_to_row_changed(0)
         super(_TabularEditor, self)._scroll_to_row_changed(row)
 
+    def _on_vertical_scroll(self, v):
+        if v and v == self.control.verticalScrollBar().maximum():
+            self.scrolled_to_end = True
+
+    def _on_vertical_range(self, lo, hi):
+        if not hi:
+            self._check_scroll_range()
+
+    def _check_scroll_range(self, *args):
+        # wait for the layout to update the scroll bar
+        QtCore.QTimer.singleShot(0, self._scrolled_to_end_if_unfilled)
+
+    def _scrolled_to_end_if_unfilled(self):
+        control = self.control
+        if control is None:
+            return
+
+        if control.model().rowCount() and not control.verticalScrollBar().maximum():
+            self.scrolled_to_end = True
+
     def _scroll_to_bottom_changed(self):
         self.control.scrollToBottom()
 
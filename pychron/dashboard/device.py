@@ -94,6 +94,13 @@ class DashboardDevice(Loggable):
             elif dt > value.period:
                 self._trigger(value)
 
+    def read_value(self, value, force=False):
+        """
+        read ``value`` from the hardware device now
+        """
+        kw = {"force": True} if force else {}
+        self._trigger(value, **kw)
+
     def _trigger(self, value, **kw):
         try:
             self.debug(
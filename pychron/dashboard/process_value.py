@@ -56,6 +56,10 @@ class ProcessValue(HasTraits):
     record = Bool(False)
     display_name = Property
 
+    # duration of the last read and number of missed poll deadlines
+    latency = Float
+    missed_deadlines = Int
+
     def is_different(self, v):
         ret = None
         ct = time.time()
@@ -87,6 +91,7 @@ class ProcessValue(HasTraits):
                 VGroup(
                     HGroup(Readonly("tag"), Readonly("period")),
                     HGroup(Readonly("last_time_str"), Readonly("last_value")),
+                    HGroup(Readonly("latency"), Readonly("missed_deadlines")),
                     VGroup(
                         UItem(
                             "conditionals",
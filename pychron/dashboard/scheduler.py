@@ -0,0 +1,237 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+import heapq
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from threading import Thread, Condition
+
+from pychron.loggable import Loggable
+
+
+def communicator_key(device):
+    """
+    values of devices with the same key are never read concurrently. devices talking through
+    the same port share a key
+    """
+    hd = device.hardware_device
+    comm = getattr(hd, "communicator", None)
+    if comm is None:
+        return id(hd) if hd is not None else id(device)
+
+    port = getattr(comm, "port", None)
+    if port:
+        return getattr(comm, "host", None), port
+    return id(comm)
+
+
+class ValueStats(object):
+    def __init__(self):
+        self.n = 0
+        self.missed = 0
+        self.total_latency = 0
+        self.max_latency = 0
+        self.max_lateness = 0
+
+    @property
+    def mean_latency(self):
+        return self.total_latency / self.n if self.n else 0
+
+    def report(self):
+        return {
+            "n": self.n,
+            "missed": self.missed,
+            "mean_latency": self.mean_latency,
+            "max_latency": self.max_latency,
+            "max_lateness": self.max_lateness,
+        }
+
+
+class PollScheduler(Loggable):
+    """
+    Poll ProcessValues on their own deadlines.
+
+    A priority queue holds the next deadline of every value. When a deadline is reached the
+    read is dispatched to a thread pool. Reads of devices sharing a communicator are serialized
+    so a slow device only delays the values on its own port.
+
+    A value is rescheduled at ``deadline + period`` once its read finishes so periods do not
+    drift. If the read finished after that deadline the deadline is counted as missed and the
+    value is rescheduled on the next period boundary.
+
+    ``on_change`` values are read only when no value was pushed within their timeout.
+
+    ``clock`` and ``executor`` can be supplied to drive the scheduler manually with ``step``
+    instead of ``start``
+    """
+
+    min_period = 0.1
+
+    def __init__(self, nworkers=4, clock=time.time, executor=None, *args, **kw):
+        super(PollScheduler, self).__init__(*args, **kw)
+        self.nworkers = nworkers
+        self._clock = clock
+
+        self._heap = []
+        self._seq = count()
+        self._cond = Condition()
+        self._alive = False
+        self._stopped = False
+        self._thread = None
+        self._executor = executor
+        self._owns_executor = False
+
+        # communicator key: list of pending (deadline, device, value)
+        self._busy = {}
+        self.stats = {}
+
+    def add(self, device, value, deadline=None):
+        if deadline is None:
+            deadline = self._clock()
+
+        self.stats.setdefault(value, ValueStats())
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._seq), device, value))
+            self._cond.notify()
+
+    def start(self):
+        self._alive = True
+        self._stopped = False
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.nworkers, thread_name_prefix="DashboardPoll"
+            )
+            self._owns_executor = True
+
+        self._thread = Thread(target=self._run, name="DashboardScheduler")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._alive = False
+            self._stopped = True
+            self._cond.notify()
+
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._owns_executor = False
+
+    def report(self):
+        return {v.tag: s.report() for v, s in self.stats.items()}
+
+    def step(self):
+        """
+        dispatch every value whose deadline has been reached
+
+        :return: seconds until the next deadline or None if nothing is scheduled
+        """
+        while 1:
+            with self._cond:
+                dt = self._delay()
+                if dt is None or dt > 0:
+                    return dt
+
+                deadline, _, device, value = heapq.heappop(self._heap)
+
+            self._dispatch(deadline, device, value)
+
+    # private
+    def _delay(self):
+        if self._heap:
+            return self._heap[0][0] - self._clock()
+
+    def _run(self):
+        while 1:
+            with self._cond:
+                while self._alive:
+                    dt = self._delay()
+                    if dt is not None and dt <= 0:
+                        break
+                    self._cond.wait(dt)
+
+                if not self._alive:
+                    break
+
+            self.step()
+
+    def _dispatch(self, deadline, device, value):
+        key = communicator_key(device)
+        with self._cond:
+            pending = self._busy.get(key)
+            if pending is not None:
+                pending.append((deadline, device, value))
+                return
+            self._busy[key] = []
+
+        self._executor.submit(self._read, key, deadline, device, value)
+
+    def _read(self, key, deadline, device, value):
+        while 1:
+            try:
+                self._read_value(deadline, device, value)
+            except BaseException:
+                self.debug_exception()
+
+            with self._cond:
+                pending = self._busy[key]
+                if not pending or self._stopped:
+                    del self._busy[key]
+                    break
+                deadline, device, value = pending.pop(0)
+
+    def _read_value(self, deadline, device, value):
+        if not (device.use and value.enabled):
+            # check again later in case the value is enabled
+            self.add(device, value, self._clock() + 1)
+            return
+
+        period = value.period
+        st = self._clock()
+        if period == "on_change":
+            dt = st - value.last_time
+            if not value.timeout or dt < value.timeout:
+                nd = value.last_time + value.timeout if value.timeout else st + 1
+                self.add(device, value, max(nd, st + 1))
+                return
+
+            self.debug("Force trigger. timeout={}".format(value.timeout))
+            device.read_value(value, force=True)
+            period = value.timeout
+        else:
+            device.read_value(value)
+            period = max(float(period), self.min_period)
+
+        et = self._clock()
+        stats = self.stats[value]
+        stats.n += 1
+        latency = et - st
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+        stats.max_lateness = max(stats.max_lateness, st - deadline)
+
+        nd = deadline + period
+        if et > nd:
+            stats.missed += 1
+            nd += ((et - nd) // period + 1) * period
+
+        value.latency = latency
+        value.missed_deadlines = stats.missed
+        self.add(device, value, nd)
+
+
+# ============= EOF =============================================
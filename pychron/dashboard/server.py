@@ -16,17 +16,16 @@
 
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
-from traits.api import Instance, on_trait_change, List, Button, Bool
+from traits.api import Instance, on_trait_change, List, Button, Bool, Int
 
 # ============= standard library imports ========================
-from threading import Thread
 import os
 import pickle
-import time
 
 # ============= local library imports  ==========================
 from pychron.dashboard.constants import CRITICAL, NOERROR, WARNING
 from pychron.dashboard.device import DashboardDevice
+from pychron.dashboard.scheduler import PollScheduler
 from pychron.globals import globalv
 from pychron.hardware.core.i_core_device import ICoreDevice
 from pychron.core.helpers.filetools import add_extension
@@ -77,13 +76,17 @@ class DashboardServer(Loggable):
     emailer = Instance("pychron.social.emailer.Emailer")
     labspy_client = Instance("pychron.labspy.client.LabspyClient")
 
+    poll_workers = Int(4)
+
     use_db = False
     _alive = False
+    _scheduler = None
 
     def bind_preferences(self):
         bind_preference(
             self.notifier, "enabled", "pychron.dashboard.server.notifier_enabled"
         )
+        bind_preference(self, "poll_workers", "pychron.dashboard.server.poll_workers")
 
     def activate(self):
         emailer = self.application.get_service("pychron.social.emailer.Emailer")
@@ -103,7 +106,7 @@ class DashboardServer(Loggable):
             self.labspy_client.start()
 
     def deactivate(self):
-        pass
+        self.stop_poll()
 
     # def deactivate(self):
     # if self.use_db:
@@ -132,12 +135,24 @@ class DashboardServer(Loggable):
             self.notifier.add_request_handler("config", self._handle_config)
 
     def start_poll(self):
-        self.info("starting dashboard poll")
+        self.info("starting dashboard poll. workers={}".format(self.poll_workers))
         self._alive = True
-        t = Thread(name="poll", target=self._poll)
 
-        t.setDaemon(1)
-        t.start()
+        scheduler = PollScheduler(nworkers=max(1, self.poll_workers))
+        for dev in self.devices:
+            for v in dev.values:
+                scheduler.add(dev, v)
+
+        scheduler.start()
+        self._scheduler = scheduler
+
+    def stop_poll(self):
+        self._alive = False
+        if self._scheduler:
+            for tag, s in self._scheduler.report().items():
+                self.debug("{} poll stats {}".format(tag, s))
+            self._scheduler.stop()
+            self._scheduler = None
 
     def load_devices(self):
         dd = self._assemble_dev_dicts()
@@ -262,35 +277,6 @@ class DashboardServer(Loggable):
 
         return pickle.dumps(config)
 
-    def _poll(self):
-        if any((v.period == "on_change" for dev in self.devices for v in dev.values)):
-            mperiod = 1
-        else:
-            mperiod = min((v.period for dev in self.devices for v in dev.values))
-
-        self.debug("min period {}".format(mperiod))
-        while self._alive:
-            sst = time.time()
-            # self.debug('============= poll iteration start ============')
-            for dev in self.devices:
-                if not dev.use:
-                    continue
-
-                dev.trigger()
-
-            st = time.time()
-            pp = mperiod - (st - sst)
-            if pp >= 3:
-                self.debug("sleeping for {}".format(pp))
-
-            while self._alive:
-                if time.time() - st >= pp:
-                    break
-                time.sleep(0.1)
-
-            # dur = time.time() - sst
-            # self.debug('============= poll iteration finished dur={:0.1f}============'.format(dur))
-
     # def _set_error_flag(self, obj, msg):
     # self.notifier.send_message('error {}'.format(msg))
 
@@ -14,7 +14,7 @@
 # limitations under the License.
 # ===============================================================================
 
-from traits.api import Bool
+from traits.api import Bool, Int
 from traitsui.api import View, Item
 from apptools.preferences.preferences_helper import PreferencesHelper
 from envisage.ui.tasks.preferences_pane import PreferencesPane
@@ -25,6 +25,7 @@ class DashboardServerPreferences(PreferencesHelper):
     preferences_path = "pychron.dashboard.server"
 
     notifier_enabled = Bool
+    poll_workers = Int(4)
 
 
 class DashboardServerPreferencesPane(PreferencesPane):
@@ -32,7 +33,14 @@ class DashboardServerPreferencesPane(PreferencesPane):
     model_factory = DashboardServerPreferences
 
     def traits_view(self):
-        v = View(Item("notifier_enabled"))
+        v = View(
+            Item("notifier_enabled"),
+            Item(
+                "poll_workers",
+                tooltip="Number of threads used to read process values. Devices sharing "
+                "a communicator are never read concurrently",
+            ),
+        )
 
         return v
 
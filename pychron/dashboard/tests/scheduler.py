@@ -0,0 +1,156 @@
+import unittest
+
+from pychron.dashboard.process_value import ProcessValue
+from pychron.dashboard.scheduler import PollScheduler, communicator_key
+
+
+class Clock(object):
+    def __init__(self):
+        self.t = 0
+
+    def __call__(self):
+        return self.t
+
+
+class Executor(object):
+    """
+    fake executor. submitted reads are queued until ``run`` is called
+    """
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, func, *args):
+        self.jobs.append((func, args))
+
+    def run(self, hold=None):
+        """
+        run queued reads, including any submitted while running, except those of ``hold``
+
+        :return: number of reads run
+        """
+        n = 0
+        held = []
+        while self.jobs:
+            func, args = self.jobs.pop(0)
+            if hold is not None and args[2] is hold:
+                held.append((func, args))
+            else:
+                func(*args)
+                n += 1
+        self.jobs = held
+        return n
+
+
+class Communicator(object):
+    def __init__(self, port):
+        self.port = port
+
+
+class HardwareDevice(object):
+    def __init__(self, port):
+        self.communicator = Communicator(port)
+
+
+class Device(object):
+    use = True
+
+    def __init__(self, port, clock, delay=0):
+        self.hardware_device = HardwareDevice(port)
+        self.clock = clock
+        self.delay = delay
+        self.reads = []
+
+    def read_value(self, value, force=False):
+        self.reads.append((value.name, self.clock()))
+        self.clock.t += self.delay
+
+
+def make_value(name, period):
+    return ProcessValue(name=name, tag=name, period=period, enabled=True)
+
+
+class PollSchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.executor = Executor()
+        self.scheduler = PollScheduler(clock=self.clock, executor=self.executor)
+
+    def _advance(self, duration, hold=None):
+        end = self.clock.t + duration
+        while 1:
+            dt = self.scheduler.step()
+            if self.executor.run(hold):
+                continue
+            if dt is None or self.clock.t + dt > end:
+                break
+            self.clock.t += dt
+
+        self.clock.t = end
+
+    def test_slow_device_does_not_stall(self):
+        slow = Device("/dev/slow", self.clock)
+        fast = Device("/dev/fast", self.clock)
+        self.scheduler.add(slow, make_value("slow", 0.1))
+        self.scheduler.add(fast, make_value("fast", 0.1))
+
+        # the slow read is still in progress while the clock advances
+        self._advance(0.65, hold=slow)
+        self.assertEqual(len(slow.reads), 0)
+        self.assertEqual(len(fast.reads), 7)
+
+        self.executor.run()
+        self.assertEqual(len(slow.reads), 1)
+
+        report = self.scheduler.report()
+        self.assertGreater(report["slow"]["missed"], 0)
+        self.assertEqual(report["fast"]["missed"], 0)
+
+    def test_period(self):
+        dev = Device("/dev/a", self.clock, delay=0.03)
+        self.scheduler.add(dev, make_value("a", 0.1))
+        self._advance(0.55)
+
+        ts = [t for _, t in dev.reads]
+        self.assertEqual(len(ts), 6)
+        for i, t in enumerate(ts):
+            self.assertAlmostEqual(t, i * 0.1)
+
+        report = self.scheduler.report()["a"]
+        self.assertEqual(report["missed"], 0)
+        self.assertAlmostEqual(report["max_latency"], 0.03)
+
+    def test_missed(self):
+        dev = Device("/dev/a", self.clock, delay=0.25)
+        self.scheduler.add(dev, make_value("a", 0.1))
+        self._advance(0.65)
+
+        # every read overruns its period so reads resume on the next period boundary
+        ts = [t for _, t in dev.reads]
+        self.assertEqual(len(ts), 3)
+        for t, e in zip(ts, (0, 0.3, 0.6)):
+            self.assertAlmostEqual(t, e)
+        self.assertEqual(self.scheduler.report()["a"]["missed"], 3)
+
+    def test_shared_communicator(self):
+        a = Device("/dev/shared", self.clock)
+        b = Device("/dev/shared", self.clock)
+        c = Device("/dev/other", self.clock)
+        self.assertEqual(communicator_key(a), communicator_key(b))
+        self.assertNotEqual(communicator_key(a), communicator_key(c))
+
+        for dev, name in ((a, "a1"), (a, "a2"), (b, "b1"), (c, "c1")):
+            self.scheduler.add(dev, make_value(name, 0.1))
+
+        # one read per communicator is submitted, the others wait for it to finish
+        self.scheduler.step()
+        self.assertEqual(len(self.executor.jobs), 2)
+
+        self.executor.run()
+        self.assertEqual([n for n, _ in a.reads], ["a1", "a2"])
+        self.assertEqual([n for n, _ in b.reads], ["b1"])
+        self.assertEqual([n for n, _ in c.reads], ["c1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
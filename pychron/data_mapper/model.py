@@ -325,6 +325,8 @@ class DVCAnalysisImporterModel(BaseDVCImporterModel):
                     push=False,
                 )
 
+            # analyses may be committed in the background
+            persister.wait_for_persistence()
             persister.push()
 
     def _add_position(self, spec):
@@ -16,11 +16,12 @@
 
 # =============enthought library imports=======================
 import os
+import time
 from datetime import datetime, timedelta
-from threading import Lock
+from threading import Lock, local
 
 import six
-from sqlalchemy import create_engine, distinct, MetaData
+from sqlalchemy import create_engine, distinct, MetaData, event
 from sqlalchemy.exc import (
     SQLAlchemyError,
     InvalidRequestError,
@@ -132,9 +133,11 @@ class DatabaseAdapter(Loggable):
     It also provides some helper functions used extensively by the subclasses, e.g. ``_add_item``,
     ``_retrieve_items``
 
-    """
+    By default all threads share one session. Set ``use_scoped_session`` before connecting to
+    give each thread its own session and connection from a pool configured by ``pool_size``,
+    ``max_overflow``, ``pool_timeout`` and ``pool_pre_ping``. See ``pool_stats``
 
-    session = None
+    """
 
     sess_stack = 0
     reraise = False
@@ -176,9 +179,74 @@ class DatabaseAdapter(Loggable):
     _trying_to_add = False
     _test_connection_enabled = True
 
+    # session per thread
+    use_scoped_session = False
+    pool_size = 5
+    max_overflow = 10
+    pool_timeout = 30
+    pool_pre_ping = False
+
+    _engine = None
+    _shared_session = None
+    _shared_session_cnt = 0
+    _local = None
+    _pool_stats = None
+    _stats_lock = None
+
     def __init__(self, *args, **kw):
         super(DatabaseAdapter, self).__init__(*args, **kw)
         self._session_lock = Lock()
+        self._stats_lock = Lock()
+        self._local = local()
+        self._reset_pool_stats()
+
+    @property
+    def session(self):
+        if self.use_scoped_session:
+            return getattr(self._local, "session", None)
+        return self._shared_session
+
+    @session.setter
+    def session(self, v):
+        if self.use_scoped_session:
+            self._local.session = v
+        else:
+            self._shared_session = v
+
+    @property
+    def _session_cnt(self):
+        if self.use_scoped_session:
+            return getattr(self._local, "session_cnt", 0)
+        return self._shared_session_cnt
+
+    @_session_cnt.setter
+    def _session_cnt(self, v):
+        if self.use_scoped_session:
+            self._local.session_cnt = v
+        else:
+            self._shared_session_cnt = v
+
+    def pool_stats(self):
+        """
+        :return: dict of connection pool statistics. waits are the times taken to get a
+            connection when a thread opens a session in scoped session mode
+        """
+        with self._stats_lock:
+            stats = dict(self._pool_stats)
+
+        n = stats.pop("nwaits")
+        stats["mean_wait"] = stats.pop("total_wait") / n if n else 0
+        stats["nwaits"] = n
+
+        engine = self._engine
+        if engine is not None:
+            pool = engine.pool
+            stats["pool"] = pool.status()
+            for attr in ("size", "checkedout", "overflow"):
+                func = getattr(pool, attr, None)
+                if callable(func):
+                    stats[attr] = func()
+        return stats
 
     def create_all(self, metadata):
         """
@@ -200,8 +268,6 @@ class DatabaseAdapter(Loggable):
     #             sess = self.sess
     #         return SessionCTX(sess, parent=self, commit=commit, rollback=rollback)
 
-    _session_cnt = 0
-
     def session_ctx(self, use_parent_session=True):
         with self._session_lock:
             return SessionCTX(self, use_parent_session)
@@ -214,12 +280,12 @@ class DatabaseAdapter(Loggable):
                     if self.session:
                         self.session.close()
 
-                    self.session = self.session_factory()
+                    self.session = self._new_session()
                     self._session_cnt = 1
                 else:
                     if not self.session:
                         # self.debug('create new session {}'.format(id(self)))
-                        self.session = self.session_factory()
+                        self.session = self._new_session()
                     self._session_cnt += 1
             else:
                 self.warning("no session factory")
@@ -301,9 +367,22 @@ class DatabaseAdapter(Loggable):
                     self.info(
                         "{} connecting to database {}".format(id(self), self.public_url)
                     )
+                    kw = {}
+                    if self.use_scoped_session:
+                        kw["pool_pre_ping"] = self.pool_pre_ping
+                        if self.kind != "sqlite":
+                            kw.update(
+                                pool_size=self.pool_size,
+                                max_overflow=self.max_overflow,
+                                pool_timeout=self.pool_timeout,
+                            )
+
                     engine = create_engine(
-                        url, echo=self.echo, pool_recycle=pool_recycle
+                        url, echo=self.echo, pool_recycle=pool_recycle, **kw
                     )
+                    self._engine = engine
+                    self._reset_pool_stats()
+                    self._listen_pool(engine)
 
                     self.session_factory = sessionmaker(
                         bind=engine,
@@ -340,6 +419,47 @@ host= {}\nurl= {}'.format(
         self.connection_parameters_changed = False
         return self.connected
 
+    def _new_session(self):
+        sess = self.session_factory()
+        if self.use_scoped_session:
+            # check out the connection now so the time waiting for the pool is known
+            st = time.time()
+            sess.connection()
+            dt = time.time() - st
+            with self._stats_lock:
+                stats = self._pool_stats
+                stats["nwaits"] += 1
+                stats["total_wait"] += dt
+                stats["max_wait"] = max(stats["max_wait"], dt)
+        return sess
+
+    def _reset_pool_stats(self):
+        self._pool_stats = {
+            "connects": 0,
+            "checkouts": 0,
+            "checkins": 0,
+            "invalidations": 0,
+            "nwaits": 0,
+            "total_wait": 0,
+            "max_wait": 0,
+        }
+
+    def _listen_pool(self, engine):
+        def factory(key):
+            def func(*args):
+                with self._stats_lock:
+                    self._pool_stats[key] += 1
+
+            return func
+
+        for name, key in (
+            ("connect", "connects"),
+            ("checkout", "checkouts"),
+            ("checkin", "checkins"),
+            ("invalidate", "invalidations"),
+        ):
+            event.listen(engine, name, factory(key))
+
     # def initialize_database(self):
     # pass
 
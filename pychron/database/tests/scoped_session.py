@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+import unittest
+from threading import Thread, Barrier
+
+from sqlalchemy import text
+
+from pychron.database.core.database_adapter import DatabaseAdapter
+
+
+class ScopedSessionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _adapter(self, **kw):
+        db = DatabaseAdapter(kind="sqlite", path=os.path.join(self.root, "test.db"), **kw)
+        db.connect()
+        return db
+
+    def _sessions(self, db, n=4):
+        sessions = {}
+        barrier = Barrier(n, timeout=10)
+
+        def func(i):
+            with db.session_ctx() as sess:
+                with db.session_ctx() as sess2:
+                    self.assertIs(sess, sess2)
+                sess.execute(text("select 1"))
+                sessions[i] = sess
+                # keep every session open until all threads have one
+                barrier.wait()
+
+        ts = [Thread(target=func, args=(i,)) for i in range(n)]
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join()
+        return sessions
+
+    def test_shared(self):
+        db = self._adapter()
+        sessions = []
+
+        def func():
+            with db.session_ctx() as sess:
+                sessions.append(sess)
+
+        with db.session_ctx() as sess:
+            t = Thread(target=func)
+            t.start()
+            t.join()
+
+            self.assertIs(sessions[0], sess)
+
+    def test_scoped(self):
+        db = self._adapter(use_scoped_session=True)
+        sessions = self._sessions(db)
+        self.assertEqual(len({id(s) for s in sessions.values()}), 4)
+        self.assertIsNone(db.session)
+
+    def test_pool_stats(self):
+        db = self._adapter(use_scoped_session=True, pool_pre_ping=True)
+        self._sessions(db, n=3)
+
+        stats = db.pool_stats()
+        self.assertEqual(stats["nwaits"], 3)
+        self.assertGreaterEqual(stats["checkouts"], 3)
+        self.assertEqual(stats["checkouts"], stats["checkins"])
+        self.assertGreaterEqual(stats["max_wait"], stats["mean_wait"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,65 +13,164 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ===============================================================================
-from datetime import datetime
+import time
+from collections import OrderedDict
+
+# rough fixed cost of an analysis object and each of its isotopes, in bytes
+ANALYSIS_OVERHEAD = 16384
+ISOTOPE_OVERHEAD = 2048
+
+
+def _nbytes(a):
+    try:
+        return a.nbytes
+    except AttributeError:
+        return 0
+
+
+def estimate_analysis_size(an):
+    """
+    estimate the memory footprint of an analysis from its isotope arrays
+    """
+    size = ANALYSIS_OVERHEAD
+    isotopes = getattr(an, "isotopes", None)
+    if isotopes:
+        for iso in isotopes.values():
+            size += ISOTOPE_OVERHEAD
+            for m in (iso, iso.baseline, iso.sniff):
+                size += _nbytes(m.xs) + _nbytes(m.ys)
+    return size
 
 
 class DVCCache(object):
-    def __init__(self, max_size=1000):
-        self._cache = {}
+    """
+    LRU cache of DVCAnalysis objects keyed by uuid.
+
+    entries are kept in access order so eviction and expiration are O(1) per entry.
+    if ``max_bytes`` is set the cache is bounded by the estimated size of its entries instead of
+    by the number of entries.
+    """
+
+    def __init__(
+        self,
+        max_size=1000,
+        max_bytes=0,
+        ttl=60 * 15,
+        sizer=estimate_analysis_size,
+        clock=time.monotonic,
+    ):
+        self._cache = OrderedDict()
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizer = sizer
+        self._clock = clock
+
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def clear(self):
         self._cache.clear()
+        self._nbytes = 0
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def remove(self, key):
         try:
-            self._cache.pop(key)
+            _, _, nbytes = self._cache.pop(key)
         except KeyError:
             pass
+        else:
+            self._nbytes -= nbytes
 
     def clean(self):
-        t = 60 * 15  # 15 minutes
-        now = datetime.now()
-        remove = (
-            k
-            for k, v in self._cache.items()
-            if (now - v["date_accessed"]).total_seconds() > t
-        )
+        """
+        remove entries that have not been accessed in ``ttl`` seconds
+        """
+        if not self.ttl:
+            return
 
-        for k in remove:
-            del self._cache[k]
+        now = self._clock()
+        cache = self._cache
+        while cache:
+            key = next(iter(cache))
+            if now - cache[key][1] > self.ttl:
+                self.remove(key)
+                self.expirations += 1
+            else:
+                break
 
     def report(self):
-        return len(self._cache)
+        n = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "nbytes": self._nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / n if n else 0,
+        }
 
     def get(self, item):
-        obj = self._cache.get(item)
-        if obj:
-            obj["date_accessed"] = datetime.now()
-            return obj["value"]
+        try:
+            value, accessed, nbytes = self._cache[item]
+        except KeyError:
+            self.misses += 1
+            return
 
-    def update(self, key, value):
-        if key not in self._cache and len(self._cache) > self.max_size:
-            self.remove_oldest()
+        now = self._clock()
+        if self.ttl and now - accessed > self.ttl:
+            self.remove(item)
+            self.expirations += 1
+            self.misses += 1
+            return
+
+        self.hits += 1
+        self._set(item, value, now)
+        self._evict()
+        return value
 
-        self._cache[key] = {"date_accessed": datetime.now(), "value": value}
+    def update(self, key, value):
+        self._set(key, value, self._clock())
+        self._evict()
 
     def remove_oldest(self):
         """
-        Remove the entry that has the oldest accessed date
+        Remove the least recently accessed entry
         """
-        oldest_entry = None
-        for key in self._cache:
-            if oldest_entry is None:
-                oldest_entry = key
-            elif (
-                self._cache[key]["date_accessed"]
-                < self._cache[oldest_entry]["date_accessed"]
-            ):
-                oldest_entry = key
-
-        self._cache.pop(oldest_entry)
+        key = next(iter(self._cache))
+        self.remove(key)
+        self.evictions += 1
+
+    def _set(self, key, value, now):
+        # the size is re-estimated on every access because raw data may have been loaded
+        # since the entry was added
+        nbytes = self._sizer(value) if self.max_bytes else 0
+        old = self._cache.get(key)
+        if old:
+            self._nbytes -= old[2]
+
+        self._cache[key] = (value, now, nbytes)
+        self._cache.move_to_end(key)
+        self._nbytes += nbytes
+
+    def _evict(self):
+        # never evict the most recently used entry
+        while len(self._cache) > 1 and self._over_budget():
+            self.remove_oldest()
+
+    def _over_budget(self):
+        if self.max_bytes:
+            return self._nbytes > self.max_bytes
+        return self.max_size and len(self._cache) > self.max_size
 
 
 # ============= EOF =============================================
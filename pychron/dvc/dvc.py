@@ -17,9 +17,11 @@
 import os
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
+from threading import Lock
 
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
@@ -48,7 +50,7 @@ from pychron.dvc import (
 )
 from pychron.dvc.cache import DVCCache
 from pychron.dvc.defaults import TRIGA, HOLDER_24_SPOKES, LASER221, LASER65
-from pychron.dvc.dvc_analysis import DVCAnalysis
+from pychron.dvc.dvc_analysis import DVCAnalysis, prefetch_analysis
 from pychron.dvc.dvc_database import DVCDatabase
 from pychron.dvc.func import (
     find_interpreted_age_path,
@@ -116,6 +118,10 @@ class DVC(Loggable):
     use_cocktail_irradiation = Str
     use_cache = Bool
     max_cache_size = Int
+    max_cache_mb = Int
+    analysis_loading_threads = Int
+    sync_threads = Int(4)
+    sync_timeout = Int(120)
     irradiation_prefix = Str
 
     _cache = None
@@ -127,6 +133,7 @@ class DVC(Loggable):
         super(DVC, self).__init__(*args, **kw)
         self._uuid_runid_cache = {}
         self._pull_cache = {}
+        self._pull_cache_lock = Lock()
         if bind:
             self._bind_preferences()
 
@@ -237,7 +244,15 @@ class DVC(Loggable):
 
         return temps
 
-    def generate_currents(self):
+    def generate_currents(self, chunk_size=200):
+        """
+        backfill CurrentTbl for every analysis without current values.
+
+        analyses are processed in chunks of ``chunk_size``. each chunk is committed with a single
+        bulk insert. finished repositories are recorded in
+        ``paths.generate_currents_checkpoint`` so an interrupted backfill resumes where it
+        stopped. analyses already having currents are always skipped
+        """
         if not self.update_currents_enabled:
             self.information_dialog(
                 'You must enable "Current Values" in Preferences/DVC'
@@ -251,62 +266,33 @@ class DVC(Loggable):
             return
 
         self.info("Generate currents started")
-        # group by repository
-        db = self.db
-        db.create_session()
-        ocoa = db.commit_on_add
-        db.commit_on_add = False
+
+        checkpoint = paths.generate_currents_checkpoint
+        completed = []
+        if os.path.isfile(checkpoint):
+            with open(checkpoint, "r") as rfile:
+                completed = json.load(rfile).get("completed", [])
+            if completed:
+                self.info(
+                    "Resuming. Skipping {} completed repositories".format(
+                        len(completed)
+                    )
+                )
 
         def chunks(l, n):
             for i in range(0, len(l), n):
                 yield l[i : i + n]
 
-        def func(ai, prog, i, n):
-            if prog:
-                if not i % 10:
-                    prog.change_message(
-                        "Updating Currents {} {}/{}".format(ai.record_id, i, n)
-                    )
-                else:
-                    prog.increment()
-
-            ai.load_raw_data()
-            dban = db.get_analysis_uuid(ai.uuid)
-            if ai.analysis_type in ("unknown", "cocktail"):
-                try:
-                    self._update_current_age(ai, dban=dban, force=True)
-                except BaseException as e:
-                    self.warning(
-                        "Failed making current age for {}: {}".format(ai.record_id, e)
-                    )
-
-            if not ai.analysis_type.lower().startswith("blank"):
-                try:
-                    self._update_current_blanks(
-                        ai, dban=dban, force=True, update_age=False, commit=False
-                    )
-                except BaseException as e:
-                    self.warning(
-                        "Failed making current blanks for {}: {}".format(
-                            ai.record_id, e
-                        )
-                    )
-            try:
-                self._update_current(
-                    ai, dban=dban, force=True, update_age=False, commit=False
-                )
-            except BaseException as e:
-                self.warning(
-                    "Failed making intensities for {}: {}".format(ai.record_id, e)
-                )
-
-            # if not i % 100:
-            #     db.commit()
-            #     db.flush()
+        db = self.db
+        db.create_session()
+        ocoa = db.commit_on_add
+        db.commit_on_add = False
 
+        total_rows = 0
+        gst = time.time()
         with db.session_ctx():
             for repo in db.get_repositories():
-                if repo.name in (
+                if repo.name in completed or repo.name in (
                     "JIRSandbox",
                     "REEFenite",
                     "Henry01184",
@@ -324,37 +310,79 @@ class DVC(Loggable):
                         "Total repo analyses={}, filtered={}".format(tans, len(ans))
                     )
 
-                    if not ans:
-                        continue
-
-                    # if not self.confirmation_dialog('Updated currents for {}'.format(repo.name)):
-                    #     if self.confirmation_dialog('Stop update'):
-                    #         break
-                    #     else:
-                    #         continue
-
-                    for chunk in chunks(ans, 200):
-                        chunk = self.make_analyses(chunk)
-                        if chunk:
-                            progress_iterator(chunk, func)
+                    nrows = 0
+                    for i, chunk in enumerate(chunks(ans, chunk_size)):
+                        nrows += self._generate_currents_chunk(chunk)
                         db.commit()
-                        db.flush()
 
+                        et = time.time() - st
+                        self.info(
+                            "{} {}/{} rows={} {:0.1f} rows/s".format(
+                                repo.name,
+                                min((i + 1) * chunk_size, len(ans)),
+                                len(ans),
+                                nrows,
+                                nrows / et if et else 0,
+                            )
+                        )
+
+                    total_rows += nrows
                     self.info(
-                        "Elapsed time {}: n={}, "
-                        "{:0.2f} min".format(repo.name, len(ans), (time.time() - st))
-                        / 60.0
+                        "Elapsed time {}: n={}, rows={}, {:0.2f} min".format(
+                            repo.name, len(ans), nrows, (time.time() - st) / 60.0
+                        )
                     )
-                    db.commit()
-                    db.flush()
+
+                    completed.append(repo.name)
+                    with open(checkpoint, "w") as wfile:
+                        json.dump({"completed": completed}, wfile)
                 except BaseException as e:
+                    db.rollback()
                     self.warning(
                         "Failed making analyses for {}: {}".format(repo.name, e)
                     )
 
         db.commit_on_add = ocoa
         db.close_session()
-        self.info("Generate currents finished")
+
+        et = time.time() - gst
+        self.info(
+            "Generate currents finished. rows={} {:0.1f} rows/s".format(
+                total_rows, total_rows / et if et else 0
+            )
+        )
+        if os.path.isfile(checkpoint):
+            os.remove(checkpoint)
+
+    def build_raw_sidecars(self, repositories=None, force=False):
+        """
+        build (or rebuild if ``force``) the columnar raw data sidecars for every analysis in
+        ``repositories``. Defaults to all local repositories
+        """
+        from pychron.dvc.raw_sidecar import build_sidecar, iter_data_paths
+
+        if repositories is None:
+            repositories = self.get_local_repositories()
+
+        for repo in repositories:
+            self.info("Building raw data sidecars for {}".format(repo))
+            data_paths = list(iter_data_paths(repository_path(repo)))
+
+            def func(p, prog, i, n):
+                if prog:
+                    prog.change_message("Building sidecar {} {}/{}".format(repo, i, n))
+                try:
+                    return build_sidecar(p, force=force)
+                except BaseException as e:
+                    self.warning("Failed building sidecar for {}. {}".format(p, e))
+
+            st = time.time()
+            built = progress_loader(data_paths, func, threshold=100)
+            self.info(
+                "Built {} of {} sidecars for {} in {:0.2f}s".format(
+                    len(built), len(data_paths), repo, time.time() - st
+                )
+            )
 
     def convert_uuid_runids(self, uuids):
         with self.db.session_ctx():
@@ -745,7 +773,7 @@ class DVC(Loggable):
             self.info("Delete existing icfactors for {}".format(ai))
             ai.delete_icfactors(dets)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current_age(ai)
 
@@ -762,7 +790,7 @@ class DVC(Loggable):
                 )
 
         if self._cache:
-            self._cache.remove(ai.uiid)
+            self._cache.remove(ai.uuid)
         self._update_current_age(ai)
 
     def save_blanks(self, ai, keys, refs):
@@ -770,7 +798,7 @@ class DVC(Loggable):
             self.info("Saving blanks for {}".format(ai))
             ai.dump_blanks(keys, refs, reviewed=True)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current_blanks(ai, keys)
 
@@ -778,7 +806,7 @@ class DVC(Loggable):
         if keys:
             self.info("Saving equilibration for {}".format(ai))
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current(ai, keys)
             return ai.dump_equilibration(keys, reviewed=True)
@@ -788,7 +816,7 @@ class DVC(Loggable):
             self.info("Saving fits for {}".format(ai))
             ai.dump_fits(keys, reviewed=True)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current(ai, keys)
 
@@ -1057,7 +1085,9 @@ class DVC(Loggable):
 
         exps = {r.repository_identifier for r in records}
 
-        if use_progress:
+        if self.sync_threads > 1 and len(exps) > 1:
+            self.sync_repos(exps, pull_frequency=pull_frequency)
+        elif use_progress:
             progress_iterator(exps, func, threshold=1)
         else:
             for ei in exps:
@@ -1082,6 +1112,7 @@ class DVC(Loggable):
                 ps = get_frozen_productions(exp)
                 frozen_productions.update(ps)
 
+            levels = set()
             for r in records:
                 # get sample notes
 
@@ -1097,33 +1128,7 @@ class DVC(Loggable):
                             r.repository_identifier, r.irradiation
                         )
 
-                    level = r.irradiation_level
-                    if irrad in fluxes:
-                        flux_levels = fluxes[irrad]
-                        prod_levels = productions[irrad]
-                    else:
-                        flux_levels = {}
-                        prod_levels = {}
-
-                    if level not in flux_levels:
-                        flux_levels[level] = meta_repo.get_flux_positions(irrad, level)
-                        prod_levels[level] = meta_repo.get_production(irrad, level)
-
-                    if irrad not in chronos:
-                        chronos[irrad] = meta_repo.get_chronology(irrad)
-
-                    if irrad not in fluxes:
-                        fluxes[irrad] = flux_levels
-                        productions[irrad] = prod_levels
-
-                    key = "{}{}".format(irrad, level)
-                    if key not in flux_histories:
-                        c = meta_repo.get_flux_history(irrad, level, max_count=1)
-                        v = None
-                        if c:
-                            c = c[0]
-                            v = "{} ({})".format(c.date.strftime(DATE_FORMAT), c.author)
-                        flux_histories[key] = v
+                    levels.add((irrad, r.irradiation_level))
 
                 if (
                     use_cocktail_irradiation
@@ -1134,10 +1139,22 @@ class DVC(Loggable):
                     chronos["cocktail"] = cirr.get("chronology")
                     fluxes["cocktail"] = cirr.get("flux")
 
+            (
+                lfluxes,
+                productions,
+                lchronos,
+                flux_histories,
+            ) = meta_repo.get_irradiation_info(levels)
+            fluxes.update(lfluxes)
+            chronos.update(lchronos)
+
             sens = meta_repo.get_sensitivities()
 
+        prefetched = self._prefetch_analyses(records, reload)
+
         def func(*args):
             try:
+                record = args[0]
                 return self._make_record(
                     branches=branches,
                     chronos=chronos,
@@ -1151,6 +1168,7 @@ class DVC(Loggable):
                     sample_prep=sample_prep,
                     quick=quick,
                     reload=reload,
+                    prefetched=prefetched.get(id(record)),
                     *args
                 )
             except BaseException:
@@ -1162,10 +1180,14 @@ class DVC(Loggable):
                 )
                 self.debug_exception()
 
-        if use_progress:
-            ret = progress_loader(records, func, threshold=1, step=25)
-        else:
-            ret = [func(r, None, 0, 0) for r in records]
+        try:
+            if use_progress:
+                ret = progress_loader(records, func, threshold=1, step=25)
+            else:
+                ret = [func(r, None, 0, 0) for r in records]
+        finally:
+            for f in prefetched.values():
+                f.cancel()
 
         et = time.time() - st
 
@@ -1299,7 +1321,123 @@ class DVC(Loggable):
         return GitSessionCTX(self, repository_identifier, message)
 
     def clear_pull_cache(self):
-        self._pull_cache = {}
+        with self._pull_cache_lock:
+            self._pull_cache = {}
+
+    def sync_repos(self, names, pull_frequency=None, nthreads=None, timeout=None):
+        """
+        pull or clone several repositories.
+
+        existing repositories are fetched concurrently by up to ``nthreads`` threads. each fetch
+        is killed after ``timeout`` seconds. merging, which may ask the user to accept the
+        changes, and cloning missing repositories are done on the calling thread
+
+        :return: list of repositories that failed to sync
+        """
+        if nthreads is None:
+            nthreads = self.sync_threads
+        if timeout is None:
+            timeout = self.sync_timeout
+
+        names = sorted(set(names))
+        st = time.time()
+
+        if nthreads < 2 or len(names) < 2:
+            failed = {}
+            for name in names:
+                try:
+                    if not self.sync_repo(
+                        name, use_progress=False, pull_frequency=pull_frequency
+                    ):
+                        failed[name] = "sync failed"
+                except BaseException as e:
+                    failed[name] = str(e)
+        else:
+            failed = self._sync_repos_concurrent(
+                names, pull_frequency, nthreads, timeout
+            )
+
+        self.info(
+            "synced {}/{} repositories in {:0.2f}s".format(
+                len(names) - len(failed), len(names), time.time() - st
+            )
+        )
+        for name, msg in failed.items():
+            self.warning("failed to sync {}: {}".format(name, msg))
+
+        return list(failed)
+
+    def _sync_repos_concurrent(self, names, pull_frequency, nthreads, timeout):
+        missing, pending = [], []
+        for name in names:
+            if not os.path.isdir(os.path.join(repository_path(name), ".git")):
+                missing.append(name)
+            elif not self._recently_pulled(name, pull_frequency):
+                pending.append(name)
+
+        failed = {}
+        repos = []
+        if pending:
+            self.debug(
+                "fetching {} repositories using {} threads".format(
+                    len(pending), nthreads
+                )
+            )
+            with ThreadPoolExecutor(max_workers=nthreads) as executor:
+                futures = {
+                    executor.submit(self._fetch_repository, name, timeout): name
+                    for name in pending
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        repos.append(future.result())
+                    except BaseException as e:
+                        failed[name] = str(e).strip()
+                        # do not skip this repository the next time it is synced
+                        with self._pull_cache_lock:
+                            self._pull_cache.pop(name, None)
+
+        for repo in sorted(repos, key=lambda r: r.path):
+            try:
+                repo.pull(
+                    use_progress=False, use_auto_pull=self.use_auto_pull, fetch=False
+                )
+            except BaseException as e:
+                failed[os.path.basename(repo.path)] = str(e)
+
+        for name in missing:
+            try:
+                if not self.sync_repo(name, use_progress=False):
+                    failed[name] = "clone failed"
+            except BaseException as e:
+                failed[name] = str(e)
+
+        return failed
+
+    def _fetch_repository(self, name, timeout):
+        repo = self._get_repository(name, as_current=False)
+        repo.fetch(timeout=timeout, handled=False)
+        return repo
+
+    def _recently_pulled(self, name, pull_frequency):
+        """
+        True if ``name`` was pulled within the last ``pull_frequency`` seconds. otherwise
+        record now as the last pull
+        """
+        if not pull_frequency:
+            return False
+
+        now = datetime.now()
+        with self._pull_cache_lock:
+            last_pull = self._pull_cache.get(name)
+            if last_pull and (now - last_pull).total_seconds() < pull_frequency:
+                self.debug(
+                    "skipping sync {}. last pull={}".format(name, last_pull.isoformat())
+                )
+                return True
+
+            self._pull_cache[name] = now
 
     def sync_repo(self, name, use_progress=True, pull_frequency=None):
         """
@@ -1315,20 +1453,8 @@ class DVC(Loggable):
         )
 
         if exists:
-            if pull_frequency:
-                now = datetime.now()
-                last_pull = self._pull_cache.get(name)
-                self._pull_cache[name] = now
-                args = (
-                    last_pull,
-                    (datetime.now() - last_pull).seconds,
-                    (datetime.now() - last_pull).seconds < pull_frequency,
-                )
-
-                self.debug(" ".join([str(a) for a in args]))
-
-                if last_pull and (datetime.now() - last_pull).seconds < pull_frequency:
-                    return True
+            if self._recently_pulled(name, pull_frequency):
+                return True
 
             repo = self._get_repository(name)
             repo.pull(use_progress=use_progress, use_auto_pull=self.use_auto_pull)
@@ -1465,14 +1591,15 @@ class DVC(Loggable):
         self.meta_repo.add_unstaged(paths.meta_root, add_all=True)
 
     def meta_commit(self, msg):
-        changes = self.meta_repo.has_staged()
-        if changes:
-            self.debug("meta repo has changes: {}".format(changes))
-            self.meta_repo.report_local_changes()
-            self.meta_repo.commit(msg)
-            self.meta_repo.clear_cache = True
-        else:
-            self.debug("no changes to meta repo")
+        with self.meta_repo.index_lock:
+            changes = self.meta_repo.has_staged()
+            if changes:
+                self.debug("meta repo has changes: {}".format(changes))
+                self.meta_repo.report_local_changes()
+                self.meta_repo.commit(msg)
+                self.meta_repo.clear_cache = True
+            else:
+                self.debug("no changes to meta repo")
 
     def add_production(self, irrad, name, prod):
         self.meta_repo.add_production_to_irradiation(irrad, name, prod)
@@ -1839,9 +1966,127 @@ class DVC(Loggable):
 
     def clear_cache(self):
         if self.use_cache:
+            r = self.report_cache()
             self._cache.clear()
+            self._cache.reset_stats()
+            return r
+
+    def report_cache(self):
+        if self._cache:
+            r = self._cache.report()
+            self.info(
+                "Cache size={size} nbytes={nbytes} hits={hits} misses={misses} "
+                "evictions={evictions} expirations={expirations} "
+                "hit_rate={hit_rate:0.2f}".format(**r)
+            )
+            return r
 
     # private
+    def _generate_currents_chunk(self, records):
+        """
+        :param records: list of AnalysisTbl
+        :return: number of CurrentTbl rows added
+        """
+        db = self.db
+        dbans = {r.uuid: r for r in records}
+        n = 0
+        for ai in self.make_analyses(records):
+            ai.load_raw_data()
+            n += db.add_currents(dbans[ai.uuid], self._get_current_values(ai))
+        return n
+
+    def _get_current_values(self, ai):
+        """
+        all the current values for an analysis. the same values are saved one by one by
+        _update_current, _update_current_blanks and _update_current_age
+
+        :return: list of (parameter, value, error, units)
+        """
+        values = []
+        if ai.analysis_type in ("unknown", "cocktail"):
+            try:
+                values.extend(self._current_age_values(ai))
+            except BaseException as e:
+                self.warning(
+                    "Failed making current age for {}: {}".format(ai.record_id, e)
+                )
+
+        if not ai.analysis_type.lower().startswith("blank"):
+            try:
+                values.extend(self._current_blank_values(ai))
+            except BaseException as e:
+                self.warning(
+                    "Failed making current blanks for {}: {}".format(ai.record_id, e)
+                )
+
+        try:
+            values.extend(self._current_intensity_values(ai))
+        except BaseException as e:
+            self.warning(
+                "Failed making intensities for {}: {}".format(ai.record_id, e)
+            )
+
+        return values
+
+    def _current_age_values(self, ai):
+        age_units = ai.arar_constants.age_units
+        return [
+            ("age", ai.age, ai.age_err, age_units),
+            ("age_wo_j_error", ai.age, ai.age_err_wo_j, age_units),
+        ]
+
+    def _current_blank_values(self, ai, keys=None):
+        if keys is None:
+            keys = ai.isotope_keys
+
+        values = []
+        for k in keys:
+            iso = ai.get_isotope(k)
+            if iso:
+                blank = iso.blank
+                values.append(
+                    ("{}_blank".format(k), blank.value, blank.error, blank.units)
+                )
+        return values
+
+    def _current_intensity_values(self, ai, keys=None):
+        """
+        ``keys`` are isotope keys or detector names. the baseline values are used for
+        detectors. defaults to all isotopes and their detectors
+        """
+        if keys is None:
+            keys = list(ai.isotope_keys)
+            for iso in ai.iter_isotopes():
+                if iso.detector not in keys:
+                    keys.append(iso.detector)
+
+        values = []
+        for k in keys:
+            iso = ai.get_isotope(k)
+            if iso is None:
+                bs = ai.get_isotope(detector=k).baseline
+                values.append(("{}_baseline".format(k), bs.value, bs.error, bs.units))
+                values.append(("{}_baseline_n".format(k), bs.n, None, "int"))
+            else:
+                values.append(("{}_n".format(k), iso.n, None, "int"))
+                values.append(
+                    ("{}_intercept".format(k), iso.value, iso.error, iso.units)
+                )
+                for fmt, v in (
+                    ("{}_ic_corrected", iso.get_ic_corrected_value()),
+                    ("{}_bs_corrected", iso.get_baseline_corrected_value()),
+                    ("{}", iso.get_non_detector_corrected_value()),
+                ):
+                    values.append(
+                        (fmt.format(k), nominal_value(v), std_dev(v), iso.units)
+                    )
+        return values
+
+    def _update_current_values(self, dban, values, force=False):
+        db = self.db
+        for parameter, value, error, units in values:
+            db.update_current(dban, parameter, value, error, units, force=force)
+
     def _update_current_blanks(
         self, ai, keys=None, dban=None, force=False, update_age=True, commit=True
     ):
@@ -1849,22 +2094,11 @@ class DVC(Loggable):
             db = self.db
             if dban is None:
                 dban = db.get_analysis_uuid(ai.uuid)
-            if keys is None:
-                keys = ai.isotope_keys
 
             if dban:
-                for k in keys:
-                    iso = ai.get_isotope(k)
-                    if iso:
-                        iso = iso.blank
-                        db.update_current(
-                            dban,
-                            "{}_blank".format(k),
-                            iso.value,
-                            iso.error,
-                            iso.units,
-                            force=force,
-                        )
+                self._update_current_values(
+                    dban, self._current_blank_values(ai, keys), force=force
+                )
                 if update_age:
                     self._update_current_age(ai, dban, force=force)
                 if commit:
@@ -1882,17 +2116,8 @@ class DVC(Loggable):
                 dban = db.get_analysis_uuid(ai.uuid)
 
             if dban:
-                age_units = ai.arar_constants.age_units
-                self.db.update_current(
-                    dban, "age", ai.age, ai.age_err, age_units, force=force
-                )
-                self.db.update_current(
-                    dban,
-                    "age_wo_j_error",
-                    ai.age,
-                    ai.age_err_wo_j,
-                    age_units,
-                    force=force,
+                self._update_current_values(
+                    dban, self._current_age_values(ai), force=force
                 )
 
     def _update_current(
@@ -1904,73 +2129,9 @@ class DVC(Loggable):
                 dban = db.get_analysis_uuid(ai.uuid)
 
             if dban:
-                if keys is None:
-                    keys = ai.isotope_keys
-                    keys += [iso.detector for iso in ai.iter_isotopes()]
-
-                for k in keys:
-                    iso = ai.get_isotope(k)
-                    if iso is None:
-                        iso = ai.get_isotope(detector=k)
-                        bs = iso.baseline
-                        db.update_current(
-                            dban,
-                            "{}_baseline".format(k),
-                            bs.value,
-                            bs.error,
-                            bs.units,
-                            force=force,
-                        )
-                        db.update_current(
-                            dban,
-                            "{}_baseline_n".format(k),
-                            bs.n,
-                            None,
-                            "int",
-                            force=force,
-                        )
-                    else:
-                        db.update_current(
-                            dban, "{}_n".format(k), iso.n, None, "int", force=force
-                        )
-                        db.update_current(
-                            dban,
-                            "{}_intercept".format(k),
-                            iso.value,
-                            iso.error,
-                            iso.units,
-                            force=force,
-                        )
-
-                        v = iso.get_ic_corrected_value()
-                        db.update_current(
-                            dban,
-                            "{}_ic_corrected".format(k),
-                            nominal_value(v),
-                            std_dev(v),
-                            iso.units,
-                            force=force,
-                        )
-
-                        v = iso.get_baseline_corrected_value()
-                        db.update_current(
-                            dban,
-                            "{}_bs_corrected".format(k),
-                            nominal_value(v),
-                            std_dev(v),
-                            iso.units,
-                            force=force,
-                        )
-
-                        v = iso.get_non_detector_corrected_value()
-                        db.update_current(
-                            dban,
-                            k,
-                            nominal_value(v),
-                            std_dev(v),
-                            iso.units,
-                            force=force,
-                        )
+                self._update_current_values(
+                    dban, self._current_intensity_values(ai, keys), force=force
+                )
                 if update_age:
                     self._update_current_age(ai, dban, force=force)
                 if commit:
@@ -2051,6 +2212,37 @@ class DVC(Loggable):
             prog.change_message("Loading repository {}. {}/{}".format(expid, i, n))
         self.sync_repo(expid)
 
+    def _prefetch_analyses(self, records, reload=False):
+        """
+        read and parse each analysis' json files on a thread pool. returns a dict of futures
+        keyed by id(record). Analyses are still constructed on the calling thread, in order,
+        so only file I/O and json parsing happen concurrently.
+        """
+        nthreads = self.analysis_loading_threads
+        if nthreads < 2:
+            return {}
+
+        records = [
+            r
+            for r in records
+            if r.repository_identifier and (reload or not isinstance(r, DVCAnalysis))
+        ]
+        if len(records) < 2:
+            return {}
+
+        self.debug(
+            "prefetching {} analyses using {} threads".format(len(records), nthreads)
+        )
+        executor = ThreadPoolExecutor(max_workers=nthreads)
+        futures = {
+            id(r): executor.submit(
+                prefetch_analysis, r.uuid, r.record_id, r.repository_identifier
+            )
+            for r in records
+        }
+        executor.shutdown(wait=False)
+        return futures
+
     def _make_record(
         self,
         record,
@@ -2069,6 +2261,7 @@ class DVC(Loggable):
         calculate_f_only=False,
         reload=False,
         quick=False,
+        prefetched=None,
     ):
         meta_repo = self.meta_repo
         if prog:
@@ -2103,8 +2296,18 @@ class DVC(Loggable):
             rid = record.record_id
             uuid = record.uuid
 
+            if prefetched is not None:
+                try:
+                    prefetched = prefetched.result()
+                except BaseException as e:
+                    self.debug("prefetch failed for {}. {}".format(rid, e))
+                    prefetched = None
+
+                if expid != record.repository_identifier:
+                    prefetched = None
+
             try:
-                a = DVCAnalysis(uuid, rid, expid)
+                a = DVCAnalysis(uuid, rid, expid, prefetched=prefetched)
             except AnalysisNotAnvailableError:
                 self.warning_dialog(
                     "Analysis {} not in local repository {}. "
@@ -2278,9 +2481,17 @@ class DVC(Loggable):
         )
         bind_preference(self, "use_cache", "{}.use_cache".format(prefid))
         bind_preference(self, "max_cache_size", "{}.max_cache_size".format(prefid))
+        bind_preference(self, "max_cache_mb", "{}.max_cache_mb".format(prefid))
+        bind_preference(
+            self,
+            "analysis_loading_threads",
+            "{}.analysis_loading_threads".format(prefid),
+        )
         bind_preference(
             self, "update_currents_enabled", "{}.update_currents_enabled".format(prefid)
         )
+        bind_preference(self, "sync_threads", "{}.sync_threads".format(prefid))
+        bind_preference(self, "sync_timeout", "{}.sync_timeout".format(prefid))
         bind_preference(self, "use_auto_pull", "{}.use_auto_pull".format(prefid))
         bind_preference(self, "use_auto_push", "{}.use_auto_push".format(prefid))
         bind_preference(
@@ -2305,9 +2516,15 @@ class DVC(Loggable):
         else:
             self.use_cache = False
 
+    def _max_cache_mb_changed(self, new):
+        if self._cache:
+            self._cache.max_bytes = new * 1024**2
+
     def _use_cache_changed(self):
         if self.use_cache:
-            self._cache = DVCCache(max_size=self.max_cache_size)
+            self._cache = DVCCache(
+                max_size=self.max_cache_size, max_bytes=self.max_cache_mb * 1024**2
+            )
         else:
             self._cache = None
 
@@ -47,6 +47,7 @@ from pychron.dvc import (
     repository_path,
     AnalysisNotAnvailableError,
 )
+from pychron.dvc.raw_sidecar import load_raw as load_raw_sidecar
 from pychron.experiment.utilities.environmentals import set_environmentals
 from pychron.experiment.utilities.runid import make_aliquot_step, make_step
 from pychron.processing.analyses.analysis import Analysis
@@ -85,31 +86,85 @@ class TIsotope:
         return ufloat((1, 0.5))
 
 
+def extraction_path(path):
+    root = os.path.dirname(path)
+    bname = os.path.basename(path)
+    head, ext = os.path.splitext(bname)
+    return os.path.join(root, "extraction", "{}.extr{}".format(head, ext))
+
+
+def load_json(path):
+    """
+    return the contents of path or None if path does not exist
+    """
+    if path and os.path.isfile(path):
+        return dvc_load(path)
+
+
+LOAD_MODIFIERS = (
+    INTERCEPTS,
+    BASELINES,
+    BLANKS,
+    ICFACTORS,
+    PEAKCENTER,
+    COSMOGENIC,
+)
+
+
+def prefetch_analysis(uuid, record_id, repository_identifier):
+    """
+    resolve and parse all the json files DVCAnalysis reads when it is constructed.
+
+    safe to call from a worker thread. The result is passed to DVCAnalysis(prefetched=...)
+    """
+    path = analysis_path((uuid, record_id), repository_identifier)
+    paths = {None: path}
+    jsons = {}
+    if path:
+        ep = extraction_path(path)
+        for p in (ep, path):
+            jsons[p] = load_json(p)
+
+        modifiers = LOAD_MODIFIERS
+        if USE_GIT_TAGGING:
+            modifiers += ("tags",)
+
+        for modifier in modifiers:
+            mp = analysis_path((uuid, record_id), repository_identifier, modifier=modifier)
+            paths[modifier] = mp
+            if mp:
+                jsons[mp] = load_json(mp)
+
+    return {"paths": paths, "jsons": jsons}
+
+
 class DVCAnalysis(Analysis):
     production_obj = None
     chronology_obj = None
     use_repository_suffix = False
 
-    def __init__(self, uuid, record_id, repository_identifier, *args, **kw):
+    _prefetched = None
+
+    def __init__(
+        self, uuid, record_id, repository_identifier, prefetched=None, *args, **kw
+    ):
         super(DVCAnalysis, self).__init__(*args, **kw)
         self.record_id = record_id
-        path = analysis_path((uuid, record_id), repository_identifier)
+        self._prefetched = prefetched
+        if prefetched:
+            path = prefetched["paths"].get(None)
+        else:
+            path = analysis_path((uuid, record_id), repository_identifier)
         self.repository_identifier = repository_identifier
         self.rundate = datetime.datetime.now()
 
         if path is None:
             raise AnalysisNotAnvailableError(repository_identifier, record_id)
 
-        root = os.path.dirname(path)
-        bname = os.path.basename(path)
-        head, ext = os.path.splitext(bname)
-
-        ep = os.path.join(root, "extraction", "{}.extr{}".format(head, ext))
-        if os.path.isfile(ep):
-            jd = dvc_load(ep)
-
+        ep = extraction_path(path)
+        jd = self._load_json(ep)
+        if jd is not None:
             self.load_extraction(jd)
-
         else:
             self.warning(
                 'Invalid analysis. RunID="{}". No extraction file {}'.format(
@@ -117,8 +172,8 @@ class DVCAnalysis(Analysis):
                 )
             )
 
-        if os.path.isfile(path):
-            jd = dvc_load(path)
+        jd = self._load_json(path)
+        if jd is not None:
             self.load_spectrometer_parameters(jd.get("spec_sha"))
             self.load_environmentals(jd.get("environmental"))
 
@@ -130,6 +185,18 @@ class DVCAnalysis(Analysis):
 
         self.load_paths()
 
+        # prefetched data is only valid for the initial load
+        self._prefetched = None
+
+    def _load_json(self, path):
+        if self._prefetched:
+            try:
+                return self._prefetched["jsons"][path]
+            except KeyError:
+                pass
+
+        return load_json(path)
+
     @property
     def irradiation_position_position(self):
         return self.irradiation_position
@@ -221,23 +288,19 @@ class DVCAnalysis(Analysis):
 
     def load_paths(self, modifiers=None):
         if modifiers is None:
-            modifiers = (
-                INTERCEPTS,
-                BASELINES,
-                BLANKS,
-                ICFACTORS,
-                PEAKCENTER,
-                COSMOGENIC,
-            )
+            modifiers = LOAD_MODIFIERS
 
         if USE_GIT_TAGGING:
             modifiers += ("tags",)
 
         for modifier in modifiers:
-            path = self._analysis_path(modifier=modifier)
+            if self._prefetched and modifier in self._prefetched["paths"]:
+                path = self._prefetched["paths"][modifier]
+            else:
+                path = self._analysis_path(modifier=modifier)
             if path:
-                if os.path.isfile(path):
-                    jd = dvc_load(path)
+                jd = self._load_json(path)
+                if jd is not None:
                     if jd:
                         func = getattr(self, "_load_{}".format(modifier))
                         try:
@@ -276,7 +339,10 @@ class DVCAnalysis(Analysis):
     def load_raw_data(self, keys=None, n_only=False, use_name_pairs=True):
         path = self._analysis_path(modifier=".data")
 
-        jd = dvc_load(path)
+        # use the columnar sidecar if one has been built, otherwise decode the json blobs
+        jd = load_raw_sidecar(path)
+        if jd is None:
+            jd = dvc_load(path)
 
         signals = jd.get("signals", [])
         baselines = jd.get("baselines", [])
@@ -300,16 +366,12 @@ class DVCAnalysis(Analysis):
             if not iso:
                 continue
 
-            blob = sd.get("blob")
-            if blob:
-                iso.unpack_data(format_blob(blob), n_only)
+            self._set_raw_data(iso, sd, n_only)
 
             # det = sd['detector']
             bd = next((b for b in baselines if b.get("detector") == det), None)
             if bd:
-                blob = bd.get("blob")
-                if blob:
-                    iso.baseline.unpack_data(format_blob(blob), n_only)
+                self._set_raw_data(iso.baseline, bd, n_only)
 
         # loop thru keys to make sure none were missed this can happen when only loading baseline
         if keys:
@@ -318,9 +380,7 @@ class DVCAnalysis(Analysis):
                 if bd:
                     for iso in self.itervalues():
                         if iso.detector == k:
-                            blob = bd.get("blob")
-                            if blob:
-                                iso.baseline.unpack_data(format_blob(blob), n_only)
+                            self._set_raw_data(iso.baseline, bd, n_only)
 
         for sn in sniffs:
             isok = sn.get("isotope")
@@ -335,14 +395,17 @@ class DVCAnalysis(Analysis):
             if keys and key not in keys and isok not in keys:
                 continue
 
-            data = None
-            blob = sn.get("blob")
-            if blob:
-                data = format_blob(blob)
-
             for iso in self.itervalues():
                 if iso.detector == det:
-                    iso.sniff.unpack_data(data, n_only)
+                    self._set_raw_data(iso.sniff, sn, n_only)
+
+    def _set_raw_data(self, measurement, item, n_only):
+        if "xs" in item:
+            measurement.set_unpacked_data(item["xs"], item["ys"], n_only)
+        else:
+            blob = item.get("blob")
+            if blob:
+                measurement.unpack_data(format_blob(blob), n_only)
 
     def set_production(self, prod, r):
         self.production_obj = r
@@ -16,8 +16,10 @@
 import sys
 from datetime import timedelta, datetime
 from string import digits, ascii_letters
+from threading import Lock
 
-from sqlalchemy import not_, func, distinct, or_, and_
+from sqlalchemy import not_, func, distinct, or_, and_, event
+from sqlalchemy.orm import joinedload, lazyload, selectinload
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.sql.functions import count
 from sqlalchemy.util import OrderedSet
@@ -77,6 +79,44 @@ from pychron.pychron_constants import (
 )
 
 
+# process wide name -> id cache for lookup tables, e.g. ParameterTbl and UnitsTbl.
+# keyed by (url, tablename). rows in these tables are never renamed or deleted. only
+# committed rows are cached. rows resolved by a session with uncommitted writes are held in
+# session.info until the session commits and dropped if it rolls back
+_NAME_ID_CACHE = {}
+_NAME_ID_LOCK = Lock()
+
+
+def clear_name_id_cache():
+    with _NAME_ID_LOCK:
+        _NAME_ID_CACHE.clear()
+
+
+def _name_id_after_flush(sess, flush_context):
+    sess.info["name_id_dirty"] = True
+
+
+def _name_id_after_commit(sess):
+    pending = sess.info.pop("name_id_pending", None)
+    sess.info.pop("name_id_dirty", None)
+    if pending:
+        with _NAME_ID_LOCK:
+            for key, names in pending.items():
+                _NAME_ID_CACHE.setdefault(key, {}).update(names)
+
+
+def _name_id_after_rollback(sess):
+    sess.info.pop("name_id_pending", None)
+    sess.info.pop("name_id_dirty", None)
+
+
+def _watch_name_id_session(sess):
+    if not event.contains(sess, "after_commit", _name_id_after_commit):
+        event.listen(sess, "after_flush", _name_id_after_flush)
+        event.listen(sess, "after_commit", _name_id_after_commit)
+        event.listen(sess, "after_rollback", _name_id_after_rollback)
+
+
 def listify(obj):
     if obj:
         if not isinstance(obj, (tuple, list)):
@@ -233,6 +273,46 @@ def extract_devices_query(analysis_types, extract_devices, q):
     return q
 
 
+def analysis_keyset(q, order="asc", after=None):
+    """
+    order analyses by (timestamp, id). if ``after``, a (timestamp, id) key, is given only the
+    analyses following it are returned. id breaks timestamp ties so consecutive pages never
+    overlap or skip an analysis
+    """
+    ts, aid = AnalysisTbl.timestamp, AnalysisTbl.id
+    if after:
+        t, i = after
+        if order == "desc":
+            q = q.filter(or_(ts < t, and_(ts == t, aid < i)))
+        else:
+            q = q.filter(or_(ts > t, and_(ts == t, aid > i)))
+
+    return q.order_by(getattr(ts, order)(), getattr(aid, order)())
+
+
+def bind_options(q):
+    """
+    load everything AnalysisTbl.bind uses with the analyses. one query per relationship
+    instead of one per analysis. the positions of samples and levels, and the levels of
+    irradiations, are not needed to bind and are not loaded
+    """
+    ip = joinedload(AnalysisTbl.irradiation_position)
+    level = ip.selectinload(IrradiationPositionTbl.level)
+    sample = ip.selectinload(IrradiationPositionTbl.sample)
+    project = sample.selectinload(SampleTbl.project)
+    irradiation = level.selectinload(LevelTbl.irradiation)
+    return q.options(
+        level.lazyload(LevelTbl.positions),
+        irradiation.lazyload(IrradiationTbl.levels),
+        sample.lazyload(SampleTbl.positions),
+        sample.selectinload(SampleTbl.material),
+        project.selectinload(ProjectTbl.principal_investigator),
+        selectinload(AnalysisTbl.measured_positions).selectinload(
+            MeasuredPositionTbl.load
+        ),
+    )
+
+
 class DVCDatabase(DatabaseAdapter):
     """
     mysql2sqlite
@@ -607,6 +687,55 @@ class DVCDatabase(DatabaseAdapter):
             self._add_item(units)
         return units
 
+    def resolve_parameters(self, names):
+        """
+        :param names: iterable of parameter names
+        :return: dict of name: ParameterTbl.id. missing parameters are added
+        """
+        return self._resolve_names(ParameterTbl, names)
+
+    def resolve_units(self, names):
+        """
+        :param names: iterable of units names
+        :return: dict of name: UnitsTbl.id. missing units are added
+        """
+        return self._resolve_names(UnitsTbl, names)
+
+    def add_currents(self, analysis, currents):
+        """
+        add many CurrentTbl rows for ``analysis`` with a single insert
+
+        :param analysis: AnalysisTbl
+        :param currents: list of (parameter name, value, error, units name) tuples. error and
+            units may be None
+        :return: number of rows added
+        """
+        if not currents:
+            return 0
+
+        with self.session_ctx() as sess:
+            if analysis.id is None:
+                sess.flush()
+
+            pids = self.resolve_parameters(c[0] for c in currents)
+            uids = self.resolve_units(c[3] for c in currents)
+
+            rows = [
+                {
+                    "analysisID": analysis.id,
+                    "parameterID": pids[p],
+                    "unitsID": uids.get(u),
+                    "value": float(v),
+                    "error": None if e is None else float(e),
+                }
+                for p, v, e, u in currents
+            ]
+            sess.execute(CurrentTbl.__table__.insert(), rows)
+            if not self.autocommit and self.commit_on_add:
+                sess.commit()
+
+            return len(rows)
+
     def add_current(self, analysis, value, error, parameter, units):
         with self.session_ctx():
             c = CurrentTbl()
@@ -1531,8 +1660,15 @@ class DVCDatabase(DatabaseAdapter):
         loads=None,
         order="asc",
         limit=None,
+        after=None,
+        bind=False,
         verbose_query=True,
     ):
+        """
+        :param after: (timestamp, id) of the last analysis of the previous page.
+            see analysis_keyset
+        :param bind: eager load the relationships used by AnalysisTbl.bind
+        """
 
         with self.session_ctx() as sess:
             q = sess.query(AnalysisTbl)
@@ -1566,12 +1702,14 @@ class DVCDatabase(DatabaseAdapter):
                 q = q.filter(AnalysisChangeTbl.tag != omit_key)
 
             if order:
-                q = q.order_by(getattr(AnalysisTbl.timestamp, order)())
+                q = analysis_keyset(q, order, after)
 
             if limit:
                 q = q.limit(limit)
 
             tc = q.count()
+            if bind:
+                q = bind_options(q)
             return self._query_all(q, verbose_query=verbose_query), tc
 
     def get_repository_date_range(self, names):
@@ -1606,6 +1744,8 @@ class DVCDatabase(DatabaseAdapter):
         exclude=None,
         exclude_uuids=None,
         exclude_invalid=True,
+        after=None,
+        bind=False,
         verbose=True,
     ):
         if verbose:
@@ -1658,9 +1798,11 @@ class DVCDatabase(DatabaseAdapter):
                 q = q.filter(not_(AnalysisTbl.id.in_(exclude)))
             if exclude_uuids:
                 q = q.filter(not_(AnalysisTbl.uuid.in_(exclude_uuids)))
-            q = q.order_by(getattr(AnalysisTbl.timestamp, order)())
+            q = analysis_keyset(q, order, after)
             if limit:
                 q = q.limit(limit)
+            if bind:
+                q = bind_options(q)
 
             return self._query_all(q, verbose_query=verbose)
 
@@ -1853,6 +1995,48 @@ class DVCDatabase(DatabaseAdapter):
                     q = q.filter(IrradiationPositionTbl.id.in_(ids))
                     return self._query_all(q, verbose_query=False)
 
+    def get_labnumber_record_rows(self, ids, chunk=500):
+        """
+        flat rows of the irradiation positions ``ids`` for the browser's sample table.
+        positions are joined to their level, irradiation, sample, material and project, no
+        relationships are loaded.
+
+        :return: list of (id, identifier, position, packet, level, irradiation, sample,
+            material, project, lat, lon, elevation, lithology, location, igsn)
+        """
+        ret = []
+        with self.session_ctx() as sess:
+            for i in range(0, len(ids), chunk):
+                q = sess.query(
+                    IrradiationPositionTbl.id,
+                    IrradiationPositionTbl.identifier,
+                    IrradiationPositionTbl.position,
+                    IrradiationPositionTbl.packet,
+                    LevelTbl.name,
+                    IrradiationTbl.name,
+                    SampleTbl.name,
+                    MaterialTbl.name,
+                    ProjectTbl.name,
+                    SampleTbl.lat,
+                    SampleTbl.lon,
+                    SampleTbl.elevation,
+                    SampleTbl.lithology,
+                    SampleTbl.location,
+                    SampleTbl.igsn,
+                )
+                q = q.outerjoin(LevelTbl, IrradiationPositionTbl.levelID == LevelTbl.id)
+                q = q.outerjoin(
+                    IrradiationTbl, LevelTbl.irradiationID == IrradiationTbl.id
+                )
+                q = q.outerjoin(
+                    SampleTbl, IrradiationPositionTbl.sampleID == SampleTbl.id
+                )
+                q = q.outerjoin(MaterialTbl, SampleTbl.materialID == MaterialTbl.id)
+                q = q.outerjoin(ProjectTbl, SampleTbl.projectID == ProjectTbl.id)
+                q = q.filter(IrradiationPositionTbl.id.in_(ids[i : i + chunk]))
+                ret.extend(self._query_all(q))
+        return ret
+
     def get_analysis_groups(self, project_ids, **kw):
         ret = []
         if project_ids:
@@ -2574,6 +2758,51 @@ class DVCDatabase(DatabaseAdapter):
             c.units = units
 
     # private
+    def _resolve_names(self, table, names):
+        names = {n for n in names if n}
+        if not names:
+            return {}
+
+        with _NAME_ID_LOCK:
+            cache = _NAME_ID_CACHE.setdefault((self.url, table.__tablename__), {})
+            ret = {n: cache[n] for n in names if n in cache}
+
+        missing = names.difference(ret)
+        if missing:
+            key = (self.url, table.__tablename__)
+            with self.session_ctx() as sess:
+                _watch_name_id_session(sess)
+
+                q = sess.query(table.name, table.id)
+                q = q.filter(table.name.in_(missing))
+                found = dict(self._query_all(q))
+
+                # name comparisons may be case insensitive
+                lfound = {k.lower(): v for k, v in found.items()}
+                for n in missing:
+                    if n in found:
+                        ret[n] = found[n]
+                    elif n.lower() in lfound:
+                        ret[n] = lfound[n.lower()]
+
+                new = [table(name=n) for n in missing.difference(ret)]
+                if new:
+                    sess.add_all(new)
+                    sess.flush()
+                    for r in new:
+                        ret[r.name] = r.id
+                        found[r.name] = r.id
+
+                if sess.info.get("name_id_dirty"):
+                    # found may include rows this session flushed but has not committed
+                    pending = sess.info.setdefault("name_id_pending", {})
+                    pending.setdefault(key, {}).update(found)
+                else:
+                    with _NAME_ID_LOCK:
+                        cache.update(found)
+
+        return ret
+
     def _get_date_range(self, q, asc=None, desc=None, hours=0):
         if asc is None:
             asc = AnalysisTbl.timestamp.asc()
@@ -24,13 +24,14 @@ from git.exc import GitCommandError
 
 # ============= enthought library imports =======================
 from sqlalchemy.exc import OperationalError, DatabaseError
-from traits.api import Instance, Bool, Str
+from traits.api import Instance, Bool, Str, Int
 from uncertainties import std_dev, nominal_value
 from yaml import YAMLError
 
 from pychron.core.helpers.binpack import encode_blob, pack
 from pychron.core.yaml import yload
 from pychron.dvc import dvc_dump, analysis_path, repository_path, NPATH_MODIFIERS
+from pychron.dvc.persistence_worker import get_persistence_worker
 from pychron.experiment.automated_run.persistence import BasePersister
 from pychron.experiment.automated_run.persistence_spec import PersistenceSpec
 from pychron.experiment.automated_run.spec import AutomatedRunSpec
@@ -82,12 +83,23 @@ class DVCPersister(BasePersister):
     save_log_enabled = Bool(False)
     arar_mapping = None
 
+    use_async_persistence = Bool(False)
+    async_persistence_max_backlog = Int(3)
+    async_persistence_timeout = Int(600)
+    _worker = None
+
     def __init__(self, bind=True, load_mapping=True, *args, **kw):
         super(DVCPersister, self).__init__(*args, **kw)
         if bind:
             bind_preference(
                 self, "use_uuid_path_name", "pychron.experiment.use_uuid_path_name"
             )
+            for attr in (
+                "use_async_persistence",
+                "async_persistence_max_backlog",
+                "async_persistence_timeout",
+            ):
+                bind_preference(self, attr, "pychron.dvc.experiment.{}".format(attr))
 
         if load_mapping:
             self._load_arar_mapping()
@@ -117,6 +129,36 @@ class DVCPersister(BasePersister):
         # push commit
         self.dvc.meta_push()
 
+    def replay_journal(self):
+        """
+        commit/push analyses journaled but not finished by a previous session
+        """
+        worker = self.worker
+        if worker.journal.count():
+            worker.start()
+
+    def wait_for_persistence(self, timeout=None):
+        """
+        block until all journaled analyses are committed and pushed
+
+        :return: False if the worker failed or the timeout expired
+        """
+        if self._worker:
+            return self._worker.wait(timeout=timeout)
+        return True
+
+    def stop_persistence(self):
+        if self._worker:
+            self._worker.stop(timeout=self.async_persistence_timeout)
+
+    @property
+    def worker(self):
+        if self._worker is None:
+            self._worker = get_persistence_worker(
+                self.dvc, paths.persistence_journal_dir
+            )
+        return self._worker
+
     def initialize(self, repository, pull=True):
         """
         setup git repos.
@@ -291,75 +333,11 @@ class DVCPersister(BasePersister):
 
         if self.stage_files:
             if commit:
-                try:
-                    ar.smart_pull(accept_their=True)
-
-                    paths = [
-                        spec_path,
-                    ] + [self._make_path(modifier=m) for m in NPATH_MODIFIERS]
-
-                    for p in paths:
-                        if os.path.isfile(p):
-                            ar.add(p, commit=False)
-                        else:
-                            self.debug("not at valid file {}".format(p))
-
-                    # commit files
-                    ar.commit("<{}>".format(commit_tag))
-
-                    # commit default data reduction
-                    add = False
-                    p = self._make_path("intercepts")
-                    if os.path.isfile(p):
-                        ar.add(p, commit=False)
-                        add = True
-
-                    p = self._make_path("baselines")
-                    if os.path.isfile(p):
-                        ar.add(p, commit=False)
-                        add = True
-
-                    if add:
-                        ar.commit("<ISOEVO> default collection fits")
-
-                    for pp, tag, msg in (
-                        (
-                            "blanks",
-                            "BLANKS",
-                            "preceding {}".format(self.per_spec.previous_blank_runid),
-                        ),
-                        ("icfactors", "ICFactor", "default"),
-                    ):
-                        p = self._make_path(pp)
-                        if os.path.isfile(p):
-                            ar.add(p, commit=False)
-                            ar.commit("<{}> {}".format(tag, msg))
-                    if push:
-                        # push changes
-                        dvc.push_repository(ar)
-
-                    # update meta
-                    dvc.meta_pull(accept_our=True)
-
-                    dvc.meta_commit(
-                        "repo updated for analysis {}".format(
-                            self.per_spec.run_spec.runid
-                        )
-                    )
-
-                    if push:
-                        # push commit
-                        dvc.meta_push()
-                except GitCommandError as e:
-                    self.warning(e)
-                    if self.confirmation_dialog(
-                        "NON FATAL\n\n"
-                        "DVC/Git upload of analysis not successful."
-                        "Do you want to CANCEL the experiment?\n",
-                        timeout_ret=False,
-                        timeout=30,
-                    ):
-                        ret = False
+                commits = self._make_commits(spec_path, commit_tag)
+                if self.use_async_persistence:
+                    ret = self._submit(ar, commits, push)
+                else:
+                    ret = self._commit(ar, commits, push)
 
         with dvc.session_ctx():
             try:
@@ -381,12 +359,120 @@ class DVCPersister(BasePersister):
             npath = self._make_path("logs", ".log")
             shutil.copyfile(path, npath)
             ar = self.active_repository
+            if self.use_async_persistence:
+                self._submit(ar, [("<COLLECTION> log", [npath])], True)
+                return
+
             ar.smart_pull(accept_their=True)
-            ar.add(npath, commit=False)
-            ar.commit("<COLLECTION> log")
+            with ar.index_lock:
+                ar.add(npath, commit=False)
+                ar.commit("<COLLECTION> log")
             self.dvc.push_repository(ar)
 
     # private
+    def _make_commits(self, spec_path, commit_tag):
+        """
+        :return: list of (commit message, paths). only existing paths are included
+        """
+
+        def exists(ps):
+            ret = []
+            for p in ps:
+                if os.path.isfile(p):
+                    ret.append(p)
+                else:
+                    self.debug("not at valid file {}".format(p))
+            return ret
+
+        commits = [
+            (
+                "<{}>".format(commit_tag),
+                exists([spec_path] + [self._make_path(modifier=m) for m in NPATH_MODIFIERS]),
+            ),
+            (
+                "<ISOEVO> default collection fits",
+                exists([self._make_path("intercepts"), self._make_path("baselines")]),
+            ),
+            (
+                "<BLANKS> preceding {}".format(self.per_spec.previous_blank_runid),
+                exists([self._make_path("blanks")]),
+            ),
+            ("<ICFactor> default", exists([self._make_path("icfactors")])),
+        ]
+        return [(msg, ps) for msg, ps in commits if ps]
+
+    def _commit(self, ar, commits, push):
+        dvc = self.dvc
+        try:
+            ar.smart_pull(accept_their=True)
+
+            with ar.index_lock:
+                for msg, ps in commits:
+                    for p in ps:
+                        ar.add(p, commit=False)
+                    ar.commit(msg)
+
+            if push:
+                # push changes
+                dvc.push_repository(ar)
+
+            # update meta
+            dvc.meta_pull(accept_our=True)
+
+            dvc.meta_commit(
+                "repo updated for analysis {}".format(self.per_spec.run_spec.runid)
+            )
+
+            if push:
+                # push commit
+                dvc.meta_push()
+        except GitCommandError as e:
+            self.warning(e)
+            if self.confirmation_dialog(
+                "NON FATAL\n\n"
+                "DVC/Git upload of analysis not successful."
+                "Do you want to CANCEL the experiment?\n",
+                timeout_ret=False,
+                timeout=30,
+            ):
+                return False
+        return True
+
+    def _submit(self, ar, commits, push):
+        """
+        commit and push in the background. blocks only if the backlog is too large
+
+        :return: False if the user chose to cancel the experiment
+        """
+        entry = {
+            "runid": self.per_spec.run_spec.runid,
+            "repository": ar.path,
+            "commits": [[msg, ps] for msg, ps in commits],
+            "push": push,
+            "committed": False,
+        }
+        worker = self.worker
+        if worker.submit(
+            entry,
+            max_backlog=self.async_persistence_max_backlog,
+            timeout=self.async_persistence_timeout,
+        ):
+            return True
+
+        msg = worker.error or "{} analyses waiting to be committed/pushed".format(
+            worker.journal.count()
+        )
+        self.warning(msg)
+        if self.confirmation_dialog(
+            "NON FATAL\n\n"
+            "Background DVC/Git upload of analyses not successful. {}\n\n"
+            "Do you want to CANCEL the experiment?\n".format(msg),
+            timeout_ret=False,
+            timeout=30,
+        ):
+            return False
+        return True
+
     def _load_arar_mapping(self):
         """
         Isotope: IsotopeKey
@@ -540,45 +626,37 @@ class DVCPersister(BasePersister):
     def _save_currents(self, dban):
         dvc = self.dvc
         if dvc.update_currents_enabled:
-
             ps = self.per_spec
-            db = dvc.db
 
+            currents = []
             for key, iso in ps.isotope_group.isotopes.items():
-                param = db.add_parameter("{}_intercept".format(key))
-                db.add_current(dban, iso.value, iso.error, param, iso.units)
-
-                param = db.add_parameter("{}_blank".format(key), iso.blank.units)
-                db.add_current(
-                    dban, iso.blank.value, iso.blank.error, param, iso.blank.units
+                currents.append(
+                    ("{}_intercept".format(key), iso.value, iso.error, iso.units)
                 )
-
-                param = db.add_parameter("{}_bs_corrected".format(key))
-                v = iso.get_baseline_corrected_value()
-                db.add_current(dban, nominal_value(v), std_dev(v), param, iso.units)
-
-                param = db.add_parameter("{}_ic_corrected".format(key))
-                v = iso.get_ic_corrected_value()
-                db.add_current(dban, nominal_value(v), std_dev(v), param, iso.units)
-
-                param = db.add_parameter(key)
-                v = iso.get_non_detector_corrected_value()
-                db.add_current(dban, nominal_value(v), std_dev(v), param, iso.units)
-
-                param = db.add_parameter(iso.baseline.name)
-                db.add_current(
-                    dban,
-                    iso.baseline.value,
-                    iso.baseline.error,
-                    param,
-                    iso.baseline.units,
+                currents.append(
+                    (
+                        "{}_blank".format(key),
+                        iso.blank.value,
+                        iso.blank.error,
+                        iso.blank.units,
+                    )
                 )
 
-                param = db.add_parameter("{}_n".format(iso.baseline.name))
-                db.add_current(dban, iso.baseline.n, None, param, "int")
+                for fmt, v in (
+                    ("{}_bs_corrected", iso.get_baseline_corrected_value()),
+                    ("{}_ic_corrected", iso.get_ic_corrected_value()),
+                    ("{}", iso.get_non_detector_corrected_value()),
+                ):
+                    currents.append(
+                        (fmt.format(key), nominal_value(v), std_dev(v), iso.units)
+                    )
+
+                bs = iso.baseline
+                currents.append((bs.name, bs.value, bs.error, bs.units))
+                currents.append(("{}_n".format(bs.name), bs.n, None, "int"))
+                currents.append(("{}_n".format(iso.name), iso.n, None, "int"))
 
-                param = db.add_parameter("{}_n".format(iso.name))
-                db.add_current(dban, iso.n, None, param, "int")
+            dvc.db.add_currents(dban, currents)
 
     def _save_analysis(self, timestamp):
 
@@ -706,6 +784,7 @@ class DVCPersister(BasePersister):
             if per_spec.tripped_conditional
             else None
         )
+        obj["collection_timing"] = per_spec.collection_timing or None
 
         # save the scripts
         ms = per_spec.run_spec.mass_spectrometer
@@ -60,8 +60,12 @@ def irradiation_geometry_holes(name):
     return geom.holes
 
 
+def irradiation_chronology_path(name):
+    return os.path.join(paths.meta_root, name, "chronology.txt")
+
+
 def irradiation_chronology(name, allow_null=False):
-    p = os.path.join(paths.meta_root, name, "chronology.txt")
+    p = irradiation_chronology_path(name)
     return Chronology(p, allow_null=allow_null)
 
 
@@ -110,9 +114,25 @@ def get_frozen_flux(repo, irradiation):
     return fd
 
 
+FLUX_HISTORY_PREFIX = "fit flux for "
+
+
+def _mtimes(ps):
+    ret = []
+    for p in ps:
+        try:
+            ret.append(os.stat(p).st_mtime_ns)
+        except OSError:
+            ret.append(None)
+    return tuple(ret)
+
+
 class MetaRepo(GitRepoManager):
     clear_cache = Bool
 
+    _irradiation_info_key = None
+    _irradiation_info_cache = None
+
     def get_correlation_ellipses(self):
         p = os.path.join(paths.meta_root, "correlation_ellipses.json")
         return dvc_load(p)
@@ -576,8 +596,61 @@ class MetaRepo(GitRepoManager):
 
         return dvc_load(p)
 
+    def get_irradiation_info(self, levels, flux_history=True):
+        """
+        resolve the flux positions, production, chronology and latest flux history for a set of
+        (irradiation, level) pairs in one pass.
+
+        results are cached per HEAD sha and use_irradiation_endtime preference so they are
+        invalidated by any pull, commit or preference change. cached levels and chronologies
+        are also reloaded if their files were modified since e.g. by an uncommitted flux update.
+
+        returns fluxes, productions, chronologies, flux_histories where
+            fluxes[irrad][level] = positions
+            productions[irrad][level] = (production name, Production)
+            chronologies[irrad] = Chronology
+            flux_histories["{irrad}{level}"] = "date (author)" or None
+        """
+        cache = self._get_irradiation_info_cache()
+        lcache = cache["levels"]
+        ccache = cache["chronologies"]
+        hcache = cache["flux_histories"]
+
+        levels = {(irrad, level) for irrad, level in levels if irrad != "NoIrradiation"}
+        if flux_history:
+            missing = ["{}{}".format(*l) for l in levels]
+            missing = [k for k in missing if k not in hcache]
+            if missing:
+                hcache.update(self._get_latest_flux_histories(missing))
+
+        fluxes, productions, chronologies, flux_histories = {}, {}, {}, {}
+        for irrad, level in levels:
+            key = (irrad, level)
+            entry = lcache.get(key)
+            if entry is None or _mtimes(entry[0]) != entry[1]:
+                entry = self._load_level_info(irrad, level)
+                lcache[key] = entry
+
+            centry = ccache.get(irrad)
+            if centry is None or _mtimes(centry[0]) != centry[1]:
+                # stat before loading so a concurrent write is seen on the next call
+                cps = (irradiation_chronology_path(irrad),)
+                centry = (cps, _mtimes(cps), self.get_chronology(irrad))
+                ccache[irrad] = centry
+
+            _, _, positions, production = entry
+            fluxes.setdefault(irrad, {})[level] = positions
+            productions.setdefault(irrad, {})[level] = production
+            chronologies[irrad] = centry[2]
+
+            if flux_history:
+                hkey = "{}{}".format(irrad, level)
+                flux_histories[hkey] = hcache.get(hkey)
+
+        return fluxes, productions, chronologies, flux_histories
+
     def get_flux_history(self, irradiation, level, **kw):
-        greps = ["fit flux for {}{}".format(irradiation, level)]
+        greps = ["{}{}{}".format(FLUX_HISTORY_PREFIX, irradiation, level)]
         cs = self.get_commits_from_log(greps, **kw)
         return cs
 
@@ -705,9 +778,7 @@ class MetaRepo(GitRepoManager):
         try:
             chron = irradiation_chronology(name, allow_null=allow_null)
             if self.application:
-                chron.use_irradiation_endtime = self.application.get_boolean_preference(
-                    "pychron.arar.constants.use_irradiation_endtime", False
-                )
+                chron.use_irradiation_endtime = self._use_irradiation_endtime()
         except MetaObjectException:
             if name != "NoIrradiation" and not name.startswith("Package"):
                 self.warning(
@@ -730,6 +801,73 @@ class MetaRepo(GitRepoManager):
         return os.path.join(paths.meta_root, "sensitivity.json")
 
     # private
+    def _use_irradiation_endtime(self):
+        if self.application:
+            return self.application.get_boolean_preference(
+                "pychron.arar.constants.use_irradiation_endtime", False
+            )
+        return False
+
+    def _load_level_info(self, irrad, level):
+        """
+        :return: (paths, mtimes, positions, (production name, Production))
+        """
+        prods = os.path.join(paths.meta_root, irrad, "productions.json")
+        pname = dvc_load(prods).get(level, "")
+        ps = (
+            self.get_level_path(irrad, level),
+            prods,
+            os.path.join(
+                paths.meta_root, irrad, "productions", add_extension(pname, ext=".json")
+            ),
+        )
+        # stat before loading so a concurrent write is seen on the next call
+        mtimes = _mtimes(ps)
+
+        positions = self.get_flux_positions(irrad, level)
+        production = self.get_production(irrad, level)
+        return ps, mtimes, positions, production
+
+    def _get_irradiation_info_cache(self):
+        try:
+            sha = self.get_head()
+        except BaseException:
+            sha = None
+
+        key = (sha, self._use_irradiation_endtime())
+        if (
+            sha is None
+            or key != self._irradiation_info_key
+            or self._irradiation_info_cache is None
+        ):
+            self.debug("reset irradiation info cache. key={}".format(key))
+            self._irradiation_info_key = key
+            self._irradiation_info_cache = {
+                "levels": {},
+                "chronologies": {},
+                "flux_histories": {},
+            }
+        return self._irradiation_info_cache
+
+    def _get_latest_flux_histories(self, keys):
+        """
+        find the most recent "fit flux for <irrad><level>" commit for each key using a single
+        git log
+        """
+        ret = {k: None for k in keys}
+        remaining = set(keys)
+        for c in self.get_commits_from_log([FLUX_HISTORY_PREFIX]):
+            msg = c.message[len(FLUX_HISTORY_PREFIX) :]
+            # same prefix semantics as get_flux_history's "--grep=^fit flux for <key>"
+            for k in [k for k in remaining if msg.startswith(k)]:
+                ret[k] = "{} ({})".format(c.date.strftime(DATE_FORMAT), c.author)
+                remaining.remove(k)
+
+            if not remaining:
+                break
+
+        return ret
+
     def _get_level_positions(self, irrad, level):
         obj, p = self.get_level_obj(irrad, level)
         if isinstance(obj, list):
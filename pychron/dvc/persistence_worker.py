@@ -0,0 +1,315 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+Background commit/push of saved analyses.
+
+DVCPersister writes a run's files and then adds an entry to a ``PersistenceJournal``. A
+``PersistenceWorker`` thread commits and pushes journaled runs. Consecutive runs in the same
+repository share commits, a push and the meta repo update. Entries are removed only once
+they are fully processed, so a journal left by a crash is replayed on the next start. A batch
+that keeps failing is retried ``max_retries`` times, then the worker stops and warns the user.
+Its entries stay in the journal until the worker is started again.
+
+There is one worker per journal directory. Use ``get_persistence_worker``. Staging and committing
+hold the repository's lock (``GitRepoManager.index_lock``). Pulls and pushes do not.
+
+entry::
+
+    {"runid": "12345-01A",
+     "repository": "/path/to/repository",
+     "commits": [["<COLLECTION>", [path, ...]], ["<ISOEVO> default collection fits", [...]], ...],
+     "push": True,
+     "committed": False}
+"""
+import json
+import os
+import time
+from threading import Thread, Condition, Lock, current_thread
+
+from pychron.git_archive.repo_manager import GitRepoManager
+from pychron.loggable import Loggable
+
+_workers = {}
+_workers_lock = Lock()
+
+
+def get_persistence_worker(dvc, root):
+    """
+    the worker for the journal at ``root``. created on first use
+    """
+    root = os.path.abspath(root)
+    with _workers_lock:
+        worker = _workers.get(root)
+        if worker is None:
+            worker = PersistenceWorker(dvc, PersistenceJournal(root))
+            _workers[root] = worker
+        return worker
+
+
+class PersistenceJournal(object):
+    def __init__(self, root):
+        self.root = root
+        if not os.path.isdir(root):
+            os.makedirs(root)
+
+    def add(self, entry):
+        name = "{:019d}-{}.json".format(time.time_ns(), entry.get("runid", ""))
+        p = os.path.join(self.root, name)
+        self.update(p, entry)
+        return p
+
+    def update(self, p, entry):
+        tmp = "{}.tmp".format(p)
+        with open(tmp, "w") as wfile:
+            json.dump(entry, wfile)
+            wfile.flush()
+            os.fsync(wfile.fileno())
+        os.replace(tmp, p)
+
+    def remove(self, p):
+        if os.path.isfile(p):
+            os.remove(p)
+
+    def entries(self):
+        """
+        :return: list of (path, entry) oldest first
+        """
+        ret = []
+        for name in sorted(os.listdir(self.root)):
+            if not name.endswith(".json"):
+                continue
+
+            p = os.path.join(self.root, name)
+            try:
+                with open(p, "r") as rfile:
+                    ret.append((p, json.load(rfile)))
+            except (OSError, ValueError):
+                # a partially written entry is never renamed into place
+                continue
+        return ret
+
+    def count(self):
+        return len([n for n in os.listdir(self.root) if n.endswith(".json")])
+
+
+def coalesce_commits(entries):
+    """
+    merge the commits of several entries. commits with the same message are combined and
+    ordered by first occurrence
+
+    :param entries: list of entry dicts
+    :return: list of (message, paths)
+    """
+    commits = {}
+    for e in entries:
+        for msg, ps in e["commits"]:
+            commits.setdefault(msg, []).extend(ps)
+    return list(commits.items())
+
+
+class PersistenceWorker(Loggable):
+    retry_period = 30
+    max_retries = 10
+
+    def __init__(self, dvc, journal, *args, **kw):
+        super(PersistenceWorker, self).__init__(*args, **kw)
+        self.dvc = dvc
+        self.journal = journal
+        self.error = None
+
+        self._cond = Condition()
+        self._thread = None
+        self._alive = False
+
+    def start(self):
+        with self._cond:
+            self.error = None
+            if self._thread is None or not self._thread.is_alive():
+                n = self.journal.count()
+                if n:
+                    self.info("replaying {} journaled analyses".format(n))
+
+                self._alive = True
+                self._thread = Thread(target=self._run, name="PersistenceWorker")
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify_all()
+
+    def stop(self, timeout=None):
+        """
+        stop the worker and wait up to ``timeout`` seconds for the current batch to finish
+        """
+        with self._cond:
+            self._alive = False
+            self._cond.notify_all()
+            t = self._thread
+
+        if t is not None and t is not current_thread():
+            t.join(timeout)
+
+    def submit(self, entry, max_backlog=0, timeout=None):
+        """
+        journal an entry and wake the worker. block while more than ``max_backlog`` entries are
+        waiting. ``max_backlog`` <= 0 does not block
+
+        a worker that failed is not restarted. the entry is journaled for the next start
+
+        :return: False if the worker failed or the backlog was not reached before the timeout
+        """
+        self.journal.add(entry)
+        if self.error:
+            return False
+
+        self.start()
+        if max_backlog > 0:
+            return self.wait(max_backlog, timeout=timeout)
+        return True
+
+    def wait(self, backlog=0, timeout=None):
+        """
+        wait until at most ``backlog`` entries are waiting
+
+        :return: True if the backlog was reached before the timeout
+        """
+        st = time.time()
+        with self._cond:
+            while self.journal.count() > backlog:
+                if not self._alive:
+                    return False
+
+                if timeout is not None:
+                    remaining = timeout - (time.time() - st)
+                    if remaining <= 0:
+                        return False
+                else:
+                    remaining = None
+
+                self.debug("waiting for persistence backlog <= {}".format(backlog))
+                self._cond.wait(remaining)
+        return True
+
+    # private
+    def _run(self):
+        retries = 0
+        while 1:
+            with self._cond:
+                if not self._alive:
+                    break
+
+                entries = self.journal.entries()
+                if not entries:
+                    self._cond.wait()
+                    continue
+
+            batch = self._get_batch(entries)
+            try:
+                self._process(batch)
+            except BaseException as e:
+                self.debug_exception()
+                runids = ", ".join(entry["runid"] for _, entry in batch)
+                retries += 1
+                if retries > self.max_retries:
+                    self._fail(
+                        "Background commit/push of {} failed after {} attempts. {}\n\n"
+                        "The analyses are saved locally and will be committed/pushed "
+                        "the next time Pychron starts".format(runids, retries, e)
+                    )
+                    break
+
+                self.warning(
+                    "failed saving {}. retry {}/{} in {}s. {}".format(
+                        runids, retries, self.max_retries, self.retry_period, e
+                    )
+                )
+                with self._cond:
+                    self._cond.wait(self.retry_period)
+                continue
+
+            retries = 0
+            for p, _ in batch:
+                self.journal.remove(p)
+
+            with self._cond:
+                self._cond.notify_all()
+
+    def _fail(self, msg):
+        with self._cond:
+            self.error = msg
+            self._alive = False
+            self._cond.notify_all()
+
+        self._notify_failure(msg)
+
+    def _notify_failure(self, msg):
+        from pychron.core.ui.gui import invoke_in_main_thread
+
+        self.warning(msg)
+        invoke_in_main_thread(self.warning_dialog, msg)
+
+    def _get_batch(self, entries):
+        """
+        consecutive entries for the same repository
+        """
+        root = entries[0][1]["repository"]
+        batch = []
+        for p, e in entries:
+            if e["repository"] != root:
+                break
+            batch.append((p, e))
+        return batch
+
+    def _process(self, batch):
+        entries = [e for _, e in batch]
+        runids = ", ".join(e["runid"] for e in entries)
+        root = entries[0]["repository"]
+        push = any(e.get("push") for e in entries)
+
+        self.debug("saving {} to {}".format(runids, root))
+        st = time.time()
+
+        dvc = self.dvc
+        repo = GitRepoManager()
+        repo.open_repo(root)
+
+        uncommitted = [(p, e) for p, e in batch if not e.get("committed")]
+        if uncommitted:
+            repo.smart_pull(accept_their=True)
+            # only staging and committing are serialized with other users of the repository
+            with repo.index_lock:
+                for msg, ps in coalesce_commits([e for _, e in uncommitted]):
+                    ps = [pi for pi in ps if os.path.isfile(pi)]
+                    if ps:
+                        for pi in ps:
+                            repo.add(pi, commit=False)
+                        repo.commit(msg)
+
+            # if pushing fails do not commit again when retrying
+            for p, e in uncommitted:
+                e["committed"] = True
+                self.journal.update(p, e)
+
+        if push:
+            dvc.push_repository(repo)
+
+        dvc.meta_pull(accept_our=True)
+        dvc.meta_commit("repo updated for analysis {}".format(runids))
+        if push:
+            dvc.meta_push()
+
+        self.debug("saved {} in {:0.2f}s".format(runids, time.time() - st))
+
+
+# ============= EOF =============================================
@@ -0,0 +1,237 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+Columnar binary sidecars for the raw signal data stored in an analysis's ``.data`` file.
+
+A sidecar is a derived, local-only cache of the base64 blobs in ``<runid>.dat.json``.  It lives
+outside of the repository working tree (see ``paths.raw_sidecar_dir``) so it never shows up in
+``git status``.
+
+layout::
+
+    MAGIC (8 bytes) | header length (uint32, little endian) | json header | padding | data
+
+every series is stored as two contiguous columns (x then y) so that ``read_sidecar`` can hand out
+zero-copy views into a single memory map.
+"""
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import struct
+
+from numpy import memmap, dtype as npdtype, frombuffer, ascontiguousarray
+
+# ============= local library imports  ==========================
+from pychron import json
+from pychron.core.helpers.binpack import format_blob
+from pychron.dvc import dvc_load
+from pychron.paths import paths
+
+MAGIC = b"PYCRDAT1"
+SIDECAR_EXT = ".rdat"
+SIDECAR_VERSION = 1
+ALIGNMENT = 8
+KINDS = ("signals", "baselines", "sniffs")
+
+
+def sidecar_path(data_path, root=None):
+    """
+    map a ``.data`` json path to its sidecar path. The sidecar tree mirrors the layout of
+    ``paths.dvc_dir``
+    """
+    if root is None:
+        root = paths.raw_sidecar_dir
+
+    rel = os.path.relpath(data_path, paths.dvc_dir)
+    head, _ = os.path.splitext(rel)
+    head, _ = os.path.splitext(head)
+    return os.path.join(root, "{}{}".format(head, SIDECAR_EXT))
+
+
+def is_stale(data_path, spath):
+    """
+    a sidecar is stale if it does not exist or is older than the json it was built from
+    """
+    if not os.path.isfile(spath):
+        return True
+
+    return os.path.getmtime(spath) < os.path.getmtime(data_path)
+
+
+def decode_blob(blob, fmt=">f4"):
+    """
+    decode a raw (not base64) time/intensity blob into two columns.
+
+    a trailing partial record is dropped, the same as ``binpack.unpack``
+    """
+    n = len(blob) // (2 * npdtype(fmt).itemsize)
+    a = frombuffer(blob, dtype=fmt, count=2 * n).reshape(n, 2)
+    return a[:, 0], a[:, 1]
+
+
+def write_sidecar(jd, path, dtype="<f8"):
+    """
+    write the signals, baselines and sniffs in ``jd`` (the contents of a ``.data`` file) to a
+    sidecar at ``path``.
+
+    ``dtype`` is the on-disk storage type. float64 is the default so that loaded arrays are
+    identical to the ones produced by decoding the json blobs.
+    """
+    dt = npdtype(dtype)
+    series = []
+    columns = []
+    offset = 0
+    for kind in KINDS:
+        for sd in jd.get(kind, []):
+            blob = sd.get("blob")
+            if blob:
+                xs, ys = decode_blob(format_blob(blob))
+            else:
+                xs, ys = (), ()
+
+            n = len(xs)
+            series.append(
+                {
+                    "kind": kind,
+                    "isotope": sd.get("isotope"),
+                    "detector": sd.get("detector"),
+                    "offset": offset,
+                    "n": n,
+                }
+            )
+            columns.append(ascontiguousarray(xs, dtype=dt))
+            columns.append(ascontiguousarray(ys, dtype=dt))
+            offset += 2 * n
+
+    header = json.dumps(
+        {"version": SIDECAR_VERSION, "dtype": dt.str, "series": series}
+    ).encode("utf-8")
+
+    start = len(MAGIC) + 4 + len(header)
+    pad = (-start) % ALIGNMENT
+
+    root = os.path.dirname(path)
+    if not os.path.isdir(root):
+        os.makedirs(root)
+
+    tmp = "{}.tmp".format(path)
+    with open(tmp, "wb") as wfile:
+        wfile.write(MAGIC)
+        wfile.write(struct.pack("<I", len(header)))
+        wfile.write(header)
+        wfile.write(b"\x00" * pad)
+        for c in columns:
+            wfile.write(c.tobytes())
+
+    os.replace(tmp, path)
+    return len(series)
+
+
+def build_sidecar(data_path, root=None, dtype="<f8", force=False):
+    """
+    build the sidecar for a single ``.data`` file. returns True if a sidecar was written
+    """
+    spath = sidecar_path(data_path, root=root)
+    if not force and not is_stale(data_path, spath):
+        return False
+
+    jd = dvc_load(data_path)
+    if not jd:
+        return False
+
+    write_sidecar(jd, spath, dtype=dtype)
+    return True
+
+
+def iter_data_paths(repository_root):
+    """
+    yield every ``.data`` json path in a repository
+    """
+    for root, dirs, files in os.walk(repository_root):
+        if ".git" in dirs:
+            dirs.remove(".git")
+
+        if os.path.basename(root) == ".data":
+            for f in files:
+                if f.endswith(".json"):
+                    yield os.path.join(root, f)
+
+
+def read_header(rfile):
+    magic = rfile.read(len(MAGIC))
+    if magic != MAGIC:
+        raise ValueError("Invalid sidecar. bad magic {}".format(magic))
+
+    (hlen,) = struct.unpack("<I", rfile.read(4))
+    header = json.loads(rfile.read(hlen).decode("utf-8"))
+
+    start = len(MAGIC) + 4 + hlen
+    start += (-start) % ALIGNMENT
+    return header, start
+
+
+def read_sidecar(path):
+    """
+    read a sidecar and return a dict shaped like the ``.data`` json, i.e. with ``signals``,
+    ``baselines`` and ``sniffs`` lists, except each item carries ``xs``/``ys`` arrays instead of a
+    ``blob``. The arrays are copy-on-write views into a single memory map.
+    """
+    with open(path, "rb") as rfile:
+        header, start = read_header(rfile)
+
+    if header.get("version") != SIDECAR_VERSION:
+        raise ValueError("Unsupported sidecar version {}".format(header.get("version")))
+
+    series = header["series"]
+    total = sum(s["n"] for s in series) * 2
+
+    if total:
+        data = memmap(path, dtype=header["dtype"], mode="c", offset=start, shape=(total,))
+    else:
+        data = None
+
+    ret = {k: [] for k in KINDS}
+    for s in series:
+        o, n = s["offset"], s["n"]
+        if n:
+            xs, ys = data[o : o + n], data[o + n : o + 2 * n]
+        else:
+            xs, ys = None, None
+
+        ret[s["kind"]].append(
+            {"isotope": s["isotope"], "detector": s["detector"], "xs": xs, "ys": ys}
+        )
+    return ret
+
+
+def load_raw(data_path, root=None):
+    """
+    return the sidecar contents for ``data_path`` or None if there is no up-to-date sidecar
+    """
+    if not data_path or not os.path.isfile(data_path):
+        return
+
+    spath = sidecar_path(data_path, root=root)
+    if is_stale(data_path, spath):
+        return
+
+    try:
+        return read_sidecar(spath)
+    except (ValueError, KeyError, OSError) as e:
+        print("raw sidecar load exception. error: {}, {}".format(e, spath))
+
+
+# ============= EOF =============================================
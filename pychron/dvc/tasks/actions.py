@@ -233,6 +233,22 @@ class GenerateCurrentsAction(Action):
         dvc.generate_currents()
 
 
+class BuildRawSidecarsAction(Action):
+    name = "Build Raw Data Sidecars"
+
+    def perform(self, event):
+        app = event.task.window.application
+        dvc = app.get_service(DVC_PROTOCOL)
+        if (
+            confirm(
+                None,
+                "Build raw data sidecars for all local repositories? This could take a while!",
+            )
+            == YES
+        ):
+            dvc.build_raw_sidecars()
+
+
 # class MapRunIDsAction(Action):
 #     name = 'Map RunIDs'
 #
@@ -251,7 +267,13 @@ class ClearCacheAction(Action):
     def perform(self, event):
         app = event.task.window.application
         dvc = app.get_service(DVC_PROTOCOL)
-        dvc.clear_cache()
+        r = dvc.clear_cache()
+        if r:
+            information(
+                None,
+                "Cleared {size} analyses ({nbytes} bytes)\n\n"
+                "Hits={hits} Misses={misses} Evictions={evictions}".format(**r),
+            )
 
 
 class WorkOfflineAction(Action):
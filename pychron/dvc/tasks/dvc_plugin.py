@@ -35,6 +35,7 @@ from pychron.dvc.tasks.actions import (
     ShareChangesAction,
     ClearCacheAction,
     GenerateCurrentsAction,
+    BuildRawSidecarsAction,
 )
 from pychron.dvc.tasks.dvc_preferences import (
     DVCConnectionPreferencesPane,
@@ -61,6 +62,11 @@ class DVCPlugin(BaseTaskPlugin):
         if not self._fetched:
             dvc.initialize()
 
+        # commit/push analyses left in the journal by a previous session
+        persister = self.application.get_service(DVCPersister)
+        if persister:
+            persister.replay_journal()
+
         service = self.application.get_service(IGitHost)
         if not service:
             self.information_dialog(
@@ -73,6 +79,10 @@ class DVCPlugin(BaseTaskPlugin):
         # prog.change_message('Pushing changes to meta repository')
         # dvc.meta_repo.cmd('push', '-u','origin','master')
 
+        persister = self.application.get_service(DVCPersister)
+        if persister:
+            persister.stop_persistence()
+
         dvc = self.application.get_service(DVC)
         with dvc.session_ctx(use_parent_session=False):
             names = dvc.get_usernames()
@@ -171,7 +181,8 @@ class DVCPlugin(BaseTaskPlugin):
         ]
 
         pipeline_actions = [
-            SchemaAddition(factory=GenerateCurrentsAction, path="MenuBar/tools.menu")
+            SchemaAddition(factory=GenerateCurrentsAction, path="MenuBar/tools.menu"),
+            SchemaAddition(factory=BuildRawSidecarsAction, path="MenuBar/tools.menu"),
         ]
 
         return [
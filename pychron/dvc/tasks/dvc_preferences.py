@@ -157,6 +157,10 @@ class DVCPreferences(BasePreferencesHelper):
     use_cocktail_irradiation = Bool
     use_cache = Bool
     max_cache_size = Int
+    max_cache_mb = Int
+    analysis_loading_threads = Int
+    sync_threads = Int(4)
+    sync_timeout = Int(120)
     update_currents_enabled = Bool
     use_auto_pull = Bool(True)
     use_auto_push = Bool(False)
@@ -209,9 +213,39 @@ class DVCPreferencesPane(PreferencesPane):
                     HGroup(
                         Item("use_cache", label="Enabled"),
                         Item("max_cache_size", label="Max Size"),
+                        Item(
+                            "max_cache_mb",
+                            label="Max MB",
+                            tooltip="Limit the cache by the estimated memory used by the cached "
+                            "analyses instead of by the number of analyses. 0 disables",
+                        ),
                     ),
                     label="Cache",
                 ),
+                BorderVGroup(
+                    Item(
+                        "analysis_loading_threads",
+                        label="Threads",
+                        tooltip="Number of threads used to read analysis files when "
+                        "loading analyses. 0 or 1 loads serially",
+                    ),
+                    label="Analysis Loading",
+                ),
+                BorderVGroup(
+                    Item(
+                        "sync_threads",
+                        label="Threads",
+                        tooltip="Number of repositories fetched concurrently when syncing "
+                        "repositories. 0 or 1 syncs serially",
+                    ),
+                    Item(
+                        "sync_timeout",
+                        label="Timeout (s)",
+                        tooltip="Stop fetching a repository after this many seconds. 0 "
+                        "disables",
+                    ),
+                    label="Repository Sync",
+                ),
             )
         )
         return v
@@ -220,6 +254,9 @@ class DVCPreferencesPane(PreferencesPane):
 class DVCExperimentPreferences(BasePreferencesHelper):
     preferences_path = "pychron.dvc.experiment"
     use_dvc_persistence = Bool
+    use_async_persistence = Bool
+    async_persistence_max_backlog = Int(3)
+    async_persistence_timeout = Int(600)
 
 
 class DVCExperimentPreferencesPane(PreferencesPane):
@@ -229,7 +266,28 @@ class DVCExperimentPreferencesPane(PreferencesPane):
     def traits_view(self):
         v = View(
             BorderVGroup(
-                Item("use_dvc_persistence", label="Use DVC Persistence"), label="DVC"
+                Item("use_dvc_persistence", label="Use DVC Persistence"),
+                Item(
+                    "use_async_persistence",
+                    label="Background Commit/Push",
+                    tooltip="Commit and push analyses in the background while the next run "
+                    "starts. Unfinished analyses are journaled and replayed on startup",
+                ),
+                Item(
+                    "async_persistence_max_backlog",
+                    label="Max. Backlog",
+                    tooltip="Wait before starting the next run if more than this many analyses "
+                    "are waiting to be committed/pushed",
+                    enabled_when="use_async_persistence",
+                ),
+                Item(
+                    "async_persistence_timeout",
+                    label="Backlog Timeout (s)",
+                    tooltip="Maximum time to wait for the backlog before asking whether to "
+                    "cancel the experiment. Also used at the end of a queue",
+                    enabled_when="use_async_persistence",
+                ),
+                label="DVC",
             )
         )
         return v
@@ -0,0 +1,208 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from pychron.dvc.dvc import DVC
+from pychron.dvc.dvc_database import DVCDatabase, clear_name_id_cache
+from pychron.dvc.dvc_orm import (
+    Base,
+    AnalysisTbl,
+    AnalysisChangeTbl,
+    IrradiationTbl,
+    IrradiationPositionTbl,
+    LevelTbl,
+    LoadTbl,
+    MaterialTbl,
+    MeasuredPositionTbl,
+    PrincipalInvestigatorTbl,
+    ProjectTbl,
+    SampleTbl,
+)
+from pychron.envisage.browser.base_browser_model import BaseBrowserModel
+from pychron.envisage.browser.record_views import (
+    LabnumberRecordView,
+    LabnumberRowRecordView,
+)
+from pychron.paths import paths
+
+NPOSITIONS = 3
+NANALYSES = 7
+
+
+class Sample(object):
+    def __init__(self, labnumber):
+        self.labnumber = labnumber
+
+
+class BrowserQueriesTestCase(unittest.TestCase):
+    def setUp(self):
+        clear_name_id_cache()
+        self.root = tempfile.mkdtemp()
+        self.db = DVCDatabase(kind="sqlite", path=os.path.join(self.root, "test.db"))
+        self.db.connect()
+        with self.db.session_ctx() as sess:
+            self.db.create_all(Base.metadata)
+
+            pi = PrincipalInvestigatorTbl(last_name="Ross", first_initial="J")
+            project = ProjectTbl(name="Bar", principal_investigator=pi)
+            material = MaterialTbl(name="sanidine", grainsize="20-40")
+            level = LevelTbl(name="A", irradiation=IrradiationTbl(name="NM-300"))
+            load = LoadTbl(name="1000", holderName="221-hole")
+            sess.add_all((pi, project, material, level, load))
+
+            t = datetime(2026, 1, 1)
+            for i in range(NPOSITIONS):
+                sample = SampleTbl(
+                    name="MB-{}".format(i),
+                    project=project,
+                    material=material,
+                    lat=34.1,
+                    lon=-106.9,
+                )
+                ip = IrradiationPositionTbl(
+                    identifier="1000{}".format(i),
+                    position=i + 1,
+                    level=level,
+                    sample=sample,
+                )
+                for j in range(NANALYSES):
+                    # pairs of analyses share a timestamp
+                    an = AnalysisTbl(
+                        uuid="{}-{}".format(i, j),
+                        aliquot=1,
+                        increment=j,
+                        timestamp=t + timedelta(hours=j // 2),
+                        irradiation_position=ip,
+                    )
+                    an.change = AnalysisChangeTbl(tag="ok")
+                    an.measured_positions = [
+                        MeasuredPositionTbl(position=i + 1, load=load)
+                    ]
+                    sess.add(an)
+
+            # a position without a sample or level
+            sess.add(IrradiationPositionTbl(identifier="2000", position=1))
+            sess.commit()
+
+    def tearDown(self):
+        self.db.close_session()
+        clear_name_id_cache()
+        shutil.rmtree(self.root)
+
+    def _count_queries(self):
+        queries = []
+
+        def before(conn, cursor, statement, *args):
+            queries.append(statement)
+
+        event.listen(self.db.session.bind, "before_cursor_execute", before)
+        self.addCleanup(
+            event.remove, self.db.session.bind, "before_cursor_execute", before
+        )
+        return queries
+
+    def test_labnumber_record_rows(self):
+        db = self.db
+        with db.session_ctx() as sess:
+            ips = sess.query(IrradiationPositionTbl).all()
+            rows = db.get_labnumber_record_rows([ip.id for ip in ips], chunk=2)
+            self.assertEqual(len(rows), NPOSITIONS + 1)
+
+            rows = {r[0]: r for r in rows}
+            for ip in ips:
+                a = LabnumberRecordView(ip)
+                b = LabnumberRowRecordView(rows[ip.id])
+                for attr in (
+                    "labnumber",
+                    "irradiation_pos",
+                    "irradiation",
+                    "irradiation_level",
+                    "irradiation_and_level",
+                    "name",
+                    "material",
+                    "project",
+                    "lat",
+                    "identifier",
+                    "id",
+                ):
+                    self.assertEqual(getattr(a, attr), getattr(b, attr), attr)
+
+                if ip.sample:
+                    self.assertEqual(b.lon, -106.9)
+
+    def test_keyset_pages(self):
+        db = self.db
+        lns = ["1000{}".format(i) for i in range(NPOSITIONS)]
+        with db.session_ctx():
+            ans, _ = db.get_labnumber_analyses(lns)
+            expected = [a.uuid for a in ans]
+
+            for order in ("asc", "desc"):
+                uuids = []
+                after = None
+                while 1:
+                    page, _ = db.get_labnumber_analyses(
+                        lns, limit=4, after=after, order=order
+                    )
+                    uuids.extend(a.uuid for a in page)
+                    if len(page) < 4:
+                        break
+                    after = page[-1].timestamp, page[-1].id
+
+                if order == "desc":
+                    uuids.reverse()
+                self.assertEqual(uuids, expected)
+
+    def test_bind_eager_loads(self):
+        db = self.db
+        lns = ["1000{}".format(i) for i in range(NPOSITIONS)]
+        with db.session_ctx() as sess:
+            sess.expire_all()
+            ans, _ = db.get_labnumber_analyses(lns, bind=True)
+            self.assertEqual(len(ans), NPOSITIONS * NANALYSES)
+
+            queries = self._count_queries()
+            for a in ans:
+                a.bind()
+
+            self.assertEqual(queries, [])
+            a = ans[0]
+            self.assertEqual(a.load_name, "1000")
+            self.assertEqual(a.load_holder, "221-hole")
+            self.assertEqual(a.irradiation, "NM-300")
+            self.assertEqual(a.material, "sanidine (20-40)")
+            self.assertEqual(a.principal_investigator, "Ross, J")
+
+    def test_unpaged_keeps_paging(self):
+        appdata_dir = paths.appdata_dir
+        paths.appdata_dir = self.root
+        self.addCleanup(setattr, paths, "appdata_dir", appdata_dir)
+
+        dvc = DVC(bind=False)
+        dvc.db = self.db
+        model = BaseBrowserModel(dvc=dvc)
+
+        samples = [Sample("1000{}".format(i)) for i in range(NPOSITIONS)]
+        with self.db.session_ctx():
+            ans = model._retrieve_analyses(samples=samples, make_records=False)
+            expected = [a.uuid for a in ans[:8]]
+
+            page = model._retrieve_analyses(
+                samples=samples, limit=4, page=True, make_records=False
+            )
+            uuids = [a.uuid for a in page]
+
+            # e.g. get_selection
+            model._retrieve_analyses(samples=samples[:1], limit=4, make_records=False)
+
+            page = model._retrieve_next_analyses()
+            uuids.extend(a.uuid for a in page)
+            self.assertEqual(uuids, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
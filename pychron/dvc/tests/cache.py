@@ -0,0 +1,76 @@
+import unittest
+
+from pychron.dvc.cache import DVCCache
+
+
+class Clock(object):
+    def __init__(self):
+        self.t = 0
+
+    def __call__(self):
+        return self.t
+
+
+class DVCCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+
+    def _cache(self, **kw):
+        return DVCCache(clock=self.clock, sizer=lambda v: v, **kw)
+
+    def test_lru_eviction(self):
+        c = self._cache(max_size=2)
+        c.update("a", 1)
+        c.update("b", 1)
+        c.get("a")
+        c.update("c", 1)
+
+        self.assertEqual(c.get("b"), None)
+        self.assertEqual(c.get("a"), 1)
+        self.assertEqual(c.get("c"), 1)
+        self.assertEqual(c.evictions, 1)
+
+    def test_byte_budget(self):
+        c = self._cache(max_size=100, max_bytes=10)
+        c.update("a", 4)
+        c.update("b", 4)
+        c.update("c", 4)
+
+        r = c.report()
+        self.assertEqual(r["size"], 2)
+        self.assertEqual(r["nbytes"], 8)
+        self.assertEqual(c.get("a"), None)
+
+    def test_ttl(self):
+        c = self._cache(ttl=10)
+        c.update("a", 1)
+        self.clock.t = 5
+        c.update("b", 1)
+
+        self.clock.t = 12
+        c.clean()
+        self.assertEqual(c.get("a"), None)
+        self.assertEqual(c.get("b"), 1)
+        self.assertEqual(c.expirations, 1)
+
+    def test_stats(self):
+        c = self._cache()
+        c.update("a", 1)
+        c.get("a")
+        c.get("b")
+
+        r = c.report()
+        self.assertEqual(r["hits"], 1)
+        self.assertEqual(r["misses"], 1)
+        self.assertEqual(r["hit_rate"], 0.5)
+
+    def test_remove(self):
+        c = self._cache(max_bytes=100)
+        c.update("a", 4)
+        c.remove("a")
+        c.remove("a")
+        self.assertEqual(c.report()["nbytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
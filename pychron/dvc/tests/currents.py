@@ -0,0 +1,166 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from uncertainties import ufloat
+
+from pychron.dvc.dvc import DVC
+from pychron.dvc.dvc_database import DVCDatabase, clear_name_id_cache
+from pychron.dvc.dvc_orm import Base, CurrentTbl, ParameterTbl, UnitsTbl
+
+
+class Value(object):
+    def __init__(self, value, error, n=10, units="fA"):
+        self.value = value
+        self.error = error
+        self.n = n
+        self.units = units
+
+
+class Isotope(Value):
+    def __init__(self, name, detector, value):
+        super(Isotope, self).__init__(value, 0.1)
+        self.name = name
+        self.detector = detector
+        self.blank = Value(0.5, 0.01)
+        self.baseline = Value(0.01, 0.001)
+
+    def get_ic_corrected_value(self):
+        return ufloat(self.value, 0.2)
+
+    def get_baseline_corrected_value(self):
+        return ufloat(self.value, 0.3)
+
+    def get_non_detector_corrected_value(self):
+        return ufloat(self.value, 0.4)
+
+
+class ArArConstants(object):
+    age_units = "Ma"
+
+
+class Analysis(object):
+    analysis_type = "unknown"
+    record_id = "a"
+    uuid = "a"
+    runid = "a"
+    age = 10.0
+    age_err = 0.1
+    age_err_wo_j = 0.05
+    arar_constants = ArArConstants()
+
+    def __init__(self):
+        self.isotopes = {
+            "Ar40": Isotope("Ar40", "H1", 100),
+            "Ar39": Isotope("Ar39", "AX", 10),
+        }
+        self.isotope_keys = list(self.isotopes)
+
+    def iter_isotopes(self):
+        return iter(self.isotopes.values())
+
+    def get_isotope(self, name=None, detector=None):
+        if detector:
+            return next(i for i in self.isotopes.values() if i.detector == detector)
+        return self.isotopes.get(name)
+
+
+class CurrentsTestCase(unittest.TestCase):
+    def setUp(self):
+        clear_name_id_cache()
+        self.root = tempfile.mkdtemp()
+        self.db = DVCDatabase(kind="sqlite", path=os.path.join(self.root, "test.db"))
+        self.db.connect()
+        with self.db.session_ctx():
+            self.db.create_all(Base.metadata)
+
+    def tearDown(self):
+        self.db.close_session()
+        clear_name_id_cache()
+        shutil.rmtree(self.root)
+
+    def test_resolve_parameters(self):
+        db = self.db
+        with db.session_ctx() as sess:
+            db.add_parameter("Ar40")
+            ids = db.resolve_parameters(["Ar40", "Ar39", "Ar40"])
+            self.assertEqual(len(ids), 2)
+            self.assertEqual(sess.query(ParameterTbl).count(), 2)
+
+            db.commit()
+            self.assertEqual(db.resolve_parameters(["Ar39"]), {"Ar39": ids["Ar39"]})
+            self.assertEqual(sess.query(ParameterTbl).count(), 2)
+
+    def test_resolve_rollback(self):
+        db = self.db
+        with db.session_ctx() as sess:
+            db.resolve_parameters(["X"])
+            db.resolve_parameters(["X"])
+            db.rollback()
+            self.assertEqual(sess.query(ParameterTbl).count(), 0)
+
+            ids = db.resolve_parameters(["X"])
+            self.assertEqual(sess.query(ParameterTbl).get(ids["X"]).name, "X")
+
+            db.commit()
+            # cached once committed
+            sess.query(ParameterTbl).delete()
+            self.assertEqual(db.resolve_parameters(["X"]), ids)
+
+    def test_add_currents(self):
+        db = self.db
+        with db.session_ctx() as sess:
+            an = db.add_analysis(uuid="a")
+            n = db.add_currents(
+                an,
+                [
+                    ("Ar40_intercept", 1.5, 0.1, "fA"),
+                    ("Ar40_n", 10, None, "int"),
+                    ("Ar39_intercept", 2.5, 0.2, "fA"),
+                ],
+            )
+            db.commit()
+
+            self.assertEqual(n, 3)
+            self.assertEqual(sess.query(UnitsTbl).count(), 2)
+
+            cs = sess.query(CurrentTbl).filter(CurrentTbl.analysisID == an.id).all()
+            self.assertEqual(len(cs), 3)
+
+            c = [ci for ci in cs if ci.parameter.name == "Ar40_n"][0]
+            self.assertEqual(c.value, 10)
+            self.assertEqual(c.error, None)
+            self.assertEqual(c.units.name, "int")
+
+    def test_update_matches_generate(self):
+        db = self.db
+        dvc = DVC(bind=False)
+        dvc.db = db
+        dvc.update_currents_enabled = True
+
+        ai = Analysis()
+        with db.session_ctx() as sess:
+            an = db.add_analysis(uuid="a")
+            dvc._update_current(ai, dban=an)
+            dvc._update_current_blanks(ai, dban=an, update_age=False)
+
+            cs = sess.query(CurrentTbl).filter(CurrentTbl.analysisID == an.id).all()
+            saved = sorted(
+                (c.parameter.name, c.value, c.error, c.units.name) for c in cs
+            )
+
+        expected = sorted(
+            (p, float(v), None if e is None else float(e), u)
+            for p, v, e, u in dvc._get_current_values(ai)
+        )
+        self.assertEqual(saved, expected)
+        self.assertEqual(len(expected), 2 + 2 + 2 * 5 + 2 * 2)
+        self.assertEqual(ai.isotope_keys, ["Ar40", "Ar39"])
+
+    def test_add_currents_empty(self):
+        self.assertEqual(self.db.add_currents(None, []), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from git import Repo
+
+from pychron.dvc import dvc_dump
+from pychron.dvc.meta_repo import MetaRepo
+from pychron.paths import paths
+
+
+class Application(object):
+    use_irradiation_endtime = False
+
+    def get_boolean_preference(self, name, default=False):
+        return self.use_irradiation_endtime
+
+
+class IrradiationInfoCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self._meta_root = paths.meta_root
+        paths.meta_root = os.path.join(self.root, "MetaData")
+
+        repo = Repo.init(paths.meta_root)
+        repo.git.config("user.name", "test")
+        repo.git.config("user.email", "test@example.com")
+
+        irrad = os.path.join(paths.meta_root, "NM-300")
+        os.makedirs(os.path.join(irrad, "productions"))
+        self._dump_level(1.0)
+        dvc_dump({"A": "TRIGA"}, os.path.join(irrad, "productions.json"))
+        dvc_dump({}, os.path.join(irrad, "productions", "TRIGA.json"))
+        with open(os.path.join(irrad, "chronology.txt"), "w") as wfile:
+            wfile.write("1.000,2026-01-01 10:00:00,2026-01-01 12:00:00\n")
+
+        repo.git.add(".")
+        repo.git.commit("-m", "initial")
+
+        self.meta_repo = MetaRepo(application=Application())
+        self.meta_repo.open_repo(paths.meta_root)
+
+    def tearDown(self):
+        paths.meta_root = self._meta_root
+        shutil.rmtree(self.root)
+
+    def _dump_level(self, j):
+        p = os.path.join(paths.meta_root, "NM-300", "A.json")
+        dvc_dump({"z": 0, "positions": [{"position": 1, "j": j}]}, p)
+        return p
+
+    def _get_info(self):
+        return self.meta_repo.get_irradiation_info(
+            [("NM-300", "A")], flux_history=False
+        )
+
+    def test_uncommitted_flux(self):
+        fluxes, _, _, _ = self._get_info()
+        self.assertEqual(fluxes["NM-300"]["A"][0]["j"], 1.0)
+
+        p = self._dump_level(2.0)
+        # make sure the change is visible on filesystems with coarse mtimes
+        st = os.stat(p)
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        fluxes, _, _, _ = self._get_info()
+        self.assertEqual(fluxes["NM-300"]["A"][0]["j"], 2.0)
+
+    def test_cached(self):
+        a = self._get_info()
+        b = self._get_info()
+        self.assertIs(a[2]["NM-300"], b[2]["NM-300"])
+        self.assertIs(a[1]["NM-300"]["A"], b[1]["NM-300"]["A"])
+
+    def test_use_irradiation_endtime(self):
+        _, _, chronologies, _ = self._get_info()
+        self.assertFalse(chronologies["NM-300"].use_irradiation_endtime)
+
+        self.meta_repo.application.use_irradiation_endtime = True
+        _, _, chronologies, _ = self._get_info()
+        self.assertTrue(chronologies["NM-300"].use_irradiation_endtime)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+import os
+import shutil
+import tempfile
+import unittest
+from threading import Event, Thread
+
+from git import Repo
+
+from pychron.dvc.persistence_worker import (
+    PersistenceJournal,
+    PersistenceWorker,
+    coalesce_commits,
+    get_persistence_worker,
+)
+from pychron.git_archive.repo_manager import get_repository_lock
+
+
+class FakeDVC(object):
+    def __init__(self, error=None, event=None):
+        self.calls = []
+        self.error = error
+        self.event = event
+
+    def push_repository(self, repo):
+        # the repository lock is not held while pushing
+        ret = []
+
+        def acquire():
+            lock = get_repository_lock(repo.path)
+            if lock.acquire(blocking=False):
+                lock.release()
+                ret.append(True)
+
+        t = Thread(target=acquire)
+        t.start()
+        t.join()
+        if not ret:
+            raise AssertionError("repository locked while pushing")
+
+        if self.event:
+            self.event.wait(30)
+        if self.error:
+            raise self.error
+        self.calls.append("push")
+
+    def meta_pull(self, **kw):
+        self.calls.append("meta_pull")
+
+    def meta_commit(self, msg):
+        self.calls.append(msg)
+
+    def meta_push(self):
+        self.calls.append("meta_push")
+
+
+class Worker(PersistenceWorker):
+    retry_period = 0
+    max_retries = 2
+    failure = None
+
+    def _notify_failure(self, msg):
+        self.failure = msg
+
+
+class PersistenceWorkerTestCase(unittest.TestCase):
+    def setUp(self):
+        self._root = tempfile.mkdtemp()
+        self.repo_root = os.path.join(self._root, "Repo")
+        self.repo = Repo.init(self.repo_root)
+        self.journal = PersistenceJournal(os.path.join(self._root, "journal"))
+        self.dvc = FakeDVC()
+
+    def tearDown(self):
+        shutil.rmtree(self._root)
+
+    def _entry(self, runid, push=True):
+        p = os.path.join(self.repo_root, "{}.json".format(runid))
+        with open(p, "w") as wfile:
+            wfile.write(runid)
+
+        return {
+            "runid": runid,
+            "repository": self.repo_root,
+            "commits": [["<COLLECTION>", [p]], ["<BLANKS> preceding {}".format(runid), [p]]],
+            "push": push,
+            "committed": False,
+        }
+
+    def test_journal(self):
+        a = self.journal.add({"runid": "a"})
+        self.journal.add({"runid": "b"})
+        self.assertEqual([e["runid"] for _, e in self.journal.entries()], ["a", "b"])
+
+        self.journal.remove(a)
+        self.assertEqual(self.journal.count(), 1)
+
+    def test_coalesce(self):
+        commits = coalesce_commits([self._entry("a"), self._entry("b")])
+        self.assertEqual(
+            [msg for msg, _ in commits],
+            ["<COLLECTION>", "<BLANKS> preceding a", "<BLANKS> preceding b"],
+        )
+        self.assertEqual(len(commits[0][1]), 2)
+
+    def test_replay(self):
+        # entries journaled before the worker starts e.g. by a previous session
+        self.journal.add(self._entry("a"))
+        self.journal.add(self._entry("b"))
+
+        worker = PersistenceWorker(self.dvc, self.journal)
+        worker.start()
+        self.assertTrue(worker.wait(timeout=30))
+        worker.stop()
+
+        msgs = [c.message for c in self.repo.iter_commits()]
+        self.assertEqual(msgs.count("<COLLECTION>"), 1)
+        self.assertEqual(len(msgs), 3)
+        self.assertEqual(
+            self.dvc.calls,
+            ["push", "meta_pull", "repo updated for analysis a, b", "meta_push"],
+        )
+
+    def test_committed_not_recommitted(self):
+        e = self._entry("a")
+        e["committed"] = True
+        self.journal.add(e)
+
+        worker = PersistenceWorker(self.dvc, self.journal)
+        worker.start()
+        self.assertTrue(worker.wait(timeout=30))
+        worker.stop()
+
+        self.assertFalse(self.repo.head.is_valid())
+        self.assertIn("push", self.dvc.calls)
+
+    def test_bounded_retries(self):
+        self.dvc.error = OSError("remote unavailable")
+        worker = Worker(self.dvc, self.journal)
+
+        self.assertTrue(worker.submit(self._entry("a")))
+        self.assertFalse(worker.wait(timeout=30))
+        worker.stop(timeout=30)
+
+        self.assertIn("remote unavailable", worker.failure)
+        self.assertEqual(worker.error, worker.failure)
+        self.assertFalse(worker._thread.is_alive())
+        # entries are kept for the next start
+        self.assertEqual(self.journal.count(), 1)
+
+        # a failed worker is not restarted by a new run
+        self.assertFalse(worker.submit(self._entry("b")))
+        self.assertEqual(self.journal.count(), 2)
+
+        self.dvc.error = None
+        worker.start()
+        self.assertTrue(worker.wait(timeout=30))
+        worker.stop(timeout=30)
+        self.assertIsNone(worker.error)
+
+    def test_backlog_timeout(self):
+        evt = Event()
+        self.dvc.event = evt
+        worker = Worker(self.dvc, self.journal)
+        try:
+            self.assertTrue(worker.submit(self._entry("a")))
+            self.assertFalse(
+                worker.submit(self._entry("b"), max_backlog=1, timeout=0.1)
+            )
+        finally:
+            evt.set()
+
+        self.assertTrue(worker.wait(timeout=30))
+        worker.stop(timeout=30)
+
+    def test_stop_joins(self):
+        evt = Event()
+        self.dvc.event = evt
+        worker = Worker(self.dvc, self.journal)
+        worker.submit(self._entry("a"))
+
+        evt.set()
+        worker.stop(timeout=30)
+        self.assertFalse(worker._thread.is_alive())
+
+    def test_shared_worker(self):
+        root = os.path.join(self._root, "journal")
+        a = get_persistence_worker(self.dvc, root)
+        b = get_persistence_worker(FakeDVC(), os.path.join(root, ""))
+        self.assertIs(a, b)
+        self.assertIsNot(a, get_persistence_worker(self.dvc, self._root))
+
+
+if __name__ == "__main__":
+    unittest.main()
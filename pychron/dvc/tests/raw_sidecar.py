@@ -0,0 +1,90 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+from pychron.core.helpers.binpack import encode_blob, unpack
+from pychron.dvc import dvc_dump
+from pychron.dvc.raw_sidecar import build_sidecar, load_raw, sidecar_path
+from pychron.paths import paths
+
+
+def make_blob(xs, ys):
+    return encode_blob(b"".join(struct.pack(">ff", x, y) for x, y in zip(xs, ys)))
+
+
+class RawSidecarTestCase(unittest.TestCase):
+    def setUp(self):
+        self._root = tempfile.mkdtemp()
+        self._odvc_dir = paths.dvc_dir
+        self._osidecar_dir = paths.raw_sidecar_dir
+
+        paths.dvc_dir = self._root
+        paths.raw_sidecar_dir = os.path.join(self._root, "sidecars")
+
+        d = os.path.join(self._root, "repositories", "Repo", "123", ".data")
+        os.makedirs(d)
+        self.data_path = os.path.join(d, "12345-01A.dat.json")
+
+        self.xs = [0.1 * i for i in range(25)]
+        self.ys = [10.0 + i for i in range(25)]
+        jd = {
+            "signals": [
+                {"isotope": "Ar40", "detector": "H1", "blob": make_blob(self.xs, self.ys)}
+            ],
+            "baselines": [
+                {"isotope": "Ar40", "detector": "H1", "blob": make_blob(self.xs, self.ys[::-1])}
+            ],
+            "sniffs": [{"isotope": "Ar40", "detector": "H1", "blob": ""}],
+        }
+        dvc_dump(jd, self.data_path)
+
+    def tearDown(self):
+        paths.dvc_dir = self._odvc_dir
+        paths.raw_sidecar_dir = self._osidecar_dir
+        shutil.rmtree(self._root)
+
+    def test_no_sidecar(self):
+        self.assertIsNone(load_raw(self.data_path))
+
+    def test_sidecar_path(self):
+        p = sidecar_path(self.data_path)
+        self.assertEqual(
+            p,
+            os.path.join(
+                paths.raw_sidecar_dir, "repositories", "Repo", "123", ".data", "12345-01A.rdat"
+            ),
+        )
+
+    def test_round_trip(self):
+        self.assertTrue(build_sidecar(self.data_path))
+        jd = load_raw(self.data_path)
+
+        sd = jd["signals"][0]
+        self.assertEqual(sd["isotope"], "Ar40")
+        self.assertEqual(sd["detector"], "H1")
+
+        xs, ys = unpack(make_blob(self.xs, self.ys), decode=True)
+        self.assertEqual(list(sd["xs"]), list(xs))
+        self.assertEqual(list(sd["ys"]), list(ys))
+
+        bd = jd["baselines"][0]
+        self.assertEqual(list(bd["ys"]), list(ys[::-1]))
+
+        self.assertIsNone(jd["sniffs"][0]["xs"])
+
+    def test_not_rebuilt(self):
+        self.assertTrue(build_sidecar(self.data_path))
+        self.assertFalse(build_sidecar(self.data_path))
+        self.assertTrue(build_sidecar(self.data_path, force=True))
+
+    def test_stale(self):
+        build_sidecar(self.data_path)
+        st = os.path.getmtime(sidecar_path(self.data_path))
+        os.utime(self.data_path, (st + 10, st + 10))
+        self.assertIsNone(load_raw(self.data_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from git import Repo
+
+from pychron.dvc.dvc import DVC
+from pychron.paths import paths
+
+
+class SyncReposTestCase(unittest.TestCase):
+    names = ("RepoA", "RepoB", "RepoC")
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self._repository_dataset_dir = paths.repository_dataset_dir
+        paths.repository_dataset_dir = os.path.join(self.root, "repositories")
+        os.mkdir(paths.repository_dataset_dir)
+
+        self.upstreams = {}
+        for name in self.names:
+            remote = os.path.join(self.root, "remotes", "{}.git".format(name))
+            Repo.init(remote, bare=True)
+
+            upstream = Repo.clone_from(remote, os.path.join(self.root, "upstream", name))
+            self._configure(upstream)
+            self._push(upstream, "initial")
+            self.upstreams[name] = upstream
+
+            self._configure(
+                Repo.clone_from(remote, os.path.join(paths.repository_dataset_dir, name))
+            )
+
+        self.dvc = DVC(bind=False)
+        self.dvc.use_auto_pull = True
+
+    def tearDown(self):
+        paths.repository_dataset_dir = self._repository_dataset_dir
+        shutil.rmtree(self.root)
+
+    def _configure(self, repo):
+        repo.git.config("user.name", "test")
+        repo.git.config("user.email", "test@example.com")
+        return repo
+
+    def _push(self, repo, text):
+        p = os.path.join(repo.working_dir, "data.txt")
+        with open(p, "w") as wfile:
+            wfile.write(text)
+        repo.index.add([p])
+        repo.index.commit(text)
+        repo.git.push("origin", "HEAD:master")
+        return repo.head.commit.hexsha
+
+    def _local_head(self, name):
+        return Repo(os.path.join(paths.repository_dataset_dir, name)).head.commit.hexsha
+
+    def test_sync(self):
+        heads = {name: self._push(r, "update") for name, r in self.upstreams.items()}
+
+        failed = self.dvc.sync_repos(self.names, nthreads=3)
+        self.assertEqual(failed, [])
+        for name in self.names:
+            self.assertEqual(self._local_head(name), heads[name])
+
+    def test_failure(self):
+        repo = Repo(os.path.join(paths.repository_dataset_dir, "RepoB"))
+        repo.git.remote("set-url", "origin", os.path.join(self.root, "missing.git"))
+        head = self._push(self.upstreams["RepoA"], "update")
+
+        failed = self.dvc.sync_repos(self.names, nthreads=3)
+        self.assertEqual(failed, ["RepoB"])
+        self.assertEqual(self._local_head("RepoA"), head)
+
+    def test_pull_frequency(self):
+        self.dvc.sync_repos(self.names, pull_frequency=60, nthreads=3)
+        for r in self.upstreams.values():
+            self._push(r, "update")
+
+        old = {name: self._local_head(name) for name in self.names}
+        self.dvc.sync_repos(self.names, pull_frequency=60, nthreads=3)
+        for name in self.names:
+            self.assertEqual(self._local_head(name), old[name])
+
+        self.dvc.clear_pull_cache()
+        self.dvc.sync_repos(self.names, pull_frequency=60, nthreads=3)
+        for name in self.names:
+            self.assertNotEqual(self._local_head(name), old[name])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -82,6 +82,7 @@ class AnalysisTable(ColumnSorterMixin, SelectSameMixin):
     scroll_to_row = Event
     scroll_to_bottom = Event
     scroll_to_top = Event
+    scrolled_to_end = Event
 
     refresh_needed = Event
     tabular_adapter = Instance(AnalysisAdapter)
@@ -197,13 +198,14 @@ class AnalysisTable(ColumnSorterMixin, SelectSameMixin):
         self.oanalyses = [ai for ai in self.oanalyses if ai.tag != "invalid"]
         self._analysis_filter_changed(self.analysis_filter)
 
-    def add_analyses(self, ans):
+    def add_analyses(self, ans, scroll=True):
         items = self.analyses
         items.extend(ans)
         self.oanalyses = self.analyses = sort_items(items)
         self.calculate_dts(self.analyses)
         # self.scroll_to_row = len(self.analyses) - 1
-        self._auto_scroll()
+        if scroll:
+            self._auto_scroll()
 
     def clear_non_frozen(self):
         self.analyses = [a for a in self.analyses if a.frozen]
@@ -53,7 +53,10 @@ class AnalysisTableConfigurer(TableConfigurer):
                 Tabbed(get_columns_group(), widths_grp),
                 Item("omit_invalid", label="Hide Invalid Analyses"),
                 Item(
-                    "limit", tooltip="Limit number of displayed analyses", label="Limit"
+                    "limit",
+                    tooltip="Number of analyses loaded at a time. The next "
+                    "analyses are loaded when the table is scrolled to the end",
+                    label="Page Size",
                 ),
                 label="Limiting",
             ),
@@ -43,13 +43,13 @@ from traitsui.tabular_adapter import TabularAdapter
 
 from pychron.column_sorter_mixin import ColumnSorterMixin
 from pychron.core.fuzzyfinder import fuzzyfinder
-from pychron.core.progress import progress_loader
 from pychron.core.ui.table_configurer import SampleTableConfigurer
 from pychron.envisage.browser import progress_bind_records
 from pychron.envisage.browser.adapters import LabnumberAdapter
 from pychron.envisage.browser.record_views import (
     ProjectRecordView,
     LabnumberRecordView,
+    LabnumberRowRecordView,
     PrincipalInvestigatorRecordView,
     LoadRecordView,
 )
@@ -244,6 +244,7 @@ class BaseBrowserModel(PersistenceLoggable, ColumnSorterMixin):
 
     _suppress_post_update = False
     _suppress_load_labnumbers = False
+    _analyses_page = None
 
     def reattach(self):
         pass
@@ -452,13 +453,9 @@ class BaseBrowserModel(PersistenceLoggable, ColumnSorterMixin):
         self.set_samples(sams, sel)
 
     def _load_sample_record_views(self, lns):
-        def func(li, prog, i, n):
-            if prog:
-                prog.change_message("Loading Labnumber {}".format(li.identifier))
-            return LabnumberRecordView(li)
-
-        sams = progress_loader(lns, func, step=25)
-        return sams
+        ids = [li.id for li in lns]
+        rows = {r[0]: r for r in self.db.get_labnumber_record_rows(ids)}
+        return [LabnumberRowRecordView(rows[i]) for i in ids if i in rows]
 
     def _make_labnumbers(self):
         # dont query if analysis_types enabled but not analysis type specified
@@ -484,7 +481,7 @@ class BaseBrowserModel(PersistenceLoggable, ColumnSorterMixin):
     def _retrieve_analyses(
         self,
         samples=None,
-        limit=500,
+        limit=None,
         order="asc",
         low_post=None,
         high_post=None,
@@ -495,8 +492,42 @@ class BaseBrowserModel(PersistenceLoggable, ColumnSorterMixin):
         loads=None,
         make_records=True,
         analysis_types=None,
+        page=False,
     ):
+        """
+        if ``page`` only the first ``limit`` analyses are retrieved and
+        ``_retrieve_next_analyses`` retrieves the following ``limit``. pages are keyed by the
+        (timestamp, id) of the last analysis of the previous page so every page is as fast to
+        retrieve as the first. the paging state is only read and written if ``page``
+        """
+        kw = dict(
+            samples=samples,
+            limit=limit,
+            order=order,
+            low_post=low_post,
+            high_post=high_post,
+            exclude_uuids=exclude_uuids,
+            include_invalid=include_invalid,
+            mass_spectrometers=mass_spectrometers,
+            repositories=repositories,
+            loads=loads,
+            make_records=make_records,
+            analysis_types=analysis_types,
+        )
+        if page:
+            self._analyses_page = None
+        return self._retrieve_analyses_page(kw, page=page)
+
+    def _retrieve_next_analyses(self):
+        if self._analyses_page:
+            kw, after = self._analyses_page
+            return self._retrieve_analyses_page(kw, after=after, page=True)
+
+    def _retrieve_analyses_page(self, kw, after=None, page=False):
         db = self.db
+        samples = kw["samples"]
+        limit = kw["limit"]
+        make_records = kw["make_records"]
         if samples:
             lns = [si.labnumber for si in samples]
             self.debug("retrieving identifiers={}".format(",".join(lns)))
@@ -505,30 +536,41 @@ class BaseBrowserModel(PersistenceLoggable, ColumnSorterMixin):
             #     low_post = min(lps) if lps else None
             ans, tc = db.get_labnumber_analyses(
                 lns,
-                order=order,
-                low_post=low_post,
-                high_post=high_post,
+                order=kw["order"],
+                low_post=kw["low_post"],
+                high_post=kw["high_post"],
                 limit=limit,
-                exclude_uuids=exclude_uuids,
-                include_invalid=include_invalid,
-                mass_spectrometers=mass_spectrometers,
-                repositories=repositories,
-                loads=loads,
+                after=after,
+                bind=make_records,
+                exclude_uuids=kw["exclude_uuids"],
+                include_invalid=kw["include_invalid"],
+                mass_spectrometers=kw["mass_spectrometers"],
+                repositories=kw["repositories"],
+                loads=kw["loads"],
             )
             self.debug("retrieved analyses n={}".format(tc))
         else:
             self.debug("retrieved analyses by date range")
             ans = db.get_analyses_by_date_range(
-                low_post,
-                high_post,
-                order=order,
-                mass_spectrometers=mass_spectrometers,
-                repositories=repositories,
+                kw["low_post"],
+                kw["high_post"],
+                order=kw["order"],
+                mass_spectrometers=kw["mass_spectrometers"],
+                repositories=kw["repositories"],
                 limit=limit,
-                analysis_types=analysis_types,
-                loads=loads,
+                after=after,
+                bind=make_records,
+                analysis_types=kw["analysis_types"],
+                loads=kw["loads"],
             )
 
+        # unpaged retrievals, e.g. get_selection, leave the paging of the displayed table alone
+        if page:
+            self._analyses_page = None
+            if limit and len(ans) == limit:
+                last = ans[-1]
+                self._analyses_page = kw, (last.timestamp, last.id)
+
         if make_records:
             return self._make_records(ans)
         else:
@@ -17,6 +17,8 @@
 # ============= enthought library imports =======================
 from __future__ import absolute_import
 
+from operator import itemgetter
+
 import six
 from sqlalchemy.exc import InternalError
 from traits.api import HasTraits, Str, Date, Long, Bool
@@ -226,6 +228,77 @@ class LabnumberRecordView(RecordView):
         return self.identifier
 
 
+class LabnumberRowRecordView(tuple):
+    """
+    read-only LabnumberRecordView backed by a row from DVCDatabase.get_labnumber_record_rows
+    """
+
+    __slots__ = ()
+
+    sample = ""
+    alt_name = ""
+    low_post = None
+
+    def __new__(cls, row):
+        (
+            _,
+            identifier,
+            position,
+            packet,
+            level,
+            irradiation,
+            name,
+            material,
+            project,
+            lat,
+            lon,
+            elevation,
+            lithology,
+            location,
+            igsn,
+        ) = row
+
+        return tuple.__new__(
+            cls,
+            (
+                identifier or "",
+                "" if position is None else str(position),
+                packet or "",
+                level or "",
+                irradiation or "",
+                name or "",
+                material or "",
+                project or "",
+                lat or 0,
+                lon or 0,
+                elevation or 0,
+                lithology or "",
+                location or "",
+                igsn or "",
+            ),
+        )
+
+    labnumber = property(itemgetter(0))
+    irradiation_pos = property(itemgetter(1))
+    packet = property(itemgetter(2))
+    irradiation_level = property(itemgetter(3))
+    irradiation = property(itemgetter(4))
+    name = property(itemgetter(5))
+    material = property(itemgetter(6))
+    project = property(itemgetter(7))
+    lat = property(itemgetter(8))
+    lon = property(itemgetter(9))
+    elevation = property(itemgetter(10))
+    lithology = property(itemgetter(11))
+    location = property(itemgetter(12))
+    igsn = property(itemgetter(13))
+
+    irradiation_and_level = LabnumberRecordView.irradiation_and_level
+    identifier = LabnumberRecordView.identifier
+    analysis_type = LabnumberRecordView.analysis_type
+    id = LabnumberRecordView.id
+
+
 class NameView(HasTraits):
     name = Str
 
@@ -19,7 +19,7 @@ from operator import attrgetter
 
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
-from traits.api import Str
+from traits.api import Str, on_trait_change
 
 from pychron.envisage.browser.analysis_browser_model import AnalysisBrowserModel
 from pychron.envisage.browser.find_references_config import (
@@ -240,7 +240,7 @@ class SampleBrowserModel(AnalysisBrowserModel):
                 ls = [l.name for l in self.selected_loads]
 
             ans = self._retrieve_analyses(
-                samples=new, loads=ls, low_post=lp, high_post=hp, **kw
+                samples=new, loads=ls, low_post=lp, high_post=hp, page=True, **kw
             )
 
             self.debug(
@@ -250,6 +250,13 @@ class SampleBrowserModel(AnalysisBrowserModel):
 
         self.table.set_analyses(ans, selected_identifiers={ai.identifier for ai in new})
 
+    @on_trait_change("table:scrolled_to_end")
+    def _load_next_analyses(self):
+        ans = self._retrieve_next_analyses()
+        if ans:
+            self.debug("loaded next page of analyses n={}".format(len(ans)))
+            self.table.add_analyses(ans, scroll=False)
+
     # private
     def _load_recent(self):
         from pychron.envisage.browser.recent_view import RecentView
@@ -320,6 +320,7 @@ class AnalysisGroupView(GroupView):
                         scroll_to_row="table.scroll_to_row",
                         scroll_to_bottom="table.scroll_to_bottom",
                         scroll_to_top="table.scroll_to_top",
+                        scrolled_to_end="table.scrolled_to_end",
                         stretch_last_section=False,
                     ),
                     visible_when="not use_quick_recall",
@@ -340,6 +341,7 @@ class AnalysisGroupView(GroupView):
                             scroll_to_row="table.scroll_to_row",
                             scroll_to_bottom="table.scroll_to_bottom",
                             scroll_to_top="table.scroll_to_top",
+                            scrolled_to_end="table.scrolled_to_end",
                             stretch_last_section=False,
                         ),
                     ),
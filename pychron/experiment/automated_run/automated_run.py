@@ -1610,7 +1610,11 @@ class AutomatedRun(Loggable):
         self.measuring = True
         self._persister_action("trait_set", save_enabled=True)
 
-        if script.execute():
+        result = script.execute()
+        if self.isotope_group:
+            self.isotope_group.freeze_data()
+
+        if result:
             # mem_log('post measurement execute')
             self.heading("Measurement Finished")
             self.measuring = False
@@ -2772,6 +2776,9 @@ anaylsis_type={}
         with self.persister.writer_ctx():
             m.measure()
 
+        if m.timing_stats and self.persistence_spec:
+            self.persistence_spec.collection_timing[grpname] = m.timing_stats
+
         # mem_log('post measure')
         if m.terminated:
             self.debug("measurement terminated")
@@ -0,0 +1,86 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+import time
+
+
+class CadenceScheduler(object):
+    """
+    Schedule measurement counts on absolute deadlines ``t0 + k*period`` using a monotonic clock.
+
+    Waiting for ``period`` after every count lets processing time accumulate. Waiting until the
+    next deadline keeps the count spacing fixed regardless of how long a count took to process.
+
+    If a count overruns its deadline the scheduler resynchronizes, i.e. the next deadline is
+    ``now + period``, so the following count still integrates for a full period
+    """
+
+    def __init__(self, period, clock=time.monotonic):
+        self.period = period
+        self._clock = clock
+        self._deadline = None
+
+        self.n = 0
+        self.overruns = 0
+        self.max_overrun = 0
+        self._jitter_sum = 0
+        self.max_jitter = 0
+
+    def start(self):
+        self._deadline = self._clock() + self.period
+
+    def wait(self, evt):
+        """
+        block until the next deadline or until ``evt`` is set
+
+        :param evt: threading.Event
+        """
+        if self._deadline is None:
+            self.start()
+
+        now = self._clock()
+        dt = self._deadline - now
+        if dt < 0:
+            self.overruns += 1
+            self.max_overrun = max(self.max_overrun, -dt)
+            self._deadline = now + self.period
+            dt = self.period
+
+        if evt.wait(dt):
+            return
+
+        jitter = abs(self._clock() - self._deadline)
+        self.n += 1
+        self._jitter_sum += jitter
+        self.max_jitter = max(self.max_jitter, jitter)
+
+        self._deadline += self.period
+
+    @property
+    def mean_jitter(self):
+        return self._jitter_sum / self.n if self.n else 0
+
+    def report(self):
+        return {
+            "n": self.n,
+            "period": self.period,
+            "mean_jitter": self.mean_jitter,
+            "max_jitter": self.max_jitter,
+            "overruns": self.overruns,
+            "max_overrun": self.max_overrun,
+        }
+
+
+# ============= EOF =============================================
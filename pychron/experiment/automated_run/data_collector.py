@@ -16,13 +16,15 @@
 
 import time
 from datetime import datetime
-from threading import Event
+from queue import Queue
+from threading import Event, Thread
 
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
-from traits.api import Any, List, CInt, Int, Bool, Enum, Str, Instance
+from traits.api import Any, List, CInt, Int, Bool, Enum, Str, Instance, Float
 
 from pychron.envisage.consoleable import Consoleable
+from pychron.experiment.automated_run.cadence import CadenceScheduler
 from pychron.pychron_constants import AR_AR, SIGNAL, BASELINE, WHIFF, SNIFF
 
 
@@ -71,6 +73,10 @@ class DataCollector(Consoleable):
     not_intensity_count = 0
     trigger = None
     plot_panel_update_period = Int(1)
+    plot_refit_interval = Float(0)
+    use_fixed_cadence = Bool(False)
+    max_queue_size = Int(100)
+    timing_stats = None
 
     def __init__(self, *args, **kw):
         super(DataCollector, self).__init__(*args, **kw)
@@ -79,6 +85,16 @@ class DataCollector(Consoleable):
             "plot_panel_update_period",
             "pychron.experiment.plot_panel_update_period",
         )
+        bind_preference(
+            self,
+            "plot_refit_interval",
+            "pychron.experiment.plot_refit_interval",
+        )
+        bind_preference(
+            self,
+            "use_fixed_cadence",
+            "pychron.experiment.use_fixed_cadence_measurement",
+        )
 
     # def wait(self):
     #     st = time.time()
@@ -141,54 +157,95 @@ class DataCollector(Consoleable):
 
         self._evt = evt = Event()
 
-        # self._queue = q = Queue()
-        # def writefunc():
-        #     writer = self.data_writer
-        #     while not q.empty() or not evt.wait(10):
-        #         dets = self.detectors
-        #         while not q.empty():
-        #             x, keys, signals = q.get()
-        #             writer(dets, x, keys, signals)
-        #
-        # # only write to file every 10 seconds and not on main thread
-        # t = Thread(target=writefunc)
-        # # t.setDaemon(True)
-        # t.start()
-
         self.debug("measurement period (ms) = {}".format(self.period_ms))
         period = self.period_ms * 0.001
-        i = 1
-
-        while not evt.is_set():
-            result = self._check_iteration(i)
-            if not result:
-                if not self._pre_trigger_hook():
-                    break
 
-                if self.trigger:
-                    self.trigger()
+        plot_panel = self.plot_panel
+        if plot_panel:
+            plot_panel.set_refit_interval(self.plot_refit_interval)
+
+        scheduler = None
+        oqueue = self._queue
+        consumer = None
+        if self.use_fixed_cadence:
+            self.debug("using fixed cadence measurement")
+            scheduler = CadenceScheduler(period)
+
+            # write and plot data off the acquisition thread
+            self._queue = Queue(maxsize=self.max_queue_size)
+            consumer = Thread(
+                target=self._consume, args=(self._queue,), name="DataCollectorConsumer"
+            )
+            consumer.start()
+            scheduler.start()
 
-                evt.wait(period)
-                self.automated_run.plot_panel.counts = i
-                inc = self._iter_hook(i)
-                if inc is None:
+        i = 1
+        try:
+            while not evt.is_set():
+                result = self._check_iteration(i)
+                if not result:
+                    if not self._pre_trigger_hook():
+                        break
+
+                    if self.trigger:
+                        self.trigger()
+
+                    if scheduler:
+                        scheduler.wait(evt)
+                    else:
+                        evt.wait(period)
+
+                    self.automated_run.plot_panel.counts = i
+                    inc = self._iter_hook(i)
+                    if inc is None:
+                        break
+
+                    self._post_iter_hook(i)
+                    if inc:
+                        i += 1
+                else:
+                    if result == "cancel":
+                        self.canceled = True
+                    elif result == "terminate":
+                        self.terminated = True
                     break
+        finally:
+            evt.set()
+            if consumer:
+                self.debug("waiting for data consumer to finish")
+                self._queue.put(None)
+                consumer.join()
+            self._queue = oqueue
+
+        if plot_panel and self.plot_refit_interval:
+            # refits may have been skipped for the last counts
+            plot_panel.update(force=True)
+
+        if scheduler:
+            self.timing_stats = scheduler.report()
+            self.debug(
+                "cadence n={n} mean jitter={mean_jitter:0.4f}s max jitter={max_jitter:0.4f}s "
+                "overruns={overruns} max overrun={max_overrun:0.4f}s".format(
+                    **self.timing_stats
+                )
+            )
+        else:
+            self.timing_stats = None
 
-                self._post_iter_hook(i)
-                if inc:
-                    i += 1
-            else:
-                if result == "cancel":
-                    self.canceled = True
-                elif result == "terminate":
-                    self.terminated = True
-                break
+        self.debug("measurement finished")
 
-        evt.set()
-        # self.debug('waiting for write to finish')
-        # t.join()
+    def _consume(self, queue):
+        while 1:
+            item = queue.get()
+            if item is None:
+                break
 
-        self.debug("measurement finished")
+            i, pairs, x, keys, signals = item
+            try:
+                self.data_writer(pairs, x, keys, signals)
+                self._plot_data(i, x, keys, signals, pairs)
+            except BaseException as e:
+                self.warning("failed writing/plotting count {}. {}".format(i, e))
 
     def _pre_trigger_hook(self):
         return True
@@ -217,7 +274,12 @@ class DataCollector(Consoleable):
         if k is not None and s is not None:
             x = self._get_time(t)
             self._save_data(x, k, s)
-            self._plot_data(i, x, k, s)
+            if self._queue is not None:
+                # peak hopping may re-pair detectors and isotopes before this count is
+                # consumed. snapshot the pairing now
+                self._queue.put((i, self._get_detector_isotopes(), x, k, s))
+            else:
+                self._plot_data(i, x, k, s)
 
         return inc
 
@@ -259,8 +321,8 @@ class DataCollector(Consoleable):
             return data
 
     def _save_data(self, x, keys, signals):
-        # self._queue.put((x, keys, signals))
-        self.data_writer(self.detectors, x, keys, signals)
+        if self._queue is None:
+            self.data_writer(self._get_detector_isotopes(), x, keys, signals)
 
         # update arar_age
         if self.is_baseline and self.for_peak_hop:
@@ -311,18 +373,24 @@ class DataCollector(Consoleable):
             d = next((di for di in self.detectors if di.name == d), None)
         return d
 
-    def _plot_data(self, cnt, x, keys, signals):
+    def _get_detector_isotopes(self):
+        return [(d, d.isotope) for d in self.detectors]
+
+    def _plot_data(self, cnt, x, keys, signals, pairs=None):
+        if pairs is None:
+            pairs = self._get_detector_isotopes()
+
+        pairs = {d.name: (d, iso) for d, iso in pairs}
         for dn, signal in zip(keys, signals):
-            det = self._get_detector(dn)
-            if det:
-                self._set_plot_data(cnt, det, x, signal)
+            pair = pairs.get(dn)
+            if pair:
+                det, iso = pair
+                self._set_plot_data(cnt, det, iso, x, signal)
 
         if not cnt % self.plot_panel_update_period:
             self.plot_panel.update()
 
-    def _set_plot_data(self, cnt, det, x, signal):
-
-        iso = det.isotope
+    def _set_plot_data(self, cnt, det, iso, x, signal):
         detname = det.name
         ypadding = det.ypadding
 
@@ -368,6 +436,9 @@ class DataCollector(Consoleable):
                 plotid=pid,
                 update_y_limits=True,
                 ypadding=ypadding,
+                streaming=True,
+                # regressions use the plotted data. only decimate the equilibration graph
+                decimate=g is self.plot_panel.sniff_graph,
             )
             if fit:
                 g.set_fit(fit, plotid=pid, series=fit_series)
@@ -387,10 +458,10 @@ class DataCollector(Consoleable):
     #         if tripped.use_truncation:
     #             return self._set_run_truncated()
 
-    def _check_conditionals(self, conditionals, cnt):
+    def _check_conditionals(self, conditionals, cnt, cache=None):
         self.err_message = ""
         for ti in conditionals:
-            if ti.check(self.automated_run, self._data, cnt):
+            if ti.check(self.automated_run, self._data, cnt, cache=cache):
                 m = "Conditional tripped: {}".format(ti.to_string())
                 self.info(m)
                 self.err_message = m
@@ -481,6 +552,8 @@ class DataCollector(Consoleable):
             return self._set_truncated()
 
         if self.check_conditionals:
+            # values (e.g. an isotope's slope) computed once per count and shared by all conditionals
+            cache = {}
             for tag, func, conditionals in (
                 (
                     "modification",
@@ -501,7 +574,7 @@ class DataCollector(Consoleable):
                 if tag == "equilibration" and self.collection_kind != SNIFF:
                     continue
 
-                tripped = self._check_conditionals(conditionals, i)
+                tripped = self._check_conditionals(conditionals, i, cache)
                 if tripped:
                     self.info(
                         "{} conditional {}. measurement iteration executed {}/{} counts".format(
@@ -304,14 +304,17 @@ class AutomatedRunPersister(BasePersister):
     def get_data_writer(self, grpname):
         """
         grpname should be a str such as "signal", "baseline",etc
-        return a closure for writing the data
+        return a closure for writing the data.
+
+        the closure takes a list of (detector, isotope) pairs so the pairing used is
+        the one at collection time
 
         :param grpname: str
         :return: function
         """
         tables = {}
 
-        def write_data(dets, x, keys, signals):
+        def write_data(pairs, x, keys, signals):
             # todo: test whether saving data to h5 in real time is expansive
 
             # disable H5 data writer
@@ -319,14 +322,14 @@ class AutomatedRunPersister(BasePersister):
             # return
 
             dm = self.data_manager
-            for det in dets:
+            for det, iso in pairs:
                 k = det.name
                 try:
                     if k in keys:
                         if grpname == "baseline":
                             grp = "/{}".format(grpname)
                         else:
-                            grp = "/{}/{}".format(grpname, det.isotope)
+                            grp = "/{}/{}".format(grpname, iso)
 
                         tag = "{}/{}".format(grp, k)
                         if tag in tables:
@@ -342,7 +345,7 @@ class AutomatedRunPersister(BasePersister):
                 except AttributeError as e:
                     self.debug(
                         "error: {} group:{} det:{} iso:{}".format(
-                            e, grpname, k, det.isotope
+                            e, grpname, k, iso
                         )
                     )
 
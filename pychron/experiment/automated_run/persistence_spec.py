@@ -113,6 +113,8 @@ class PersistenceSpec(HasTraits):
     conditionals = List
     tripped_conditional = None
 
+    collection_timing = Dict
+
     grain_polygons = List
 
     power_achieved = Float
@@ -16,6 +16,7 @@
 
 # ============= enthought library imports =======================
 
+import logging
 import os
 import pprint
 
@@ -201,7 +202,7 @@ class BaseConditional(Loggable):
     def to_string(self):
         raise NotImplementedError
 
-    def check(self, run, data, cnt):
+    def check(self, run, data, cnt, cache=None):
         """
         check conditional if cnt is greater than start count
         cnt-start count is greater than 0
@@ -213,13 +214,14 @@ class BaseConditional(Loggable):
         :param run: ``AutomatedRun``
         :param data: 2-tuple. (keys, signals) where keys==detector names, signals== measured intensities
         :param cnt: int
+        :param cache: dict. values shared by all conditionals checked during the same count
         :return: True if check passes. e.i. Write checks to trip on success.
 
         """
         if self._should_check(run, data, cnt):
-            return self._check(run, data, cnt)
+            return self._check(run, data, cnt, cache=cache)
 
-    def _check(self, run, data, cnt):
+    def _check(self, run, data, cnt, cache=None):
         raise NotImplementedError
 
     def _should_check(self, run, data, cnt):
@@ -247,7 +249,12 @@ class AutomatedRunConditional(BaseConditional):
 
     _teststr = None
     _ctx = None
-    value_context = None
+
+    _compiled = None
+    _compiled_teststr = None
+    _codes = None
+    _mapper_code = None
+    _use_std = False
 
     # def __init__(self, attr, teststr,
     # start_count=0,
@@ -268,6 +275,11 @@ class AutomatedRunConditional(BaseConditional):
         s = "{} {}".format(self.teststr, self.message)
         return s
 
+    @property
+    def value_context(self):
+        if self._ctx is not None:
+            return pprint.pformat(self._ctx, width=1)
+
     def to_dict(self):
         d = self._attr_dict()
         d["hash_id"] = self._hash_id(d)
@@ -334,32 +346,32 @@ class AutomatedRunConditional(BaseConditional):
                 cnt_flag = b and c
                 return cnt_flag
 
-    def _check(self, run, data, cnt, verbose=False):
+    def _check(self, run, data, cnt, verbose=False, cache=None):
         """
         make a teststr and context from the run and data
         evaluate the teststr with the context
 
         """
-        teststr, ctx = self._make_context(run, data)
+        teststr, ctx = self._make_context(run, data, cache)
         self._teststr, self._ctx = teststr, ctx
 
-        self.value_context = vc = pprint.pformat(ctx, width=1)
-
-        self.debug("Count: {} testing {}".format(cnt, teststr))
-        if verbose:
-            self.debug(
-                "attribute context {}".format(
-                    pprint.pformat(self._attr_dict(), width=1)
+        debug = self._debug_enabled()
+        if debug:
+            self.debug("Count: {} testing {}".format(cnt, teststr))
+            if verbose:
+                self.debug(
+                    "attribute context {}".format(
+                        pprint.pformat(self._attr_dict(), width=1)
+                    )
                 )
-            )
-        msg = 'evaluate ot="{}" t="{}", ctx="{}"'.format(self.teststr, teststr, vc)
-        self.debug(msg)
+
         if teststr and ctx:
-            if eval(teststr, ctx):
+            # evaluate with a copy. eval adds __builtins__ to the globals dict
+            if eval(self._get_code(teststr), dict(ctx)):
                 self.trips += 1
                 self.debug(
-                    "condition {} is true trips={}/{}".format(
-                        teststr, self.trips, self.ntrips
+                    'condition {} is true trips={}/{} ot="{}", ctx="{}"'.format(
+                        teststr, self.trips, self.ntrips, self.teststr, self.value_context
                     )
                 )
                 if self.trips >= self.ntrips:
@@ -370,23 +382,64 @@ class AutomatedRunConditional(BaseConditional):
             else:
                 self.trips = 0
 
-    def _make_context(self, obj, data):
-        teststr = self.teststr
+    def _debug_enabled(self):
+        logger = self.logger
+        return logger is not None and logger.isEnabledFor(logging.DEBUG)
+
+    def _compile(self):
+        """
+        tokenize the teststr once. returns a list of
+        (ctx key, teststr fragment, value func, operator, needs interpolation)
+        """
+        if self._compiled is None or self._compiled_teststr != self.teststr:
+            teststr = self.teststr
+            compiled = []
+            for ti, oper in tokenize(teststr):
+                ts, attr, func = get_teststr_attr_func(ti)
+
+                attr = attr.replace("(", "_").replace(")", "_")
+                ts = ts.replace("(", "_").replace(")", "_")
+                compiled.append(
+                    (attr, ts, func, oper, bool(INTERPOLATE_REGEX.search(ts)))
+                )
+
+            self._compiled = compiled
+            self._compiled_teststr = teststr
+            self._use_std = bool(STD_REGEX.match(teststr))
+            self._codes = {}
+
+        return self._compiled
+
+    def _get_code(self, teststr):
+        try:
+            return self._codes[teststr]
+        except KeyError:
+            code = self._codes[teststr] = compile(teststr, "<conditional>", "eval")
+            return code
+
+    def _make_context(self, obj, data, cache=None):
+        compiled = self._compile()
         ctx = {}
         tt = []
-        for ti, oper in tokenize(teststr):
-            ts, attr, func = get_teststr_attr_func(ti)
-
-            attr = attr.replace("(", "_").replace(")", "_")
-            ts = ts.replace("(", "_").replace(")", "_")
+        window = self.window
+        for attr, ts, func, oper, interpolate in compiled:
+            key = getattr(func, "cache_key", None)
+            if cache is not None and key is not None:
+                key = (key, window)
+                try:
+                    v = cache[key]
+                except KeyError:
+                    v = cache[key] = func(obj, data, window)
+            else:
+                v = func(obj, data, window)
 
-            v = func(obj, data, self.window)
             if v is not None:
-                vv = std_dev(v) if STD_REGEX.match(teststr) else nominal_value(v)
+                vv = std_dev(v) if self._use_std else nominal_value(v)
                 vv = self._map_value(vv)
                 ctx[attr] = vv
 
-                ts = self._interpolate_teststr(ts, obj, data)
+                if interpolate:
+                    ts = self._interpolate_teststr(ts, obj, data)
                 tt.append(ts)
                 if oper:
                     tt.append(oper)
@@ -395,10 +448,17 @@ class AutomatedRunConditional(BaseConditional):
 
     def _map_value(self, vv):
         if self.mapper:
-            m = MAPPER_KEY_REGEX.search(self.mapper)
-            if m:
-                key = m.group(0)
-                vv = eval(self.mapper, {key: vv})
+            if self._mapper_code is None or self._mapper_code[0] != self.mapper:
+                m = MAPPER_KEY_REGEX.search(self.mapper)
+                code = None
+                if m:
+                    code = (m.group(0), compile(self.mapper, "<mapper>", "eval"))
+                self._mapper_code = (self.mapper, code)
+
+            code = self._mapper_code[1]
+            if code:
+                key, code = code
+                vv = eval(code, {key: vv})
         return vv
 
     def _interpolate_teststr(self, ts, obj, data):
@@ -87,6 +87,8 @@ def get_teststr_attr_func(token):
                 v = obj.isotope_group.get_value(attr)
             return v
 
+        func.cache_key = ("value", attr)
+
     if token.startswith("not"):
         if not teststr.startswith("not"):
             teststr = "not {}".format(teststr)
@@ -96,9 +98,11 @@ def get_teststr_attr_func(token):
 
 # wrappers
 def wrapper(fstr, token, ai):
+    code = compile(fstr, "<conditional>", "eval")
+
     def func(obj, data, window):
         return eval(
-            fstr,
+            code,
             {
                 "attr": ai,
                 "aa": obj.isotope_group,
@@ -108,6 +112,8 @@ def wrapper(fstr, token, ai):
             },
         )
 
+    # funcs with the same cache_key return the same value for a given run, data and window
+    func.cache_key = (fstr, ai)
     return func
 
 
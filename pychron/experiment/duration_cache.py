@@ -0,0 +1,186 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= standard library imports ========================
+import hashlib
+import json
+import os
+import time
+
+# ============= local library imports  ==========================
+from pychron.loggable import Loggable
+from pychron.paths import paths
+from pychron.pychron_constants import SCRIPT_NAMES
+
+
+class ScriptDigests(object):
+    """
+    sha1 of the contents of every file in a directory tree.
+
+    a file is only read again if its size or modification time changed
+    """
+
+    def __init__(self):
+        self._files = {}
+
+    def digest(self, root):
+        if not root or not os.path.isdir(root):
+            return ""
+
+        sha1 = hashlib.sha1()
+        for r, ds, fs in os.walk(root):
+            ds[:] = sorted(d for d in ds if not d.startswith("."))
+            for f in sorted(fs):
+                if f.startswith("."):
+                    continue
+
+                p = os.path.join(r, f)
+                d = self._file_digest(p)
+                if d:
+                    sha1.update(os.path.relpath(p, root).encode("utf-8"))
+                    sha1.update(d.encode("utf-8"))
+
+        return sha1.hexdigest()
+
+    def _file_digest(self, p):
+        try:
+            st = os.stat(p)
+        except OSError:
+            return
+
+        stamp = st.st_size, st.st_mtime_ns
+        try:
+            s, d = self._files[p]
+            if s == stamp:
+                return d
+        except KeyError:
+            pass
+
+        with open(p, "rb") as rfile:
+            d = hashlib.sha1(rfile.read()).hexdigest()
+
+        self._files[p] = stamp, d
+        return d
+
+
+class AutomatedRunDurationCache(Loggable):
+    """
+    Persistent cache of estimated run durations.
+
+    A run's estimate is keyed by its script context (script names, duration, cleanup, number
+    of positions, ...) and the contents of the scripts directory. Scripts can gosub into
+    any other script, or load hop files, so the whole tree is hashed rather than only the
+    named scripts. Editing a run only changes that run's key. Editing a script changes every
+    key, and the stale entries age out of the cache.
+
+    An entry also records whether the scripts were executable
+    """
+
+    max_items = 5000
+
+    def __init__(self, path=None, root=None, *args, **kw):
+        super(AutomatedRunDurationCache, self).__init__(*args, **kw)
+        self._path = path
+        self._root = root
+        self._digests = ScriptDigests()
+        self._items = {}
+        self._dirty = False
+        self._tree_digest = ""
+        self.load()
+
+    @property
+    def path(self):
+        return self._path or paths.duration_cache
+
+    @property
+    def root(self):
+        return self._root or paths.scripts_dir
+
+    def refresh(self):
+        """
+        rehash the scripts directory. call once before looking up a set of runs
+        """
+        self._tree_digest = self._digests.digest(self.root)
+
+    def key(self, spec):
+        sha1 = hashlib.sha1()
+        sha1.update(self._tree_digest.encode("utf-8"))
+        sha1.update(spec.script_hash.encode("utf-8"))
+        sha1.update(str(spec.mass_spectrometer).encode("utf-8"))
+        for si in SCRIPT_NAMES:
+            sha1.update(str(getattr(spec, si)).encode("utf-8"))
+        return sha1.hexdigest()
+
+    def get(self, key):
+        """
+        :return: (duration, executable) or None
+        """
+        try:
+            d, e, _ = self._items[key]
+            return d, e
+        except KeyError:
+            pass
+
+    def set(self, key, duration, executable):
+        self._items[key] = (duration, executable, time.time())
+        self._dirty = True
+
+    def load(self):
+        self._items = self._read()
+        self._dirty = False
+
+    def dump(self):
+        """
+        write new entries. entries written by other queues since this cache was loaded are kept
+        """
+        p = self.path
+        if not self._dirty or not p:
+            return
+
+        items = self._read()
+        items.update(self._items)
+        if len(items) > self.max_items:
+            keep = sorted(items, key=lambda k: items[k][2])[-self.max_items :]
+            items = {k: items[k] for k in keep}
+
+        tmp = "{}.tmp".format(p)
+        try:
+            with open(tmp, "w") as wfile:
+                json.dump({k: list(v) for k, v in items.items()}, wfile)
+            os.replace(tmp, p)
+        except OSError as e:
+            self.warning("failed writing duration cache. {}".format(e))
+            return
+
+        self._items = items
+        self._dirty = False
+
+    def __len__(self):
+        return len(self._items)
+
+    # private
+    def _read(self):
+        p = self.path
+        if p and os.path.isfile(p):
+            try:
+                with open(p, "r") as rfile:
+                    return {k: tuple(v) for k, v in json.load(rfile).items()}
+            except (ValueError, TypeError, AttributeError) as e:
+                self.warning("invalid duration cache {}. {}".format(p, e))
+        return {}
+
+
+# ============= EOF =============================================
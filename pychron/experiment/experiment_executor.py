@@ -63,8 +63,10 @@ from pychron.experiment.conditional.conditional import conditionals_from_file
 from pychron.experiment.conditional.conditionals_view import ConditionalsView
 from pychron.experiment.conflict_resolver import ConflictResolver
 from pychron.experiment.datahub import Datahub
+from pychron.experiment.duration_cache import ScriptDigests
 from pychron.experiment.experiment_scheduler import ExperimentScheduler
 from pychron.experiment.experiment_status import ExperimentStatus
+from pychron.experiment.run_lookahead import RunLookahead
 from pychron.experiment.stats import StatsGroup
 from pychron.experiment.utilities.conditionals import (
     test_queue_conditionals_name,
@@ -88,6 +90,7 @@ from pychron.pychron_constants import (
     AR_AR,
     DVC_PROTOCOL,
     DEFAULT_MONITOR_NAME,
+    SCRIPT_KEYS,
     SCRIPT_NAMES,
     EM_SCRIPT_KEYS,
     NULL_STR,
@@ -223,6 +226,12 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
     use_dvc_persistence = Bool(False)
     default_principal_investigator = Str
 
+    # look-ahead
+    use_run_lookahead = Bool(False)
+    run_lookahead_depth = Int(1)
+    _lookahead = None
+    _script_digests = Instance(ScriptDigests, ())
+
     baseline_color = Color
     sniff_color = Color
     signal_color = Color
@@ -308,6 +317,8 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
             "use_preceding_blank",
             "execute_open_queues",
             "save_all_runs",
+            "use_run_lookahead",
+            "run_lookahead_depth",
         )
         self._preference_binder(prefid, attrs)
 
@@ -623,6 +634,13 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
 
         rgen, nruns = exp.new_runs_generator()
 
+        if self.use_run_lookahead:
+            self._lookahead = RunLookahead(
+                self._prepare_run,
+                self._run_fingerprint,
+                depth=max(1, self.run_lookahead_depth),
+            )
+
         cnt = 0
         total_cnt = 0
         is_first_flag = True
@@ -647,6 +665,8 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                     rgen, nruns = exp.new_runs_generator()
                     cnt = 0
                     self.queue_modified = False
+                    if self._lookahead:
+                        self._lookahead.invalidate()
 
                 try:
                     spec = next(rgen)
@@ -692,6 +712,8 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                     self.debug("failed to make run")
                     break
 
+                self._schedule_lookahead(exp, spec)
+
                 self.wait_group.active_control.page_name = run.runid
                 run.is_first = is_first_flag
 
@@ -763,6 +785,11 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
             self.warning("automated runs did not complete successfully")
             self.warning("error: {}".format(self._err_message))
 
+        if self._lookahead:
+            self._lookahead.shutdown()
+            self._lookahead = None
+
+        self._wait_for_persistence()
         self._end_runs()
         if last_runid:
             self.info(
@@ -1077,6 +1104,26 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                     err = "User Canceled"
                 self._err_message = err
 
+    def _wait_for_persistence(self):
+        """
+        wait for analyses committed/pushed in the background
+        """
+        if not self.use_dvc_persistence:
+            return
+
+        dvcp = self.application.get_service("pychron.dvc.dvc_persister.DVCPersister")
+        if dvcp and dvcp.use_async_persistence:
+            self.set_extract_state("Saving analyses", flash=False)
+            self.info("waiting for analyses to be committed/pushed")
+            if not dvcp.wait_for_persistence(timeout=dvcp.async_persistence_timeout):
+                msg = dvcp.worker.error or (
+                    "Timed out waiting for analyses to be committed/pushed. They are "
+                    "saved locally and will continue to be committed/pushed in the "
+                    "background"
+                )
+                invoke_in_main_thread(self.warning_dialog, msg)
+            self.set_extract_state(False)
+
     def _end_runs(self):
         self.debug("End Runs. stats={}".format(self.stats))
         # self._last_ran = None
@@ -1303,12 +1350,15 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         if not self._set_run_aliquot(spec):
             return
 
-        run = None
+        arun = None
+        if self._lookahead:
+            arun = self._lookahead.take(spec)
 
-        spec.load_name = exp.load_name
-        spec.load_holder = exp.tray
+        if arun is None:
+            arun = self._prepare_run(spec)
 
-        arun = spec.make_run(run=run)
+        # the aliquot is assigned after a look-ahead run is prepared
+        arun.runid = spec.runid
         arun.logger_name = "AutomatedRun {}".format(arun.runid)
 
         if spec.end_after:
@@ -1321,28 +1371,8 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         """
         self._add_backup(arun.uuid)
 
-        arun.integration_time = 1.04
-
-        arun.labspy_client = self.application.get_service(
-            "pychron.labspy.client.LabspyClient"
-        )
-
-        for k in (
-            "signal_color",
-            "sniff_color",
-            "baseline_color",
-            "ms_pumptime_start",
-            "datahub",
-            "console_display",
-            "experiment_queue",
-            "spectrometer_manager",
-            "extraction_line_manager",
-            "ion_optics_manager",
-            "use_db_persistence",
-            "use_dvc_persistence",
-            "use_xls_persistence",
-        ):
-            setattr(arun, k, getattr(self, k))
+        # values such as ms_pumptime_start may have changed since the run was prepared
+        self._set_run_attributes(arun)
 
         try:
             pb = self._prev_blanks[spec.analysis_type]
@@ -1353,23 +1383,6 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         arun.previous_baselines = self._prev_baselines
         arun.on_trait_change(self._handle_executor_event, "executor_event")
 
-        arun.set_preferences(self.application.preferences)
-
-        arun.refresh_scripts()
-
-        for sname in SCRIPT_NAMES:
-            script = getattr(arun, sname)
-            if script:
-                script.application = self.application
-                script.manager = self
-                script.runner = self.pyscript_runner
-
-        arun.extract_device = exp.extract_device
-        arun.persister.datahub = self.datahub
-        arun.persister.dbexperiment_identifier = exp.database_identifier
-
-        arun.use_syn_extraction = False
-
         if self.use_dvc_persistence:
             dvcp = self.application.get_service(
                 "pychron.dvc.dvc_persister.DVCPersister"
@@ -1403,6 +1416,96 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
 
         return arun
 
+    def _prepare_run(self, spec):
+        """
+        spec: AutomatedRunSpec
+        return AutomatedRun
+
+        the part of making a run that does not depend on the previous runs. may be called
+        by the look-ahead while another run is executing
+        """
+        exp = self.experiment_queue
+
+        spec.load_name = exp.load_name
+        spec.load_holder = exp.tray
+
+        arun = spec.make_run()
+        arun.integration_time = 1.04
+
+        arun.labspy_client = self.application.get_service(
+            "pychron.labspy.client.LabspyClient"
+        )
+
+        self._set_run_attributes(arun)
+
+        arun.set_preferences(self.application.preferences)
+
+        arun.refresh_scripts()
+
+        for sname in SCRIPT_NAMES:
+            script = getattr(arun, sname)
+            if script:
+                script.application = self.application
+                script.manager = self
+                script.runner = self.pyscript_runner
+
+        arun.extract_device = exp.extract_device
+        arun.persister.datahub = self.datahub
+        arun.persister.dbexperiment_identifier = exp.database_identifier
+
+        arun.use_syn_extraction = False
+        return arun
+
+    def _set_run_attributes(self, arun):
+        for k in (
+            "signal_color",
+            "sniff_color",
+            "baseline_color",
+            "ms_pumptime_start",
+            "datahub",
+            "console_display",
+            "experiment_queue",
+            "spectrometer_manager",
+            "extraction_line_manager",
+            "ion_optics_manager",
+            "use_db_persistence",
+            "use_dvc_persistence",
+            "use_xls_persistence",
+        ):
+            setattr(arun, k, getattr(self, k))
+
+    def _run_fingerprint(self, spec):
+        """
+        a prepared run is only used if this has not changed.
+
+        a prepared run has already loaded its scripts. scripts can gosub into other scripts
+        and load hop files so the contents of the whole scripts directory are part of the
+        fingerprint. only modified files are read again
+        """
+        exp = self.experiment_queue
+        scripts = tuple(getattr(spec, "{}_script".format(k)) for k in SCRIPT_KEYS)
+        return (
+            scripts,
+            self._script_digests.digest(paths.scripts_dir),
+            spec.mass_spectrometer,
+            spec.labnumber,
+            spec.analysis_type,
+            spec.repository_identifier,
+            exp.load_name,
+            exp.tray,
+            exp.extract_device,
+        )
+
+    def _schedule_lookahead(self, exp, spec):
+        """
+        prepare the runs following ``spec``
+        """
+        if not self._lookahead:
+            return
+
+        specs = [s for s in exp.cleaned_automated_runs if s is not spec and s.executable]
+        self._lookahead.schedule(specs)
+
     def _set_run_aliquot(self, spec):
         """
         spec: AutomatedRunSpec
@@ -2225,11 +2328,12 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
             for q in self.experiment_queues
             for a in q.cleaned_automated_runs
         }
-        for e in experiment_ids:
-            if prog:
-                prog.change_message("Syncing {}".format(e))
-                if not self.datahub.mainstore.sync_repo(e, use_progress=False):
-                    return e
+        if prog:
+            prog.change_message("Syncing {} repositories".format(len(experiment_ids)))
+
+        failed = self.datahub.mainstore.sync_repos(experiment_ids)
+        if failed:
+            return failed[0]
 
     def _post_run_check(self, run):
         """
@@ -209,11 +209,15 @@ class PlotPanel(Loggable):
         for det in self.detectors:
             self._new_plot(ytitle=det.name)
 
-    def update(self):
+    def update(self, force=False):
         if self.is_baseline:
-            self.baseline_graph.refresh()
+            self.baseline_graph.refresh(force=force)
         else:
-            self.isotope_graph.refresh()
+            self.isotope_graph.refresh(force=force)
+
+    def set_refit_interval(self, v):
+        for g in (self.isotope_graph, self.baseline_graph):
+            g.refit_interval = v
 
     def new_isotope_plot(self, **kw):
         plots = self._new_plot(isotope_only=True, **kw)
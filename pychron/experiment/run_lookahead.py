@@ -0,0 +1,160 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from pychron.loggable import Loggable
+
+
+class PreparedRun(object):
+    def __init__(self, spec, fingerprint, future):
+        self.spec = spec
+        self.fingerprint = fingerprint
+        self.future = future
+        self.duration = 0
+
+
+class RunLookahead(Loggable):
+    """
+    Prepare upcoming AutomatedRuns in a background thread while the current run is executing.
+
+    ``prepare`` builds a run from a spec (script loading, preferences, ...). It must not depend
+    on state that changes between runs; that is applied when the run is taken.
+
+    A prepared run is only used if its spec is unchanged since it was prepared, i.e. the
+    ``fingerprint`` of the spec is the same. ``invalidate`` drops all prepared runs e.g. when the
+    queue is modified.
+
+    The time saved is the preparation time of every used run minus the time spent waiting for
+    runs that were not ready when they were taken
+    """
+
+    def __init__(self, prepare, fingerprint, depth=1, *args, **kw):
+        super(RunLookahead, self).__init__(*args, **kw)
+        self._prepare = prepare
+        self._fingerprint = fingerprint
+        self.depth = depth
+
+        self._lock = Lock()
+        self._prepared = []
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Lookahead")
+
+        self.nprepared = 0
+        self.nused = 0
+        self.ndiscarded = 0
+        self.saved = 0
+
+    def schedule(self, specs):
+        """
+        prepare the first ``depth`` of ``specs``. already prepared specs are not prepared again
+        and prepared runs for specs not in ``specs[:depth]`` are discarded
+        """
+        specs = specs[: self.depth]
+        with self._lock:
+            keep = []
+            for p in self._prepared:
+                if any(p.spec is s for s in specs):
+                    keep.append(p)
+                else:
+                    self._discard(p)
+
+            for s in specs:
+                if not any(p.spec is s for p in keep):
+                    self.debug("preparing {}".format(s.runid))
+                    p = PreparedRun(s, self._fingerprint(s), None)
+                    p.future = self._executor.submit(self._do_prepare, p)
+                    keep.append(p)
+
+            self._prepared = keep
+
+    def take(self, spec):
+        """
+        :return: the prepared run for ``spec`` or None
+        """
+        with self._lock:
+            p = next((p for p in self._prepared if p.spec is spec), None)
+            if p is None:
+                return
+
+            self._prepared.remove(p)
+
+        if p.fingerprint != self._fingerprint(spec):
+            self.debug("{} modified since it was prepared".format(spec.runid))
+            self._discard(p)
+            return
+
+        st = time.time()
+        try:
+            run = p.future.result()
+        except BaseException as e:
+            self.warning("failed preparing {}. {}".format(spec.runid, e))
+            self.ndiscarded += 1
+            return
+
+        wait = time.time() - st
+        if run is not None:
+            saved = max(0, p.duration - wait)
+            self.saved += saved
+            self.nused += 1
+            self.info(
+                "using prepared run {}. saved {:0.2f}s, waited {:0.2f}s".format(
+                    spec.runid, saved, wait
+                )
+            )
+        return run
+
+    def invalidate(self):
+        with self._lock:
+            if self._prepared:
+                self.debug("invalidating {} prepared runs".format(len(self._prepared)))
+
+            for p in self._prepared:
+                self._discard(p)
+            self._prepared = []
+
+    def shutdown(self):
+        self.invalidate()
+        self._executor.shutdown(wait=False)
+        self.info(
+            "look-ahead prepared={} used={} discarded={} saved={:0.2f}s".format(
+                self.nprepared, self.nused, self.ndiscarded, self.saved
+            )
+        )
+
+    def report(self):
+        return {
+            "prepared": self.nprepared,
+            "used": self.nused,
+            "discarded": self.ndiscarded,
+            "saved": self.saved,
+        }
+
+    # private
+    def _do_prepare(self, p):
+        st = time.time()
+        run = self._prepare(p.spec)
+        p.duration = time.time() - st
+        self.nprepared += 1
+        self.debug("prepared {} in {:0.2f}s".format(p.spec.runid, p.duration))
+        return run
+
+    def _discard(self, p):
+        p.future.cancel()
+        self.ndiscarded += 1
+
+
+# ============= EOF =============================================
@@ -21,6 +21,7 @@ from datetime import datetime, timedelta
 from traits.api import Property, String, Float, Any, Int, List, Instance
 
 from pychron.core.helpers.timer import Timer
+from pychron.experiment.duration_cache import AutomatedRunDurationCache
 from pychron.experiment.duration_tracker import AutomatedRunDurationTracker
 from pychron.loggable import Loggable
 from pychron.pychron_constants import NULL_STR
@@ -33,6 +34,7 @@ class ExperimentStats(Loggable):
     delay_after_air = Float
 
     duration_tracker = Instance(AutomatedRunDurationTracker, ())
+    duration_cache = Instance(AutomatedRunDurationCache, ())
 
     def update_run_duration(self, run, t):
         a = self.duration_tracker
@@ -52,7 +54,9 @@ class ExperimentStats(Loggable):
             self.debug("using duration tracker value")
             rd = self.duration_tracker[sh]
         else:
-            rd = run.get_estimated_duration(force=True)
+            self.duration_cache.refresh()
+            rd = self._estimated_duration(run)
+            self.duration_cache.dump()
         rd = round(rd)
         if as_str:
             rd = str(timedelta(seconds=rd))
@@ -61,6 +65,21 @@ class ExperimentStats(Loggable):
         return rd
 
     # private
+    def _estimated_duration(self, run, script_ctx=None, warned=None):
+        """
+        estimated duration from the duration cache. the scripts are only tested if the run or
+        the scripts changed since the estimate was cached
+        """
+        cache = self.duration_cache
+        key = cache.key(run)
+        r = cache.get(key)
+        if r is None:
+            d = run.get_estimated_duration(script_ctx, warned, True)
+            cache.set(key, d, run._executable)
+        else:
+            d, run._executable = r
+        return d
+
     def _calculate_duration(self, runs):
 
         dur = 0
@@ -72,13 +91,15 @@ class ExperimentStats(Loggable):
             btw = 0
             run_dur = 0
             d = 0
+            self.duration_cache.refresh()
+            n = len(self.duration_cache)
             for a in runs:
                 sh = a.script_hash
 
                 if sh in self.duration_tracker:
                     run_dur += self.duration_tracker[sh]
                 else:
-                    run_dur += a.get_estimated_duration(script_ctx, warned, True)
+                    run_dur += self._estimated_duration(a, script_ctx, warned)
                 d = a.get_delay_after(
                     self.delay_between_analyses,
                     self.delay_after_blank,
@@ -90,6 +111,11 @@ class ExperimentStats(Loggable):
             btw -= d
 
             dur = run_dur + self.delay_before_analyses + btw
+            n = len(self.duration_cache) - n
+            if n:
+                self.debug("estimated {} runs".format(n))
+                self.duration_cache.dump()
+
             self.debug(
                 "nruns={} before={}, run_dur={}, btw={}".format(
                     ni, self.delay_before_analyses, run_dur, btw
@@ -106,8 +106,12 @@ class ExperimentPreferences(BasePreferencesHelper):
     ratio_change_detection_enabled = Bool(False)
     use_preceding_blank = Bool(False)
     plot_panel_update_period = PositiveInteger(1)
+    plot_refit_interval = Float(0)
+    use_fixed_cadence_measurement = Bool
     execute_open_queues = Bool
     save_all_runs = Bool
+    use_run_lookahead = Bool
+    run_lookahead_depth = PositiveInteger(1)
 
     def _get_memory_threshold(self):
         return self._memory_threshold
@@ -339,6 +343,34 @@ class ExperimentPreferencesPane(PreferencesPane):
                     label="Regression Update Period",
                     tooltip="update the isotope regression graph every N counts",
                 ),
+                Item(
+                    "plot_refit_interval",
+                    label="Min. Regression Interval (s)",
+                    tooltip="Minimum number of seconds between refitting the isotope "
+                    "regressions during a measurement. Points are still plotted every "
+                    "update. 0 refits on every update",
+                ),
+                Item(
+                    "use_fixed_cadence_measurement",
+                    label="Fixed Cadence Measurement",
+                    tooltip="Schedule counts on fixed deadlines so processing time does not "
+                    "accumulate. Data writing and plotting are moved off the acquisition "
+                    "thread",
+                ),
+                HGroup(
+                    Item(
+                        "use_run_lookahead",
+                        label="Prepare Next Runs",
+                        tooltip="Load the scripts and preferences of the next runs while the "
+                        "current run is executing",
+                    ),
+                    Item(
+                        "run_lookahead_depth",
+                        label="N",
+                        enabled_when="use_run_lookahead",
+                        tooltip="Number of runs to prepare ahead",
+                    ),
+                ),
                 pc_grp,
                 persist_grp,
                 monitor_grp,
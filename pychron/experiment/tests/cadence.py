@@ -0,0 +1,69 @@
+import unittest
+
+from pychron.experiment.automated_run.cadence import CadenceScheduler
+
+
+class Clock(object):
+    def __init__(self):
+        self.t = 0
+
+    def __call__(self):
+        return self.t
+
+
+class Event(object):
+    """
+    fake event. waiting advances the clock
+    """
+
+    def __init__(self, clock, lag=0):
+        self.clock = clock
+        self.lag = lag
+        self.waits = []
+
+    def wait(self, dt):
+        self.waits.append(dt)
+        self.clock.t += dt + self.lag
+        return False
+
+
+class CadenceSchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.scheduler = CadenceScheduler(1.0, clock=self.clock)
+        self.scheduler.start()
+
+    def test_processing_does_not_drift(self):
+        evt = Event(self.clock)
+        for i in range(5):
+            self.scheduler.wait(evt)
+            # processing time
+            self.clock.t += 0.25
+
+        self.assertEqual(evt.waits, [1.0, 0.75, 0.75, 0.75, 0.75])
+        self.assertEqual(self.scheduler.overruns, 0)
+
+    def test_overrun(self):
+        evt = Event(self.clock)
+        self.scheduler.wait(evt)
+        self.clock.t += 1.5
+        self.scheduler.wait(evt)
+
+        r = self.scheduler.report()
+        self.assertEqual(r["overruns"], 1)
+        self.assertEqual(r["max_overrun"], 0.5)
+        self.assertEqual(evt.waits, [1.0, 1.0])
+
+    def test_jitter(self):
+        evt = Event(self.clock, lag=0.01)
+        self.scheduler.wait(evt)
+        self.scheduler.wait(evt)
+
+        r = self.scheduler.report()
+        self.assertEqual(r["n"], 2)
+        self.assertAlmostEqual(r["max_jitter"], 0.01)
+        self.assertAlmostEqual(r["mean_jitter"], 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
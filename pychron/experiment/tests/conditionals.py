@@ -309,6 +309,35 @@ class ConditionalsTestCase(unittest.TestCase):
         d = {"check": "L2(CDD).deflection==2000", "attr": "CDD"}
         self._test(d)
 
+    def test_shared_cache(self):
+        ncalls = []
+        ig = self.arun.isotope_group
+        get_slope = ig.get_slope
+
+        def slope(*args, **kw):
+            ncalls.append(1)
+            return get_slope(*args, **kw)
+
+        ig.get_slope = slope
+
+        cache = {}
+        for t in ("slope(Ar40)>0.1", "slope(Ar40)<1000"):
+            c = conditional_from_dict({"check": t}, "TerminationConditional")
+            self.assertTrue(c.check(self.arun, ([], []), 1000, cache=cache))
+
+        self.assertEqual(len(ncalls), 1)
+
+    def test_value_context(self):
+        c = conditional_from_dict({"check": "Ar40.bs==0.25"}, "TerminationConditional")
+        c.check(self.arun, ([], []), 1000)
+        self.assertEqual(c.value_context, "{'Ar40': 0.25}")
+
+    def test_teststr_changed(self):
+        c = conditional_from_dict({"check": "Ar40.bs==0.25"}, "TerminationConditional")
+        self.assertTrue(c.check(self.arun, ([], []), 1000))
+        c.teststr = "Ar40.bs==0.5"
+        self.assertIsNone(c.check(self.arun, ([], []), 1000))
+
     def _test_between(self, l, h):
         self.arun.isotope_group.isotopes["Ar40"].value = 3.4
         d = {"check": "between(Ar40,{},{})".format(l, h), "attr": "Ar40"}
@@ -0,0 +1,75 @@
+import time
+import unittest
+from queue import Queue
+
+from pychron.experiment.automated_run.data_collector import DataCollector
+
+
+class Detector(object):
+    ypadding = 0
+
+    def __init__(self, name, isotope):
+        self.name = name
+        self.isotope = isotope
+
+
+class Collector(DataCollector):
+    def __init__(self, *args, **kw):
+        # skip preference binding
+        super(DataCollector, self).__init__(*args, **kw)
+
+    def _update_isotopes(self, x, keys, signals):
+        pass
+
+    def _set_plot_data(self, cnt, det, iso, x, signal):
+        self.plotted.append((det.name, iso, signal))
+
+    @property
+    def plot_panel(self):
+        return self
+
+
+class DataCollectorConsumerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.h1 = Detector("H1", "Ar40")
+        self.ax = Detector("AX", "Ar39")
+        self.written = []
+
+        c = Collector(detectors=[self.h1, self.ax], plot_panel_update_period=100)
+        c.plotted = []
+        c.update = lambda: None
+        c.starttime = time.time()
+        c.data_writer = self._write
+        c.data_generator = iter([(["H1", "AX"], [10.0, 1.0], None, 1)])
+        self.collector = c
+
+    def _write(self, pairs, x, keys, signals):
+        for det, iso in pairs:
+            self.written.append((det.name, iso, signals[keys.index(det.name)]))
+
+    def test_pairing_snapshot(self):
+        c = self.collector
+        c._queue = q = Queue()
+        c._iteration(1)
+
+        # peak hop re-pairs the detectors before the count is consumed
+        self.h1.isotope = "Ar36"
+        self.ax.isotope = "Ar38"
+        q.put(None)
+        c._consume(q)
+
+        expected = [("H1", "Ar40", 10.0), ("AX", "Ar39", 1.0)]
+        self.assertEqual(self.written, expected)
+        self.assertEqual(c.plotted, expected)
+
+    def test_unqueued(self):
+        c = self.collector
+        c._iteration(1)
+
+        expected = [("H1", "Ar40", 10.0), ("AX", "Ar39", 1.0)]
+        self.assertEqual(self.written, expected)
+        self.assertEqual(c.plotted, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
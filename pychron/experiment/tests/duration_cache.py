@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.experiment.duration_cache import AutomatedRunDurationCache
+from pychron.experiment.stats import ExperimentStats
+from pychron.paths import paths
+
+
+class MockSpec(object):
+    mass_spectrometer = "jan"
+    measurement_script = "unknown"
+    extraction_script = "extract"
+    post_measurement_script = "pump"
+    post_equilibration_script = "pump"
+    _executable = True
+
+    def __init__(self, script_hash, duration=10):
+        self.script_hash = script_hash
+        self.duration = duration
+        self.nestimated = 0
+
+    def get_estimated_duration(self, script_ctx=None, warned=None, force=False):
+        self.nestimated += 1
+        return self.duration
+
+    def get_delay_after(self, *args):
+        return 0
+
+
+class DurationCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        paths.build("_dt")
+        self.root = tempfile.mkdtemp()
+        self.scripts = os.path.join(self.root, "scripts")
+        os.mkdir(self.scripts)
+        self.script = os.path.join(self.scripts, "jan_unknown.py")
+        with open(self.script, "w") as wfile:
+            wfile.write("def main():\n    sleep(10)\n")
+
+        self.path = os.path.join(self.root, "duration_cache.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _stats(self):
+        stats = ExperimentStats()
+        stats.duration_cache = AutomatedRunDurationCache(
+            path=self.path, root=self.scripts
+        )
+        return stats
+
+    def test_incremental(self):
+        stats = self._stats()
+        runs = [MockSpec("a"), MockSpec("b")]
+        self.assertEqual(stats.calculate_duration(runs), 20)
+
+        runs.append(MockSpec("c", duration=5))
+        self.assertEqual(stats.calculate_duration(runs), 25)
+        self.assertEqual([r.nestimated for r in runs], [1, 1, 1])
+
+    def test_persistent(self):
+        self._stats().calculate_duration([MockSpec("a")])
+
+        run = MockSpec("a", duration=100)
+        self.assertEqual(self._stats().calculate_duration([run]), 10)
+        self.assertEqual(run.nestimated, 0)
+
+    def test_script_modified(self):
+        stats = self._stats()
+        stats.calculate_duration([MockSpec("a")])
+
+        with open(self.script, "w") as wfile:
+            wfile.write("def main():\n    sleep(20)\n")
+
+        run = MockSpec("a", duration=20)
+        self.assertEqual(stats.calculate_duration([run]), 20)
+        self.assertEqual(run.nestimated, 1)
+
+    def test_executable(self):
+        stats = self._stats()
+        run = MockSpec("a")
+        run._executable = False
+        stats.calculate_duration([run])
+
+        run = MockSpec("a")
+        stats.calculate_duration([run])
+        self.assertFalse(run._executable)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from pychron.experiment.run_lookahead import RunLookahead
+from pychron.paths import paths
+
+
+class Spec(object):
+    def __init__(self, runid, script="default"):
+        self.runid = runid
+        self.script = script
+
+
+class QueueSpec(Spec):
+    mass_spectrometer = "jan"
+    labnumber = "bu-01"
+    analysis_type = "unknown"
+    repository_identifier = "Foo"
+    measurement_script = "unknown"
+    extraction_script = "extract"
+    post_measurement_script = "pump"
+    post_equilibration_script = "pump"
+    executable = True
+
+
+class Queue(object):
+    load_name = "1000"
+    tray = "221-hole"
+    extract_device = "CO2"
+
+    def __init__(self, specs):
+        self.cleaned_automated_runs = specs
+
+
+class Run(object):
+    def __init__(self, spec):
+        self.spec = spec
+
+
+class RunLookaheadTestCase(unittest.TestCase):
+    def setUp(self):
+        self.prepared = []
+        self.lookahead = RunLookahead(self._prepare, lambda s: s.script, depth=2)
+
+    def tearDown(self):
+        self.lookahead.shutdown()
+
+    def _prepare(self, spec):
+        time.sleep(0.01)
+        self.prepared.append(spec.runid)
+        return Run(spec)
+
+    def test_take_prepared(self):
+        a, b = Spec("a"), Spec("b")
+        self.lookahead.schedule([a, b])
+        run = self.lookahead.take(a)
+        self.assertIs(run.spec, a)
+        self.assertEqual(self.lookahead.nused, 1)
+
+    def test_not_prepared(self):
+        a, b = Spec("a"), Spec("b")
+        self.lookahead.schedule([a])
+        self.assertIsNone(self.lookahead.take(b))
+
+    def test_depth(self):
+        specs = [Spec(i) for i in "abc"]
+        self.lookahead.schedule(specs)
+        self.assertIsNone(self.lookahead.take(specs[2]))
+        self.assertIsNotNone(self.lookahead.take(specs[1]))
+
+    def test_not_prepared_twice(self):
+        a, b = Spec("a"), Spec("b")
+        self.lookahead.schedule([a, b])
+        self.lookahead.take(a)
+        self.lookahead.schedule([b])
+        self.lookahead.take(b)
+        self.assertEqual(self.prepared, ["a", "b"])
+
+    def test_modified(self):
+        a = Spec("a")
+        self.lookahead.schedule([a])
+        a.script = "other"
+        self.assertIsNone(self.lookahead.take(a))
+        self.assertEqual(self.lookahead.ndiscarded, 1)
+
+    def test_invalidate(self):
+        a = Spec("a")
+        self.lookahead.schedule([a])
+        self.lookahead.invalidate()
+        self.assertIsNone(self.lookahead.take(a))
+
+    def test_failed_prepare(self):
+        def prepare(spec):
+            raise ValueError("bad script")
+
+        la = RunLookahead(prepare, lambda s: s.script)
+        a = Spec("a")
+        la.schedule([a])
+        self.assertIsNone(la.take(a))
+        la.shutdown()
+
+
+class ExecutorLookaheadTestCase(unittest.TestCase):
+    def setUp(self):
+        from pychron.experiment.experiment_executor import ExperimentExecutor
+
+        paths.build("_lookahead")
+        self.root = tempfile.mkdtemp()
+        self._scripts_dir = paths.scripts_dir
+        paths.scripts_dir = self.root
+        self.script = os.path.join(self.root, "jan_unknown.py")
+        self._write_script("sleep(10)")
+
+        self.specs = [QueueSpec(i) for i in "abc"]
+        self.executor = ExperimentExecutor()
+        self.executor.experiment_queue = Queue(self.specs)
+        self.executor._lookahead = RunLookahead(
+            Run, self.executor._run_fingerprint, depth=1
+        )
+
+    def tearDown(self):
+        self.executor._lookahead.shutdown()
+        paths.scripts_dir = self._scripts_dir
+        shutil.rmtree(self.root)
+
+    def _write_script(self, body):
+        with open(self.script, "w") as wfile:
+            wfile.write("def main():\n    {}\n".format(body))
+
+    def test_schedule(self):
+        a, b, c = self.specs
+        self.executor._schedule_lookahead(self.executor.experiment_queue, a)
+
+        run = self.executor._lookahead.take(b)
+        self.assertIs(run.spec, b)
+
+    def test_script_modified(self):
+        a, b, c = self.specs
+        self.executor._schedule_lookahead(self.executor.experiment_queue, a)
+
+        self._write_script("sleep(20)")
+        # make sure the modification time changes on coarse grained file systems
+        st = os.stat(self.script)
+        os.utime(self.script, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        self.assertIsNone(self.executor._lookahead.take(b))
+
+    def test_spec_modified(self):
+        a, b, c = self.specs
+        self.executor._schedule_lookahead(self.executor.experiment_queue, a)
+
+        b.extraction_script = "extract_long"
+        self.assertIsNone(self.executor._lookahead.take(b))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,13 +24,14 @@ from pickle import PickleError
 from string import digits
 
 import yaml
-from traits.api import Any, Dict, List, Bool, Event, Str
+from traits.api import Any, Dict, List, Bool, Event, Str, Float
 
 from pychron.core.helpers.iterfuncs import groupby_key
 from pychron.core.helpers.strtools import to_bool
 from pychron.core.yaml import yload
 from pychron.extraction_line import VERBOSE_DEBUG, VERBOSE
 from pychron.extraction_line.pipettes.tracking import PipetteTracker
+from pychron.extraction_line.switch_state_refresher import SwitchStateRefresher
 from pychron.globals import globalv
 from pychron.hardware.core.checksum_helper import computeCRC
 from pychron.hardware.core.i_core_device import ICoreDevice
@@ -86,6 +87,10 @@ class SwitchManager(Manager):
 
     query_valve_state = Bool(True)
 
+    # seconds taken by the last load_hardware_states
+    refresh_latency = Float
+    _state_refresher = Any
+
     use_explanation = True
 
     refresh_explanation = Event
@@ -131,6 +136,7 @@ class SwitchManager(Manager):
     def kill(self):
         super(SwitchManager, self).kill()
         self._save_states()
+        self._state_refresher.shutdown()
 
     def create_device(self, name, *args, **kw):
         """ """
@@ -507,42 +513,14 @@ class SwitchManager(Manager):
         self.log(msg, VERBOSE_DEBUG)
 
     def load_hardware_states(self, force=False, verbose=False, refresh_canvas=True):
-        """ """
-        states = []
-        words = {}
-        for k, v in self.switches.items():
-            a = (k, v.address, v.state)
-            if v.use_state_word:
-                if v.actuator not in words:
-                    words[v.actuator] = [a]
-                else:
-                    words[v.actuator].append(a)
-
-            elif v.query_state or force:
-                ostate = v.state
-                s = v.get_hardware_indicator_state(verbose=verbose)
-                if not isinstance(s, bool):
-                    s = None
-
-                if ostate != s:
-                    states.append((k, s, False))
-
-        for actuator, items in words.items():
-            stateword = actuator.get_state_word()
-            if stateword:
-                for k, address, ostate in items:
-                    try:
-                        s = stateword[address]
-                        if s != ostate:
-                            states.append((k, s, False))
-                        self.switches[k].set_state(s)
-                    except KeyError:
-                        self.warning(
-                            "Failed getting state from valve word={}, "
-                            "valve={}({})".format(stateword, k, address)
-                        )
-            else:
-                self.warning("Actuator failed to return state word")
+        """
+        query the hardware states of the switches. only switches whose state changed are
+        refreshed
+        """
+        states = self._state_refresher.refresh(
+            self.switches, force=force, verbose=verbose
+        )
+        self.refresh_latency = self._state_refresher.latency
 
         if states:
             self.refresh_state = states
@@ -1268,5 +1246,8 @@ class SwitchManager(Manager):
     def _get_simulation(self):
         return any([act.simulation for act in self.actuators])
 
+    def __state_refresher_default(self):
+        return SwitchStateRefresher()
+
 
 # ==================== EOF ==================================
@@ -0,0 +1,188 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pychron.loggable import Loggable
+
+
+def communicator_key(dev):
+    """
+    devices with the same key are never queried concurrently. devices talking through the
+    same port share a key
+    """
+    comm = getattr(dev, "communicator", None)
+    if comm is None:
+        return id(dev)
+
+    port = getattr(comm, "port", None)
+    if port:
+        return getattr(comm, "host", None), port
+    return id(comm)
+
+
+class SwitchStateRefresher(Loggable):
+    """
+    Query the hardware states of a set of switches.
+
+    Switches are grouped by the device used to query their state. A device that supports
+    ``get_indicator_states`` is asked for all of its switches with one request, otherwise
+    each switch is queried individually. Switches that use a state word are read from one
+    state word per actuator.
+
+    Devices on different communicators are queried concurrently, devices sharing a
+    communicator are queried in sequence.
+
+    Only switches whose state changed since the last refresh are returned
+    """
+
+    def __init__(self, nworkers=4, *args, **kw):
+        super(SwitchStateRefresher, self).__init__(*args, **kw)
+        self.nworkers = nworkers
+        self._executor = None
+        self._failed = set()
+
+        self.latency = 0
+        self.max_latency = 0
+        self.nrefreshes = 0
+        self.device_latency = {}
+
+    def refresh(self, switches, force=False, verbose=False):
+        """
+        :param switches: dict of name: switch
+        :return: list of (name, state, False) for the switches that changed
+        """
+        st = time.time()
+
+        words = {}
+        queries = {}
+        for k, v in switches.items():
+            if v.use_state_word:
+                words.setdefault(v.actuator, []).append((k, v))
+            elif getattr(v, "query_state", False) or force:
+                dev, address = None, None
+                if hasattr(v, "get_state_device"):
+                    dev, address = v.get_state_device()
+                queries.setdefault(dev, []).append((k, v, address))
+
+        groups = {}
+        for actuator, items in words.items():
+            groups.setdefault(communicator_key(actuator), []).append(
+                (self._load_state_word, actuator, items, verbose)
+            )
+        for dev, items in queries.items():
+            groups.setdefault(communicator_key(dev), []).append(
+                (self._load_indicator_states, dev, items, verbose)
+            )
+
+        groups = list(groups.values())
+        if self.nworkers > 1 and len(groups) > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.nworkers, thread_name_prefix="SwitchRefresh"
+                )
+            futures = [self._executor.submit(self._run_group, g) for g in groups]
+            results = [f.result() for f in futures]
+        else:
+            results = [self._run_group(g) for g in groups]
+
+        states = [s for r in results for s in r]
+
+        self.latency = et = time.time() - st
+        self.max_latency = max(self.max_latency, et)
+        self.nrefreshes += 1
+        if verbose:
+            self.debug(
+                "refreshed {} switches on {} communicators in {:0.3f}s. "
+                "changed={}".format(len(switches), len(groups), et, len(states))
+            )
+        return states
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def report(self):
+        return {
+            "n": self.nrefreshes,
+            "latency": self.latency,
+            "max_latency": self.max_latency,
+            "devices": dict(self.device_latency),
+        }
+
+    # private
+    def _run_group(self, jobs):
+        states = []
+        for func, dev, items, verbose in jobs:
+            st = time.time()
+            try:
+                states.extend(func(dev, items, verbose))
+            except BaseException:
+                self.debug_exception()
+
+            name = getattr(dev, "name", None)
+            if name:
+                self.device_latency[name] = time.time() - st
+        return states
+
+    def _load_indicator_states(self, dev, items, verbose):
+        results = None
+        if dev is not None and len(items) > 1:
+            func = getattr(dev, "get_indicator_states", None)
+            if callable(func):
+                results = func([a for _, _, a in items], "closed", verbose=verbose)
+
+        states = []
+        for k, v, address in items:
+            ostate = v.state
+            if results and address in results:
+                result = v.set_hardware_indicator_state(results[address])
+            else:
+                result = v.get_hardware_indicator_state(verbose=verbose)
+
+            if isinstance(result, bool):
+                if v.state != ostate or k in self._failed:
+                    self._failed.discard(k)
+                    states.append((k, v.state, False))
+            elif k not in self._failed:
+                self._failed.add(k)
+                states.append((k, None, False))
+
+        return states
+
+    def _load_state_word(self, actuator, items, verbose):
+        states = []
+        stateword = actuator.get_state_word()
+        if stateword:
+            for k, v in items:
+                try:
+                    s = stateword[v.address]
+                    if s != v.state:
+                        states.append((k, s, False))
+                    v.set_state(s)
+                except KeyError:
+                    self.warning(
+                        "Failed getting state from valve word={}, "
+                        "valve={}({})".format(stateword, k, v.address)
+                    )
+        else:
+            self.warning("Actuator failed to return state word")
+
+        return states
+
+
+# ============= EOF =============================================
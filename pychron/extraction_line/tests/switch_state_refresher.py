@@ -0,0 +1,133 @@
+import time
+import unittest
+
+from pychron.extraction_line.switch_state_refresher import SwitchStateRefresher
+from pychron.hardware.actuators.dummy_gp_actuator import DummyGPActuator
+from pychron.hardware.switch import Switch
+
+
+class Communicator(object):
+    def __init__(self, port):
+        self.host = "localhost"
+        self.port = port
+
+
+class SlowActuator(DummyGPActuator):
+    """
+    dummy actuator that cannot batch requests and takes ``delay`` seconds per request
+    """
+
+    delay = 0.05
+
+    def get_indicator_states(self, addresses, *args, **kw):
+        return
+
+    def get_indicator_state(self, address, *args, **kw):
+        self.nrequests += 1
+        time.sleep(self.delay)
+        return self._states.get(address, False)
+
+
+class SwitchStateRefresherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.refresher = SwitchStateRefresher(nworkers=4)
+
+    def tearDown(self):
+        self.refresher.shutdown()
+
+    def _switches(self, actuator, names):
+        return {n: Switch(n, actuator=actuator, address=n) for n in names}
+
+    def test_changed_only(self):
+        act = DummyGPActuator(name="act")
+        switches = self._switches(act, "ABC")
+
+        act.open_channel("A")
+        states = self.refresher.refresh(switches)
+        self.assertEqual(states, [("A", True, False)])
+        self.assertTrue(switches["A"].state)
+
+        self.assertEqual(self.refresher.refresh(switches), [])
+
+    def test_batched(self):
+        act = DummyGPActuator(name="act")
+        calls = []
+        func = act.get_indicator_states
+
+        def get_indicator_states(addresses, *args, **kw):
+            calls.append(addresses)
+            return func(addresses)
+
+        act.get_indicator_states = get_indicator_states
+        act.open_channel("B")
+        switches = self._switches(act, "ABC")
+        states = self.refresher.refresh(switches)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(calls[0]), ["A", "B", "C"])
+        self.assertEqual(states, [("B", True, False)])
+
+    def test_inverted(self):
+        act = DummyGPActuator(name="act")
+        switches = self._switches(act, "AB")
+        switches["A"].state_invert = True
+
+        self.refresher.refresh(switches)
+        self.assertTrue(switches["A"].state)
+        self.assertFalse(switches["B"].state)
+
+    def test_concurrent(self):
+        acts = []
+        switches = {}
+        for i in range(4):
+            act = SlowActuator(name="act{}".format(i))
+            act.nrequests = 0
+            act.communicator = Communicator(i)
+            acts.append(act)
+            switches.update(self._switches(act, ["{}{}".format(i, j) for j in "AB"]))
+
+        st = time.time()
+        self.refresher.refresh(switches)
+        et = time.time() - st
+
+        # serially this takes 8 * delay
+        self.assertLess(et, 6 * SlowActuator.delay)
+        self.assertEqual([a.nrequests for a in acts], [2, 2, 2, 2])
+        self.assertEqual(len(self.refresher.device_latency), 4)
+
+    def test_shared_communicator(self):
+        active = []
+        overlapped = []
+
+        class Act(SlowActuator):
+            def get_indicator_state(self, address, *args, **kw):
+                active.append(address)
+                if len(active) > 1:
+                    overlapped.append(address)
+                time.sleep(self.delay)
+                active.remove(address)
+                return False
+
+        switches = {}
+        for i in range(3):
+            act = Act(name="act{}".format(i))
+            act.communicator = Communicator(1)
+            switches.update(self._switches(act, ["{}A".format(i)]))
+
+        self.refresher.refresh(switches)
+        self.assertEqual(overlapped, [])
+
+    def test_failed(self):
+        act = DummyGPActuator(name="act")
+        switches = self._switches(act, "A")
+        act.get_indicator_state = lambda *args, **kw: None
+
+        self.assertEqual(self.refresher.refresh(switches), [("A", None, False)])
+        self.assertEqual(self.refresher.refresh(switches), [])
+
+        del act.get_indicator_state
+        self.assertEqual(self.refresher.refresh(switches), [("A", False, False)])
+
+
+if __name__ == "__main__":
+    unittest.main()
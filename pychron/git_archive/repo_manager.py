@@ -22,11 +22,12 @@ import subprocess
 import sys
 import time
 from datetime import datetime
+from threading import Lock, RLock
 
 import git
 from git import Repo
 from git.exc import GitCommandError
-from traits.api import Any, Str, List, Event
+from traits.api import Any, Str, List, Event, Dict
 
 from pychron.core.helpers.filetools import fileiter
 from pychron.core.progress import open_progress
@@ -86,6 +87,31 @@ class StashCTX(object):
                 pass
 
 
+_repository_locks = {}
+_repository_locks_lock = Lock()
+
+
+def get_repository_lock(path):
+    """
+    the lock for the repository at ``path``. held while staging and committing so threads
+    using the same repository do not interleave. fetch, pull and push do not take it
+    """
+    path = os.path.abspath(path)
+    with _repository_locks_lock:
+        lock = _repository_locks.get(path)
+        if lock is None:
+            lock = _repository_locks[path] = RLock()
+        return lock
+
+
+def _stat_key(p):
+    try:
+        st = os.stat(p)
+    except OSError:
+        return
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
 class GitRepoManager(Loggable):
     """
     manage a local git repository
@@ -103,6 +129,14 @@ class GitRepoManager(Loggable):
     path_dirty = Event
     remote = Str
 
+    # path: stat of paths checked by add_paths. valid while the index file is unchanged
+    _index_snapshot = Dict
+    _index_snapshot_key = Any
+
+    @property
+    def index_lock(self):
+        return get_repository_lock(self.path)
+
     def set_name(self, p):
         self.name = "{}<GitRepo>".format(os.path.basename(p))
 
@@ -165,30 +199,30 @@ class GitRepoManager(Loggable):
         self.index.add(apaths)
 
     def add_paths(self, apaths):
-        if not isinstance(apaths, (list, tuple)):
-            apaths = (apaths,)
+        """
+        stage the changed, untracked and deleted paths in ``apaths``.
 
-        changes = self.get_local_changes(change_type=("A", "R", "M"))
-        changes = [os.path.join(self.path, c) for c in changes]
-        if changes:
-            self.debug("-------- local changes ---------")
-            for c in changes:
-                self.debug(c)
+        only ``apaths`` are checked, the rest of the working tree is not scanned. paths whose
+        stat matches the snapshot taken when they were last checked are skipped without calling
+        git. the snapshot is discarded whenever the index file changes
 
-        deletes = self.get_local_changes(change_type=("D",))
-        if deletes:
-            self.debug("-------- deletes ---------")
-            for c in deletes:
-                self.debug(c)
+        :return: True if the index was modified
+        """
+        if not isinstance(apaths, (list, tuple)):
+            apaths = (apaths,)
 
-        untracked = self.untracked_files()
-        if untracked:
-            self.debug("-------- untracked paths --------")
-            for t in untracked:
-                self.debug(t)
+        st = time.time()
+        apaths = [os.path.join(self.path, p) for p in apaths]
 
-        changes.extend(untracked)
+        self._validate_index_snapshot()
+        snapshot = self._index_snapshot
+        # a path missing from the snapshot is always checked. e.g. a deleted file that was
+        # never snapshotted stats to None, same as snapshot.get
+        candidates = [
+            p for p in apaths if p not in snapshot or snapshot[p] != _stat_key(p)
+        ]
 
+        changes, deletes = self.get_path_changes(candidates)
         self.debug("add paths {}".format(apaths))
 
         ps = [p for p in apaths if p in changes]
@@ -209,8 +243,66 @@ class GitRepoManager(Loggable):
                 )
             self.index.remove(ps, working_tree=True)
 
+        for p in candidates:
+            key = _stat_key(p)
+            if key is None:
+                snapshot.pop(p, None)
+            else:
+                snapshot[p] = key
+        self._index_snapshot_key = _stat_key(self._index_path)
+
+        self.debug(
+            "add paths n={} checked={} added={} removed={} {:0.3f}s".format(
+                len(apaths),
+                len(candidates),
+                len(changes),
+                len(deletes),
+                time.time() - st,
+            )
+        )
         return changed or delete_changed
 
+    def get_path_changes(self, apaths, chunk_size=500):
+        """
+        status limited to ``apaths``
+
+        :param apaths: list of absolute paths
+        :return: changes, deletes. changes are modified or untracked paths. deletes are tracked
+            paths missing from the working tree
+        """
+        changes, deletes = [], []
+        for i in range(0, len(apaths), chunk_size):
+            rps = [os.path.relpath(p, self.path) for p in apaths[i : i + chunk_size]]
+            out = self._repo.git.status(
+                "--porcelain", "-z", "--untracked-files=all", "--", *rps
+            )
+
+            entries = iter(out.split("\0"))
+            for entry in entries:
+                if not entry:
+                    continue
+
+                xy, path = entry[:2], entry[3:]
+                if xy[0] in "RC":
+                    # the original path of a rename or copy is the next entry
+                    next(entries, None)
+
+                path = os.path.join(self.path, path)
+                if xy == "??" or xy[1] in "MT":
+                    changes.append(path)
+                elif xy[1] == "D":
+                    deletes.append(path)
+
+        return changes, deletes
+
+    def _validate_index_snapshot(self):
+        if self._index_snapshot_key != _stat_key(self._index_path):
+            self._index_snapshot = {}
+
+    @property
+    def _index_path(self):
+        return os.path.join(self._repo.git_dir, "index")
+
     def add_ignore(self, *args):
         ignores = []
         p = os.path.join(self.path, ".gitignore")
@@ -731,11 +823,16 @@ class GitRepoManager(Loggable):
         handled=True,
         use_progress=True,
         use_auto_pull=False,
+        fetch=True,
+        timeout=None,
     ):
         """
         fetch and merge
 
         if use_auto_pull is False ask user if they want to accept the available updates
+
+        :param fetch: if False merge what was previously fetched
+        :param timeout: seconds before the fetch is killed
         """
         self.debug("pulling {} from {}".format(branch, remote))
 
@@ -758,13 +855,14 @@ class GitRepoManager(Loggable):
                 prog.change_message(
                     'Fetching branch:"{}" from "{}"'.format(branch, remote)
                 )
-            try:
-                self.fetch(remote)
-            except GitCommandError as e:
-                self.debug(e)
-                if not handled:
-                    raise e
-            self.debug("fetch complete")
+            if fetch:
+                try:
+                    self.fetch(remote, timeout=timeout, handled=handled)
+                except GitCommandError as e:
+                    self.debug(e)
+                    if not handled:
+                        raise e
+                self.debug("fetch complete")
 
             def merge():
                 try:
@@ -953,9 +1051,22 @@ class GitRepoManager(Loggable):
 
         return True
 
-    def fetch(self, remote="origin"):
+    def fetch(self, remote="origin", timeout=None, handled=True):
+        """
+        :param timeout: seconds before the fetch is killed
+        :param handled: if False GitCommandErrors, including timeouts, are raised
+        """
         if self._repo:
-            return self._git_command(lambda g: g.fetch(remote), "GitRepoManager.fetch")
+            kw = {}
+            if timeout:
+                kw["kill_after_timeout"] = timeout
+
+            if not handled:
+                return self._repo.git.fetch(remote, **kw)
+
+            return self._git_command(
+                lambda g: g.fetch(remote, **kw), "GitRepoManager.fetch"
+            )
             # return self._repo.git.fetch(remote)
 
     def ahead_behind(self, remote="origin"):
@@ -992,7 +1103,8 @@ class GitRepoManager(Loggable):
         index = self.index
         if index:
             try:
-                index.commit(msg, author=author, committer=author)
+                with self.index_lock:
+                    index.commit(msg, author=author, committer=author)
                 return True
             except git.exc.GitError as e:
                 self.warning("Commit failed: {}".format(e))
@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.git_archive.repo_manager import GitRepoManager, get_repository_lock
+
+
+class AddPathsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.repo = GitRepoManager()
+        self.repo.open_repo(self.root)
+        git = self.repo.active_repo.git
+        git.config("user.name", "test")
+        git.config("user.email", "test@example.com")
+
+        for name in ("a.json", "b.json", "c.json"):
+            self._write(name, name)
+        self.repo.add_paths([self._path(n) for n in ("a.json", "b.json", "c.json")])
+        self.repo.commit("initial")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _path(self, name):
+        return os.path.join(self.root, name)
+
+    def _write(self, name, text):
+        with open(self._path(name), "w") as wfile:
+            wfile.write(text)
+
+    def _staged(self):
+        return sorted(self.repo.active_repo.git.diff("--cached", "--name-only").split())
+
+    def test_unchanged(self):
+        self.assertFalse(self.repo.add_paths(self._path("a.json")))
+        self.assertEqual(self._staged(), [])
+
+    def test_modified_and_untracked(self):
+        self._write("a.json", "modified")
+        self._write("d.json", "new")
+        self._write("e.json", "not requested")
+
+        self.assertTrue(self.repo.add_paths([self._path("a.json"), self._path("d.json")]))
+        self.assertEqual(self._staged(), ["a.json", "d.json"])
+
+    def test_deleted(self):
+        os.remove(self._path("b.json"))
+        self.assertTrue(self.repo.add_paths(self._path("b.json")))
+        self.assertEqual(self._staged(), ["b.json"])
+
+    def test_deleted_fresh_manager(self):
+        # a new manager has an empty snapshot
+        repo = GitRepoManager()
+        repo.open_repo(self.root)
+
+        os.remove(self._path("b.json"))
+        self.assertTrue(repo.add_paths(self._path("b.json")))
+        self.assertEqual(self._staged(), ["b.json"])
+
+    def test_snapshot(self):
+        repo = self.repo
+        p = self._path("c.json")
+        repo.add_paths(p)
+        self.assertIn(p, repo._index_snapshot)
+
+        calls = []
+        get_path_changes = repo.get_path_changes
+
+        def func(ps):
+            calls.append(ps)
+            return get_path_changes(ps)
+
+        repo.get_path_changes = func
+        repo.add_paths(p)
+        self.assertEqual(calls, [[]])
+
+        self._write("c.json", "modified again")
+        self.assertTrue(repo.add_paths(p))
+        self.assertEqual(calls[-1], [p])
+        self.assertEqual(self._staged(), ["c.json"])
+
+
+class RepositoryLockTestCase(unittest.TestCase):
+    def test_per_repository(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+
+        a = GitRepoManager()
+        a.open_repo(os.path.join(root, "a"))
+        b = GitRepoManager()
+        b.open_repo(os.path.join(root, "a"))
+        c = GitRepoManager()
+        c.open_repo(os.path.join(root, "c"))
+
+        self.assertIs(a.index_lock, b.index_lock)
+        self.assertIs(a.index_lock, get_repository_lock(os.path.join(root, "a", "")))
+        self.assertIsNot(a.index_lock, c.index_lock)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -43,6 +43,7 @@ from pychron.core.helpers.filetools import add_extension
 from pychron.graph.context_menu_mixin import ContextMenuMixin
 from pychron.graph.ml_label import MPlotAxis
 from pychron.graph.offset_plot_label import OffsetPlotLabel
+from pychron.graph.streaming_data import StreamingSeries
 from pychron.graph.tools.axis_tool import AxisTool
 from .tools.contextual_menu_tool import ContextualMenuTool
 
@@ -197,6 +198,8 @@ class Graph(ContextMenuMixin):
     data_len = List
     data_limits = List
 
+    _streams = Dict
+
     def __init__(self, *args, **kw):
         """ """
         super(Graph, self).__init__(*args, **kw)
@@ -374,6 +377,7 @@ class Graph(ContextMenuMixin):
         self.series = []
         self.data_len = []
         self.data_limits = []
+        self._streams = {}
 
         if clear_container:
             self.plotcontainer = pc = self.container_factory()
@@ -869,8 +873,18 @@ class Graph(ContextMenuMixin):
         update_y_limits=False,
         ypadding=10,
         ymin_anchor=None,
+        streaming=False,
+        decimate=False,
         **kw
     ):
+        """
+        append a datum to a series
+
+        :param streaming: keep the series in a StreamingSeries. appending does not copy the
+            existing data and the y limits are tracked incrementally. use for live plots
+        :param decimate: only used if ``streaming``. plot at most ~2 points per pixel. do not
+            decimate series that are regressed
+        """
 
         try:
             names = self.series[plotid][series]
@@ -885,17 +899,22 @@ class Graph(ContextMenuMixin):
 
         data = plot.data
         mi, ma = -Inf, Inf
-        for i, (name, di) in enumerate(zip(names, datum)):
-            d = data.get_data(name)
-            nd = hstack((d, di))
-            data.set_data(name, nd)
+        if streaming and len(names) == 2 and len(datum) == 2:
+            mi, ma = self._add_streaming_datum(
+                plot, plotid, series, names, datum, decimate
+            )
+        else:
+            for i, (name, di) in enumerate(zip(names, datum)):
+                d = data.get_data(name)
+                nd = hstack((d, di))
+                data.set_data(name, nd)
 
-            if i == 1:
-                # y values
-                mi = min(nd)
-                ma = max(nd)
+                if i == 1:
+                    # y values
+                    mi = min(nd)
+                    ma = max(nd)
 
-        if update_y_limits:
+        if update_y_limits and mi is not None:
             if isinstance(ypadding, str):
                 ypad = abs(ma - mi) * float(ypadding)
             else:
@@ -906,6 +925,30 @@ class Graph(ContextMenuMixin):
 
             self.set_y_limits(min_=mi, max_=ma + ypad, plotid=plotid)
 
+    def _add_streaming_datum(self, plot, plotid, series, names, datum, decimate):
+        data = plot.data
+        xname, yname = names
+        xs, ys = data.get_data(xname), data.get_data(yname)
+
+        key = (plotid, series)
+        stream = self._streams.get(key)
+        if stream is None or not stream.is_current(xs, ys):
+            # new series or the data was changed elsewhere e.i. cleared
+            if xs is None or ys is None or len(xs) != len(ys):
+                xs = ys = None
+            stream = StreamingSeries(xs, ys)
+            self._streams[key] = stream
+
+        stream.append(*datum)
+
+        npixels = None
+        if decimate:
+            npixels = decimate if decimate is not True else int(plot.width) or 1000
+
+        xs, ys = stream.views(npixels)
+        data.update_data({xname: xs, yname: ys})
+        return stream.ymin, stream.ymax
+
     def add_range_selector(self, plotid=0, series=0):
         from chaco.tools.range_selection import RangeSelection
         from chaco.tools.range_selection_overlay import RangeSelectionOverlay
@@ -13,13 +13,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ===============================================================================
+# ============= standard library imports ========================
+import time
+
 # ============= enthought library imports =======================
 
 from chaco.lineplot import LinePlot
 from chaco.text_box_overlay import TextBoxOverlay
 from enable.component_editor import ComponentEditor
 from numpy import linspace
-from traits.api import List, Any, Event, Callable, Dict, Int, Bool
+from traits.api import List, Any, Event, Callable, Dict, Int, Bool, Float
 from traitsui.api import View, UItem
 
 from pychron.core.helpers.fits import convert_fit
@@ -79,6 +82,10 @@ class RegressionGraph(Graph, RegressionContextMenuMixin):
     grouping = Int
     show_grouping = Bool
 
+    # minimum number of seconds between refits triggered by refresh. 0 refits on every refresh
+    refit_interval = Float(0)
+    _last_refit = 0
+
     # def __init__(self, *args, **kw):
     #     super(RegressionGraph, self).__init__(*args, **kw)
     #     self._regression_lock = Lock()
@@ -418,7 +425,16 @@ class RegressionGraph(Graph, RegressionContextMenuMixin):
     def no_regression(self, refresh=False):
         return NoRegressionCTX(self, refresh=refresh)
 
-    def refresh(self, **kw):
+    def refresh(self, force=False, **kw):
+        """
+        refit and redraw. if the last refit was less than ``refit_interval`` seconds ago only
+        redraw, unless ``force``
+        """
+        if not force and self.refit_interval:
+            if time.time() - self._last_refit < self.refit_interval:
+                self.redraw(force=False)
+                return
+
         self._update_graph()
 
     def update_metadata(self, obj, name, old, new):
@@ -434,6 +450,7 @@ class RegressionGraph(Graph, RegressionContextMenuMixin):
 
     # private
     def _update_graph(self, *args, **kw):
+        self._last_refit = time.time()
         regs = []
         for i, plot in enumerate(self.plots):
             ps = plot.plots
@@ -0,0 +1,121 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+from numpy import arange, concatenate, unique, nanmin, nanmax, isnan
+
+from pychron.core.helpers.growable_buffer import GrowableBuffer
+
+
+class StreamingSeries(object):
+    """
+    x,y series for live plots.
+
+    Points are appended to a GrowableBuffer and the y limits are tracked as points arrive, so
+    adding a point does not copy or scan the existing data.
+
+    ``views`` returns the arrays last handed to the plot. If the plot's arrays are no longer
+    those arrays (e.g. the graph was cleared) the series is out of date and should be reseeded
+    """
+
+    def __init__(self, xs=None, ys=None, capacity=256):
+        self._buffer = GrowableBuffer(xs, ys, capacity=capacity)
+        self._views = None
+
+        self.ymin = None
+        self.ymax = None
+        if xs is not None and len(xs):
+            ys = self._buffer.ys
+            if not isnan(ys).all():
+                self.ymin = nanmin(ys)
+                self.ymax = nanmax(ys)
+
+    def __len__(self):
+        return len(self._buffer)
+
+    @property
+    def xs(self):
+        return self._buffer.xs
+
+    @property
+    def ys(self):
+        return self._buffer.ys
+
+    def append(self, x, y):
+        self._buffer.append(x, y)
+
+        # nan compares False and is ignored
+        if self.ymin is None:
+            if y == y:
+                self.ymin = self.ymax = y
+        elif y < self.ymin:
+            self.ymin = y
+        elif y > self.ymax:
+            self.ymax = y
+
+    def is_current(self, xs, ys):
+        """
+        return True if ``xs``, ``ys`` are the arrays last returned by ``views``
+        """
+        v = self._views
+        return v is not None and v[0] is xs and v[1] is ys
+
+    def views(self, npixels=None):
+        """
+        arrays to hand to the plot. if ``npixels`` is given and the series has more than two
+        points per pixel it is decimated
+
+        :return: xs, ys
+        """
+        if npixels:
+            xs, ys = self.decimate(npixels)
+        else:
+            xs, ys = self.xs, self.ys
+
+        self._views = xs, ys
+        return xs, ys
+
+    def decimate(self, npixels):
+        """
+        reduce the series to at most ~2 points per pixel. the points are split into ``npixels``
+        buckets and the minimum and maximum of each bucket are kept so spikes remain visible.
+        the first and last points are always kept
+
+        :return: xs, ys
+        """
+        xs, ys = self.xs, self.ys
+        n = len(ys)
+        npixels = int(npixels)
+        if npixels < 1 or n <= 2 * npixels:
+            return xs, ys
+
+        size = n // npixels
+        m = size * npixels
+        buckets = ys[:m].reshape(npixels, size)
+        offsets = arange(npixels) * size
+
+        idx = unique(
+            concatenate(
+                (
+                    [0, n - 1],
+                    buckets.argmin(axis=1) + offsets,
+                    buckets.argmax(axis=1) + offsets,
+                    arange(m, n),
+                )
+            )
+        )
+        return xs[idx], ys[idx]
+
+
+# ============= EOF =============================================
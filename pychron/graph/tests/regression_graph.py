@@ -0,0 +1,52 @@
+import unittest
+
+from numpy import linspace
+
+from pychron.graph.regression_graph import RegressionGraph
+
+
+class RegressionGraphRefreshTestCase(unittest.TestCase):
+    def setUp(self):
+        g = RegressionGraph()
+        g.new_plot()
+        xs = linspace(0, 10, 20)
+        g.new_series(xs, 2 * xs + 1, fit="linear")
+        self.graph = g
+
+    def _predict(self, x):
+        line = self.graph.plots[0].plots["fit0"][0]
+        return line.regressor.predict(x)
+
+    def test_update_graph(self):
+        g = self.graph
+        g._last_refit = 0
+        g._update_graph()
+        self.assertGreater(g._last_refit, 0)
+        self.assertAlmostEqual(self._predict(5), 11)
+
+    def test_refresh_throttled(self):
+        g = self.graph
+        g.refit_interval = 60
+        g.refresh(force=True)
+        last = g._last_refit
+        self.assertGreater(last, 0)
+
+        # within refit_interval only redraw
+        g.refresh()
+        self.assertEqual(g._last_refit, last)
+
+        g._last_refit = last - 61
+        g.refresh()
+        self.assertGreater(g._last_refit, last - 61)
+        self.assertAlmostEqual(self._predict(5), 11)
+
+    def test_refresh_unthrottled(self):
+        g = self.graph
+        g.refit_interval = 0
+        g._last_refit = 0
+        g.refresh()
+        self.assertGreater(g._last_refit, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from numpy import array, nan, sin, linspace
+
+from pychron.graph.streaming_data import StreamingSeries
+
+
+class StreamingSeriesTestCase(unittest.TestCase):
+    def test_append(self):
+        s = StreamingSeries(capacity=2)
+        for i in range(5):
+            s.append(i, (i - 2) ** 2)
+
+        self.assertEqual(len(s), 5)
+        self.assertEqual(list(s.ys), [4, 1, 0, 1, 4])
+        self.assertEqual(s.ymin, 0)
+        self.assertEqual(s.ymax, 4)
+
+    def test_seed(self):
+        s = StreamingSeries(array([1.0, 2.0]), array([3.0, -1.0]))
+        s.append(3, 2)
+        self.assertEqual(list(s.xs), [1, 2, 3])
+        self.assertEqual((s.ymin, s.ymax), (-1, 3))
+
+    def test_nan(self):
+        s = StreamingSeries()
+        s.append(0, nan)
+        self.assertIsNone(s.ymin)
+        s.append(1, 5)
+        s.append(2, nan)
+        self.assertEqual((s.ymin, s.ymax), (5, 5))
+
+    def test_is_current(self):
+        s = StreamingSeries()
+        s.append(0, 1)
+        xs, ys = s.views()
+        self.assertTrue(s.is_current(xs, ys))
+        self.assertFalse(s.is_current(array([]), ys))
+
+        s.append(1, 2)
+        nxs, nys = s.views()
+        self.assertFalse(s.is_current(xs, ys))
+        self.assertEqual(list(xs), [0])
+
+    def test_decimate(self):
+        xs = linspace(0, 100, 10001)
+        ys = sin(xs)
+        ys[5003] = 50
+        ys[7001] = -50
+
+        s = StreamingSeries(xs, ys)
+        dxs, dys = s.views(npixels=100)
+
+        self.assertLessEqual(len(dxs), 2 * 100 + 2)
+        self.assertEqual(dys.max(), 50)
+        self.assertEqual(dys.min(), -50)
+        self.assertEqual(dxs[0], 0)
+        self.assertEqual(dxs[-1], 100)
+        self.assertTrue((dxs[1:] > dxs[:-1]).all())
+
+    def test_decimate_small(self):
+        s = StreamingSeries()
+        for i in range(10):
+            s.append(i, i)
+
+        xs, ys = s.views(npixels=100)
+        self.assertEqual(len(xs), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,6 +18,9 @@ class DummyGPActuator(GPActuator):
     def get_channel_state(self, ch, *args, **kw):
         return self._states.get(ch, False)
 
+    def get_indicator_states(self, addresses, *args, **kw):
+        return {a: self._states.get(a, False) for a in addresses}
+
     def get_state_checksum(self, *args, **kw):
         return 0
 
@@ -39,6 +39,15 @@ class GPActuator(CoreDevice):
     def get_indicator_state(self, obj, *args, **kw):
         return self.get_channel_state(obj, **kw)
 
+    def get_indicator_states(self, addresses, *args, **kw):
+        """
+        query the states of several channels with one request.
+
+        return a dict of address: state or None if the controller cannot do this, in which case
+        each channel is queried with get_indicator_state
+        """
+        return
+
     def get_state_word(self):
         return
 
@@ -127,9 +127,11 @@ class Switch(BaseSwitch):
     def state_str(self):
         return "{}{}{}".format(self.name, self.state, self.software_lock)
 
-    def _state_call(self, func, *args, **kw):
-        result = None
-        dev = None
+    def get_state_device(self):
+        """
+        :return: device, address used to query the state of this switch
+        """
+        dev, address = None, None
         if self.state_device is not None:
             dev = self.state_device
             address = self.state_address
@@ -138,7 +140,11 @@ class Switch(BaseSwitch):
             dev = self.actuator
             address = self.address
             # result = self.actuator.get_indicator_state(self, 'closed', **kw)
+        return dev, address
 
+    def _state_call(self, func, *args, **kw):
+        result = None
+        dev, address = self.get_state_device()
         if dev:
             func = getattr(dev, func)
             if func:
@@ -147,9 +153,15 @@ class Switch(BaseSwitch):
         return result
 
     def get_hardware_indicator_state(self, verbose=True):
+        result = self._state_call("get_indicator_state", "closed", verbose)
+        return self.set_hardware_indicator_state(result)
+
+    def set_hardware_indicator_state(self, result):
+        """
+        set the state from the result of an indicator state query
+        """
         msg = "Get hardware indicator state err"
 
-        result = self._state_call("get_indicator_state", "closed", verbose)
         s = result
         if not isinstance(result, bool):
             self.debug("{}: {}".format(msg, result))
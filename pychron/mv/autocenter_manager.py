@@ -49,6 +49,10 @@ class AutoCenterConfig(HasTraits):
     search_width = Int
     blocksize = Int
     blocksize_step = Int
+    # serial or otsu
+    search_mode = Str("serial")
+    # evaluate threshold bands concurrently if > 1
+    search_nworkers = Int(1)
 
     def __init__(self, yd=None, *args, **kw):
         if yd is not None:
@@ -69,6 +73,8 @@ class AutoCenterConfig(HasTraits):
             "blocksize": self.blocksize,
             "blocksize_step": self.blocksize_step,
             "use_adaptive_threshold": self.use_adaptive_threshold,
+            "search_mode": self.search_mode,
+            "nworkers": self.search_nworkers,
         }
 
 
@@ -15,6 +15,9 @@
 
 # ============= enthought library imports =======================
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, groupby
 
 from traits.api import Float
 
@@ -36,12 +39,12 @@ from numpy import (
     mean,
     zeros_like,
 )
-from operator import attrgetter
+from operator import attrgetter, itemgetter
 from skimage.morphology import watershed
 from skimage.draw import polygon, circle, circle_perimeter, circle_perimeter_aa
 from scipy import ndimage
 from skimage.exposure import rescale_intensity
-from skimage.filters import gaussian
+from skimage.filters import gaussian, threshold_otsu
 from skimage import feature
 
 # ============= local library imports  ==========================
@@ -91,6 +94,9 @@ class Locator(Loggable):
 
     alive = True
 
+    # band that produced the last target and the search time. see _find_targets
+    search_report = None
+
     def cancel(self):
         self.debug("canceling")
         self.alive = False
@@ -202,59 +208,168 @@ class Locator(Loggable):
         if inverted:
             src = invert(src)
 
-        blocksize_step = search.get("blocksize_step", 5)
-        seg = RegionSegmenter(
-            use_adaptive_threshold=search.get("use_adaptive_threshold", False),
-            blocksize=search.get("blocksize", 20),
-        )
         fa = self._get_filter_target_area(shape, dim)
-        phigh, plow = None, None
 
-        for low, high in self._generate_steps(src, search)():
-            if not self.alive:
-                self.debug("canceled")
-                return
+        def evaluate(idx, low, high):
+            return self._evaluate_band(
+                image,
+                src,
+                frame,
+                dim,
+                fa,
+                search,
+                idx,
+                low,
+                high,
+                filter_targets,
+                convexity_filter,
+            )
+
+        def set_frame(nf):
+            if set_image and image is not None:
+                image.set_frame(nf)
+
+        bands = self._iter_bands(src, search, inverted)
+        nworkers = search.get("nworkers", 1)
 
-            self.debug("bandwidth low={}, high={}".format(low, high))
+        st = time.time()
+        if nworkers > 1:
+            result = self._search_concurrent(bands, evaluate, set_frame, nworkers)
+        else:
+            result = self._search_serial(bands, evaluate, set_frame)
+
+        et = time.time() - st
+        if result:
+            idx, low, high, targets = result
+            self.search_report = {
+                "mode": search.get("search_mode", "serial"),
+                "nworkers": nworkers,
+                "index": idx,
+                "low": low,
+                "high": high,
+                "elapsed": et,
+            }
+            self.info(
+                "target found in band {} low={}, high={}. search time={:0.3f}s".format(
+                    idx, low, high, et
+                )
+            )
+            return sorted(targets, key=attrgetter("area"), reverse=True)
+        else:
+            self.search_report = None
+            self.debug("no target found. search time={:0.3f}s".format(et))
 
+    def _iter_bands(self, src, search, inverted):
+        """
+        yield (low, high) threshold bands. stop if a band is repeated
+        """
+        phigh, plow = None, None
+        for low, high in self._generate_steps(src, search)():
             if inverted:
                 low = 255 - low
                 high = 255 - high
 
-            seg.threshold_low = low
-            seg.threshold_high = high
+            if low == plow and high == phigh:
+                return
+
+            plow, phigh = low, high
+            yield low, high
 
-            if seg.threshold_low == plow and seg.threshold_high == phigh:
+    def _search_serial(self, bands, evaluate, set_frame):
+        for idx, (low, high) in enumerate(bands):
+            if not self.alive:
+                self.debug("canceled")
                 return
 
-            plow = seg.threshold_low
-            phigh = seg.threshold_high
+            targets, nf = evaluate(idx, low, high)
+            set_frame(nf)
+            if targets:
+                return idx, low, high, targets
+
+    def _search_concurrent(self, bands, evaluate, set_frame, nworkers):
+        """
+        evaluate up to ``nworkers`` bands at a time. results are consumed in band order so
+        the same band as the serial search wins
+        """
+        bands = enumerate(bands)
+        pending = deque()
+        nf = None
+
+        with ThreadPoolExecutor(
+            max_workers=nworkers, thread_name_prefix="Locator"
+        ) as executor:
+
+            def fill():
+                for idx, (low, high) in islice(bands, nworkers - len(pending)):
+                    pending.append(
+                        (idx, low, high, executor.submit(evaluate, idx, low, high))
+                    )
+
+            fill()
+            while pending:
+                if not self.alive:
+                    self.debug("canceled")
+                    for p in pending:
+                        p[3].cancel()
+                    return
 
-            nsrc = seg.segment(src)
-            seg.blocksize += blocksize_step
+                idx, low, high, future = pending.popleft()
+                targets, nf = future.result()
+                if targets:
+                    for p in pending:
+                        p[3].cancel()
+                    set_frame(nf)
+                    return idx, low, high, targets
 
-            nf = colorspace(nsrc)
+                fill()
 
-            # draw contours
-            targets = self._find_polygon_targets(nsrc, frame=nf)
-            if set_image and image is not None:
-                image.set_frame(nf)
+            if nf is not None:
+                set_frame(nf)
 
-            if targets:
+    def _evaluate_band(
+        self,
+        image,
+        src,
+        frame,
+        dim,
+        fa,
+        search,
+        idx,
+        low,
+        high,
+        filter_targets,
+        convexity_filter,
+    ):
+        """
+        segment ``src`` with the threshold band low-high and find targets
 
-                # filter targets
-                if filter_targets:
-                    targets = self._filter_targets(image, frame, dim, targets, fa)
-                elif convexity_filter:
-                    # for t in targets:
-                    #     print t.convexity, t.area, t.min_enclose_area, t.perimeter_convexity
-                    targets = [
-                        t for t in targets if t.perimeter_convexity > convexity_filter
-                    ]
+        :return: targets, segmented frame
+        """
+        self.debug("bandwidth low={}, high={}".format(low, high))
 
-            if targets:
-                return sorted(targets, key=attrgetter("area"), reverse=True)
-                # time.sleep(0.5)
+        blocksize = search.get("blocksize", 20) + idx * search.get("blocksize_step", 5)
+        seg = RegionSegmenter(
+            use_adaptive_threshold=search.get("use_adaptive_threshold", False),
+            blocksize=blocksize,
+        )
+        seg.threshold_low = low
+        seg.threshold_high = high
+
+        nsrc = seg.segment(src)
+        nf = colorspace(nsrc)
+
+        # draw contours
+        targets = self._find_polygon_targets(nsrc, frame=nf)
+        if targets:
+            # filter targets
+            if filter_targets:
+                targets = self._filter_targets(image, frame, dim, targets, fa)
+            elif convexity_filter:
+                targets = [
+                    t for t in targets if t.perimeter_convexity > convexity_filter
+                ]
+
+        return targets, nf
 
     def _generate_steps(self, src, search):
         if search.get("use_adaptive_threshold"):
@@ -262,24 +377,31 @@ class Locator(Loggable):
             def func():
                 yield 0, 255
 
-        elif search.get("use_new_style", True):
+        elif search.get("search_mode") == "otsu":
 
             def func():
-                me = int(mean(src[src > 0]))
-                bands = [2 ** n for n in range(7, 1, -1)]
-                shifts = [2, 4, 8]
+                """
+                coarse to fine. the widest bands are tried first. within a band width
+                the bands are ordered by the distance of their center from the otsu
+                threshold
+                """
+                t = threshold_otsu(src[src > 0])
+                steps = self._new_style_steps(int(t), start=0)
+                for band, bsteps in groupby(steps, key=itemgetter(0)):
+                    ordered = {}
+                    for _, m, low, high in bsteps:
+                        ordered.setdefault((low, high), abs(m - t))
+
+                    # sorted is stable. ties keep the new style order
+                    for low, high in sorted(ordered, key=ordered.get):
+                        yield low, high
 
-                for band in bands:
-                    for shift in shifts:
-                        for shift_dir in (1, -1):
-                            for i in range(1, 128):
-                                m = me - shift * i * shift_dir
-                                low = m - band / 2
-                                high = low + band
-                                if low < 0 or high > 255:
-                                    break
+        elif search.get("use_new_style", True):
 
-                                yield low, high
+            def func():
+                me = int(mean(src[src > 0]))
+                for _, _, low, high in self._new_style_steps(me):
+                    yield low, high
 
         else:
 
@@ -304,6 +426,25 @@ class Locator(Loggable):
 
         return func
 
+    def _new_style_steps(self, me, start=1):
+        """
+        :return: generator of (band, center, low, high)
+        """
+        bands = [2 ** n for n in range(7, 1, -1)]
+        shifts = [2, 4, 8]
+
+        for band in bands:
+            for shift in shifts:
+                for shift_dir in (1, -1):
+                    for i in range(start, 128):
+                        m = me - shift * i * shift_dir
+                        low = m - band / 2
+                        high = low + band
+                        if low < 0 or high > 255:
+                            break
+
+                        yield band, m, low, high
+
     def _mask(self, src, radius=None):
 
         radius *= self.pxpermm
@@ -69,6 +69,9 @@ class IsotopeEvolutionOptions(FitOptions):
     aux_plot_klass = IsoFilterFitAuxPlot
 
     show_sniff = Bool(False)
+    use_parallel_refit = Bool(False)
+    # 0 uses one process per cpu
+    refit_processes = Int(0)
 
     def initialize(self):
         self.subview_names = [MAIN]
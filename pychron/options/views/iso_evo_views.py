@@ -195,8 +195,22 @@ class IsoEvoMainOptions(MainOptions):
         )
 
         agrp = self._get_analysis_group()
+        pgrp = HGroup(
+            Item(
+                "use_parallel_refit",
+                label="Parallel Refit",
+                tooltip="Fit the isotope evolutions in multiple processes",
+            ),
+            Item(
+                "refit_processes",
+                label="Processes",
+                tooltip="Number of processes. 0 uses one process per CPU",
+                enabled_when="use_parallel_refit",
+            ),
+        )
         return VGroup(
             agrp,
+            pgrp,
             Item("controller.global_goodness_visible", label="Global Edit Visible"),
             BorderVGroup(
                 g, gg, label="Global", visible_when="controller.global_goodness_visible"
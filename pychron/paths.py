@@ -209,6 +209,9 @@ class Paths(object):
     project_dir = None
     meta_root = None
     dvc_dir = None
+    raw_sidecar_dir = None
+    persistence_journal_dir = None
+    generate_currents_checkpoint = None
     device_scan_dir = None
     isotope_dir = None
 
@@ -266,6 +269,7 @@ class Paths(object):
 
     duration_tracker = None
     duration_tracker_frequencies = None
+    duration_cache = None
     experiment_launch_history = None
     notification_triggers = None
     furnace_firmware = None
@@ -444,6 +448,9 @@ class Paths(object):
         self.dvc_dir = join(self.data_dir, ".dvc")
         self.repository_dataset_dir = join(self.dvc_dir, "repositories")
         self.meta_root = join(self.dvc_dir, "MetaData")
+        self.raw_sidecar_dir = join(self.dvc_dir, "sidecars")
+        self.persistence_journal_dir = join(self.dvc_dir, "journal")
+        self.generate_currents_checkpoint = join(self.dvc_dir, "generate_currents.json")
         self.sample_dir = join(self.data_dir, "sample_entry")
         self.media_storage_dir = join(self.data_dir, "media")
         self.offline_db_dir = join(self.data_dir, "offline_db")
@@ -496,6 +503,7 @@ class Paths(object):
         self.duration_tracker_frequencies = join(
             self.appdata_dir, "duration_tracker_frequencies.txt"
         )
+        self.duration_cache = join(self.appdata_dir, "duration_cache.json")
         self.experiment_launch_history = join(
             self.appdata_dir, "experiment_launch_history.txt"
         )
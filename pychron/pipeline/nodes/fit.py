@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ===============================================================================
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 from numpy import inf, hstack, invert
 from pyface.confirmation_dialog import confirm
@@ -43,6 +46,11 @@ from pychron.pipeline.nodes.figure import FigureNode
 from pychron.pipeline.results.define_equilibration import DefineEquilibrationResult
 from pychron.pipeline.results.iso_evo import IsoEvoResult
 from pychron.pipeline.state import get_detector_set, get_isotope_pairs_set
+from pychron.processing.isotope_refit import (
+    measurement_payload,
+    refit_measurements,
+    regression_stats,
+)
 from pychron.pychron_constants import NULL_STR
 
 
@@ -315,7 +323,12 @@ class FitIsotopeEvolutionNode(FitNode):
             if self.check_refit(unks):
                 return
 
-            fs = progress_loader(unks, self._assemble_result, threshold=1, step=10)
+            if po.use_parallel_refit and len(unks) > 1:
+                fs = self._assemble_results_parallel(unks, po.refit_processes)
+            else:
+                fs = progress_loader(
+                    unks, self._assemble_result, threshold=1, step=10
+                )
 
             if self.editor:
                 self.editor.analysis_groups = [(ai,) for ai in unks]
@@ -329,11 +342,71 @@ class FitIsotopeEvolutionNode(FitNode):
         if prog:
             prog.change_message("Load raw data {}".format(xi.record_id))
 
+        for f, k, iso in self._load_refit_isotopes(xi):
+            stats = regression_stats(iso, self._get_curvature_at(f))
+            yield self._make_result(xi, f, k, iso, stats)
+
+    def _assemble_results_parallel(self, unks, nprocesses):
+        """
+        load the raw data in this process and fit the isotopes in a process pool. an
+        analysis is submitted as soon as it is loaded so loading and fitting overlap
+        """
+        st = time.time()
+        # spawn the workers. forking a process running a gui event loop is not safe
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=nprocesses or None, mp_context=ctx
+        ) as executor:
+
+            def submit(xi, prog, i, n):
+                if prog:
+                    prog.change_message("Load raw data {}".format(xi.record_id))
+
+                isos = self._load_refit_isotopes(xi)
+                payloads = [
+                    (measurement_payload(iso), self._get_curvature_at(f))
+                    for f, k, iso in isos
+                ]
+                return xi, isos, executor.submit(refit_measurements, payloads)
+
+            jobs = progress_loader(unks, submit, threshold=1, step=10, unpack=False)
+            if not jobs:
+                # canceled. do not wait for the submitted analyses
+                executor.shutdown(wait=False, cancel_futures=True)
+                return []
+
+            fs = []
+            for xi, isos, future in jobs:
+                try:
+                    results = future.result()
+                except BaseException as e:
+                    self.warning("failed fitting {}. {}".format(xi.record_id, e))
+                    continue
+
+                for (f, k, iso), stats in zip(isos, results):
+                    # the regressor may have resolved the fit e.g. auto linear/parabolic
+                    iso.fit = stats["fit"]
+                    fs.append(self._make_result(xi, f, k, iso, stats))
+
+        self.debug(
+            "fit {} analyses with {} processes in {:0.2f}s".format(
+                len(unks), nprocesses or "auto", time.time() - st
+            )
+        )
+        return fs
+
+    def _load_refit_isotopes(self, xi):
+        """
+        load the raw data and set the fits
+
+        :return: list of (fit, key, isotope)
+        """
         fits = self._fits
         xi.load_raw_data(self._keys)
 
         xi.set_fits(fits)
         isotopes = xi.isotopes
+        ret = []
         for f in fits:
             k = f.name
             if k in isotopes:
@@ -342,124 +415,125 @@ class FitIsotopeEvolutionNode(FitNode):
                 iso = xi.get_isotope(detector=k, kind="baseline")
 
             if iso:
-                i, e = iso.value, iso.error
-                try:
-                    pe = abs(e / i * 100)
-                except ZeroDivisionError:
-                    pe = inf
-
-                smart_filter_coefficients = f.get_filter_coefficients()
-                if smart_filter_coefficients:
-                    smart_filter_threshold = f.smart_filter_values(i)
-                    smart_filter_goodness = e < f.smart_filter_values(i)
-
-                goodness_threshold = f.goodness_threshold
-                int_err_goodness = None
-                if goodness_threshold:
-                    int_err_goodness = bool(pe < goodness_threshold)
-
-                signal_to_baseline_threshold = f.signal_to_baseline_goodness
-                signal_to_baseline_percent_threshold = (
-                    f.signal_to_baseline_percent_goodness
-                )
-                signal_to_baseline_goodness = None
-                signal_to_baseline = 0
-                if hasattr(iso, "baseline"):
-                    bs = iso.baseline.error
-                    signal_to_baseline = abs(bs / i * 100)
-                    if (
-                        signal_to_baseline_threshold
-                        and signal_to_baseline_percent_threshold
-                    ):
-                        if signal_to_baseline > signal_to_baseline_threshold:
-                            signal_to_baseline_goodness = bool(
-                                pe < signal_to_baseline_percent_threshold
-                            )
-
-                slope = iso.get_slope()
-                slope_goodness = None
-                slope_threshold = None
-                if f.slope_goodness:
-                    if f.slope_goodness_intensity < i:
-                        slope_threshold = f.slope_goodness
-                        slope_goodness = bool(slope < 0 or slope < slope_threshold)
-
-                outliers = iso.noutliers()
-                outliers_threshold = None
-                outlier_goodness = None
-                if f.outlier_goodness:
-                    outliers_threshold = f.outlier_goodness
-                    outlier_goodness = bool(outliers < f.outlier_goodness)
-
-                curvature_goodness = None
-                curvature = 0
-                curvature_threshold = None
-                if f.curvature_goodness:
-                    curvature = iso.get_curvature(f.curvature_goodness_at)
-                    curvature_threshold = f.curvature_goodness
-                    curvature_goodness = curvature < curvature_threshold
-
-                nstr = str(iso.n)
-                if iso.noutliers():
-                    nstr = "{}({})".format(iso.n - iso.noutliers(), nstr)
-
-                rsquared = iso.rsquared_adj
-                rsquared_goodness = None
-                rsquared_threshold = 0
-                if f.rsquared_goodness:
-                    rsquared_threshold = f.rsquared_goodness
-                    rsquared_goodness = rsquared > rsquared_threshold
-
-                if hasattr(iso, "blank"):
-                    signal_to_blank = iso.blank.value / iso.value * 100
-                else:
-                    signal_to_blank = 0
-
-                signal_to_blank_goodness = None
-                signal_to_blank_threshold = 0
-                if f.signal_to_blank_goodness:
-                    signal_to_blank_threshold = f.signal_to_blank_goodness
-                    signal_to_blank_goodness = (
-                        signal_to_blank < signal_to_blank_threshold
+                ret.append((f, k, iso))
+        return ret
+
+    def _get_curvature_at(self, f):
+        if f.curvature_goodness:
+            return f.curvature_goodness_at
+
+    def _make_result(self, xi, f, k, iso, stats):
+        i, e = stats["value"], stats["error"]
+        try:
+            pe = abs(e / i * 100)
+        except ZeroDivisionError:
+            pe = inf
+
+        smart_filter_coefficients = f.get_filter_coefficients()
+        if smart_filter_coefficients:
+            smart_filter_threshold = f.smart_filter_values(i)
+            smart_filter_goodness = e < f.smart_filter_values(i)
+
+        goodness_threshold = f.goodness_threshold
+        int_err_goodness = None
+        if goodness_threshold:
+            int_err_goodness = bool(pe < goodness_threshold)
+
+        signal_to_baseline_threshold = f.signal_to_baseline_goodness
+        signal_to_baseline_percent_threshold = f.signal_to_baseline_percent_goodness
+        signal_to_baseline_goodness = None
+        signal_to_baseline = 0
+        if stats["baseline_error"] is not None:
+            bs = stats["baseline_error"]
+            signal_to_baseline = abs(bs / i * 100)
+            if signal_to_baseline_threshold and signal_to_baseline_percent_threshold:
+                if signal_to_baseline > signal_to_baseline_threshold:
+                    signal_to_baseline_goodness = bool(
+                        pe < signal_to_baseline_percent_threshold
                     )
 
-                yield IsoEvoResult(
-                    analysis=xi,
-                    isotope_obj=iso,
-                    nstr=nstr,
-                    intercept_value=i,
-                    intercept_error=e,
-                    normalized_error=e * iso.n ** 0.5,
-                    percent_error=pe,
-                    int_err=pe,
-                    int_err_threshold=goodness_threshold,
-                    int_err_goodness=int_err_goodness,
-                    slope=slope,
-                    slope_threshold=slope_threshold,
-                    slope_goodness=slope_goodness,
-                    outlier=outliers,
-                    outlier_threshold=outliers_threshold,
-                    outlier_goodness=outlier_goodness,
-                    curvature=curvature,
-                    curvature_threshold=curvature_threshold,
-                    curvature_goodness=curvature_goodness,
-                    rsquared=rsquared,
-                    rsquared_threshold=rsquared_threshold,
-                    rsquared_goodness=rsquared_goodness,
-                    signal_to_blank=signal_to_blank,
-                    signal_to_blank_threshold=signal_to_blank_threshold,
-                    signal_to_blank_goodness=signal_to_blank_goodness,
-                    signal_to_baseline=signal_to_baseline,
-                    signal_to_baseline_goodness=signal_to_baseline_goodness,
-                    signal_to_baseline_threshold=signal_to_baseline_threshold,
-                    signal_to_baseline_percent_threshold=signal_to_baseline_percent_threshold,
-                    smart_filter_goodness=smart_filter_goodness,
-                    smart_filter_threshold=smart_filter_threshold,
-                    smart_filter=e,
-                    regression_str=iso.regressor.tostring(),
-                    fit=iso.fit,
-                    isotope=k,
-                )
+        slope = stats["slope"]
+        slope_goodness = None
+        slope_threshold = None
+        if f.slope_goodness:
+            if f.slope_goodness_intensity < i:
+                slope_threshold = f.slope_goodness
+                slope_goodness = bool(slope < 0 or slope < slope_threshold)
+
+        outliers = stats["noutliers"]
+        outliers_threshold = None
+        outlier_goodness = None
+        if f.outlier_goodness:
+            outliers_threshold = f.outlier_goodness
+            outlier_goodness = bool(outliers < f.outlier_goodness)
+
+        curvature_goodness = None
+        curvature = stats["curvature"]
+        curvature_threshold = None
+        if f.curvature_goodness:
+            curvature_threshold = f.curvature_goodness
+            curvature_goodness = curvature < curvature_threshold
+
+        n = stats["n"]
+        nstr = str(n)
+        if outliers:
+            nstr = "{}({})".format(n - outliers, nstr)
+
+        rsquared = stats["rsquared_adj"]
+        rsquared_goodness = None
+        rsquared_threshold = 0
+        if f.rsquared_goodness:
+            rsquared_threshold = f.rsquared_goodness
+            rsquared_goodness = rsquared > rsquared_threshold
+
+        if hasattr(iso, "blank"):
+            signal_to_blank = iso.blank.value / i * 100
+        else:
+            signal_to_blank = 0
+
+        signal_to_blank_goodness = None
+        signal_to_blank_threshold = 0
+        if f.signal_to_blank_goodness:
+            signal_to_blank_threshold = f.signal_to_blank_goodness
+            signal_to_blank_goodness = signal_to_blank < signal_to_blank_threshold
+
+        return IsoEvoResult(
+            analysis=xi,
+            isotope_obj=iso,
+            nstr=nstr,
+            intercept_value=i,
+            intercept_error=e,
+            normalized_error=e * n ** 0.5,
+            percent_error=pe,
+            int_err=pe,
+            int_err_threshold=goodness_threshold,
+            int_err_goodness=int_err_goodness,
+            slope=slope,
+            slope_threshold=slope_threshold,
+            slope_goodness=slope_goodness,
+            outlier=outliers,
+            outlier_threshold=outliers_threshold,
+            outlier_goodness=outlier_goodness,
+            curvature=curvature,
+            curvature_threshold=curvature_threshold,
+            curvature_goodness=curvature_goodness,
+            rsquared=rsquared,
+            rsquared_threshold=rsquared_threshold,
+            rsquared_goodness=rsquared_goodness,
+            signal_to_blank=signal_to_blank,
+            signal_to_blank_threshold=signal_to_blank_threshold,
+            signal_to_blank_goodness=signal_to_blank_goodness,
+            signal_to_baseline=signal_to_baseline,
+            signal_to_baseline_goodness=signal_to_baseline_goodness,
+            signal_to_baseline_threshold=signal_to_baseline_threshold,
+            signal_to_baseline_percent_threshold=signal_to_baseline_percent_threshold,
+            smart_filter_goodness=smart_filter_goodness,
+            smart_filter_threshold=smart_filter_threshold,
+            smart_filter=e,
+            regression_str=stats["regression_str"],
+            fit=stats["fit"],
+            isotope=k,
+        )
 
 
 class DefineEquilibrationNode(FitNode):
@@ -33,7 +33,11 @@ from pychron.core.helpers.formatting import floatfmt
 from pychron.core.helpers.iterfuncs import groupby_key
 from pychron.core.stats import calculate_weighted_mean
 from pychron.core.stats.peak_detection import fast_find_peaks
-from pychron.core.stats.probability_curves import cumulative_probability, kernel_density
+from pychron.core.stats.probability_curves import (
+    cumulative_probability,
+    kernel_density,
+    asymptotic_limits,
+)
 from pychron.graph.explicit_legend import ExplicitLegend
 from pychron.graph.ticks import IntTickGenerator
 from pychron.pipeline.plot.overlays.correlation_ellipses_overlay import (
@@ -689,11 +693,8 @@ class Ideogram(BaseArArFigure):
             )
             plot.overlays.append(o)
 
-            def cfunc(x1, x2):
-                return cumulative_probability(self.xs, self.xes, x1, x2, n=N)
-
             xs, ys, xmi, xma = self._calculate_asymptotic_limits(
-                cfunc, tol=self.options.asymptotic_height_percent
+                self.xs, self.xes, tol=self.options.asymptotic_height_percent
             )
             oo = IdeogramInset(
                 xs,
@@ -1038,65 +1039,28 @@ class Ideogram(BaseArArFigure):
 
         else:
             if opt.use_asymptotic_limits and calculate_limits:
-
-                def cfunc(x1, x2):
-                    return cumulative_probability(ages, errors, x1, x2, n=N)
-
                 bins, probs, x1, x2 = self._calculate_asymptotic_limits(
-                    cfunc, tol=(opt.asymptotic_height_percent or 10)
+                    ages, errors, tol=(opt.asymptotic_height_percent or 10)
                 )
                 self.trait_setq(xmi=x1, xma=x2)
 
                 return bins, probs
             else:
-                return cumulative_probability(ages, errors, xmi, xma, n=N)
+                return cumulative_probability(
+                    ages, errors, xmi, xma, n=N, adaptive=True
+                )
 
     def _calculate_nominal_xlimits(self):
         return self.min_x(self.options.index_attr), self.max_x(self.options.index_attr)
 
-    def _calculate_asymptotic_limits(self, cfunc, max_iter=200, tol=10):
-        tol *= 0.01
-        rx1, rx2 = None, None
-        xs, ys = None, None
+    def _calculate_asymptotic_limits(self, ages, errors, tol=10):
+        """
+        returns xs,ys,xmi,xma
+        """
         xmi, xma = self._calculate_nominal_xlimits()
-        x1, x2 = xmi, xma
-
-        step_percent = 0.005
-        step = step_percent * (xma - xmi)
-        # aw = int(asymptotic_width * N * 0.01)
-        for i in range(max_iter):
-            if rx1 is None:
-                x1 -= step
-            else:
-                x1 = rx1
-
-            if rx2 is None:
-                x2 += step
-            else:
-                x2 = rx2
-
-            # grow step size
-            step = step_percent * (x2 - x1)
-
-            xs, ys = cfunc(x1, x2)
-            tt = tol * ys.max()
-            if rx1 is None:
-                if ys[0] < tt:
-                    rx1 = x1
-
-            if rx2 is None:
-                if ys[-1] < tt:
-                    rx2 = x2
-
-            if rx1 is not None and rx2 is not None:
-                break
-
-        if rx1 is None:
-            rx1 = x1
-        if rx2 is None:
-            rx2 = x2
-
-        return xs, ys, rx1, rx2
+        x1, x2 = asymptotic_limits(ages, errors, tol * 0.01, xmi, xma)
+        xs, ys = cumulative_probability(ages, errors, x1, x2, n=N, adaptive=True)
+        return xs, ys, x1, x2
 
     def _calculate_asymptotic_limits2(
         self, cfunc, max_iter=200, asymptotic_width=10, tol=10
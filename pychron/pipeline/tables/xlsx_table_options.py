@@ -211,6 +211,7 @@ Ages calculated relative to FC-2 Fish Canyon Tuff sanidine interlaboratory stand
     summary_sheet_name = dumpable(Str("Summary"))
 
     exclude_hidden_columns = dumpable(Bool(False))
+    use_constant_memory = dumpable(Bool(False))
 
     def __init__(self, name, *args, **kw):
         self._persistence_name = name
@@ -312,7 +313,16 @@ Ages calculated relative to FC-2 Fish Canyon Tuff sanidine interlaboratory stand
             Item("summary_sheet_name", label="Summary"),
             label="Sheet Names",
         )
-        behavior_grp = BorderVGroup(Item("exclude_hidden_columns"), label="Behavior")
+        behavior_grp = BorderVGroup(
+            Item("exclude_hidden_columns"),
+            Item(
+                "use_constant_memory",
+                label="Low Memory",
+                tooltip="Write each row to disk as soon as it is complete. Use for very "
+                "large tables",
+            ),
+            label="Behavior",
+        )
 
         def note(name):
             tag = "{}s".format(name.capitalize())
@@ -65,8 +65,45 @@ def format_mswd(t, n=3):
     return FM(m, v, include_tag=True, n=n)
 
 
+class FormatRegistry(object):
+    """
+    workbook formats interned by their properties.
+
+    xlsxwriter writes a format record for every ``add_format`` call. the same format is
+    returned for the same properties so a table only contains the distinct formats it uses.
+    interned formats are shared and must not be modified
+    """
+
+    def __init__(self, workbook):
+        self._workbook = workbook
+        self._formats = {}
+
+    def __len__(self):
+        return len(self._formats)
+
+    def get(self, *props, **kw):
+        """
+        :param props: dicts of format properties. None is ignored
+        :param kw: additional format properties
+        :return: Format
+        """
+        p = {}
+        for pi in props:
+            if pi:
+                p.update(pi)
+        p.update(kw)
+
+        key = tuple(sorted(p.items()))
+        try:
+            return self._formats[key]
+        except KeyError:
+            fmt = self._formats[key] = self._workbook.add_format(p)
+            return fmt
+
+
 class XLSXAnalysisTableWriter(BaseTableWriter):
     _workbook = None
+    _formats = None
     _current_row = 0
     _bold = None
     _superscript = None
@@ -75,29 +112,45 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
     _options = Instance(XLSXAnalysisTableWriterOptions)
 
     def _new_workbook(self, path):
-        self._workbook = xlsxwriter.Workbook(
-            add_extension(path, ".xlsx"), {"nan_inf_to_errors": True}
-        )
+        options = {"nan_inf_to_errors": True}
+        if self._options.use_constant_memory:
+            # rows are flushed to disk as soon as the next row is started
+            options["constant_memory"] = True
+
+        self._workbook = xlsxwriter.Workbook(add_extension(path, ".xlsx"), options)
+        self._formats = FormatRegistry(self._workbook)
 
     def build(self, groups, path=None, options=None):
         if options is None:
             options = XLSXAnalysisTableWriterOptions()
 
-        self._options = options
         if path is None:
             path = options.path
 
+        self._write_workbook(groups, path, options)
+
+        view = self._options.auto_view
+        if not view:
+            view = confirm(None, "Table saved to {}\n\nView Table?".format(path)) == YES
+
+        if view:
+            view_file(path, application="Excel")
+
+    # private
+    def _write_workbook(self, groups, path, options):
+        self._options = options
+
         self.debug("saving table to {}".format(path))
         r_mkdir(os.path.dirname(path))
 
         self._new_workbook(path)
 
-        self._bold = self._workbook.add_format({"bold": True})
-        self._superscript = self._workbook.add_format({"font_script": 1})
-        self._subscript = self._workbook.add_format({"font_script": 2})
-        self._bsuperscript = self._workbook.add_format({"font_script": 1, "bold": True})
-        self._bsubscript = self._workbook.add_format({"font_script": 2, "bold": True})
-        self._ital = self._workbook.add_format({"italic": True})
+        self._bold = self._formats.get(bold=True)
+        self._superscript = self._formats.get(font_script=1)
+        self._subscript = self._formats.get(font_script=2)
+        self._bsuperscript = self._formats.get(font_script=1, bold=True)
+        self._bsubscript = self._formats.get(font_script=2, bold=True)
+        self._ital = self._formats.get(italic=True)
 
         unknowns = groups.get("unknowns")
         if unknowns:
@@ -128,16 +181,9 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             if unknowns:
                 self._make_summary_sheet(unknowns)
 
+        self.debug("formats={}".format(len(self._formats)))
         self._workbook.close()
 
-        view = self._options.auto_view
-        if not view:
-            view = confirm(None, "Table saved to {}\n\nView Table?".format(path)) == YES
-
-        if view:
-            view_file(path, application="Excel")
-
-    # private
     def _get_detectors(self, grps):
         def rec_dets(dets, a):
             if isinstance(a, InterpretedAgeGroup):
@@ -735,7 +781,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         cols = [c for c in cols if c.visible]
         self._make_title(sh, "Summary", cols, key="summary")
 
-        fmt = self._workbook.add_format({"bottom": 1, "align": "center"})
+        fmt = self._formats.get(bottom=1, align="center")
         sh.set_row(self._current_row, 5)
         self._current_row += 1
 
@@ -976,9 +1022,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             self.debug_exception()
             title = None
 
-        fmt = self._workbook.add_format(
-            {"font_size": 14, "bold": True, "bottom": 6 if not title else 0}
-        )
+        fmt = self._formats.get(font_size=14, bold=True, bottom=6 if not title else 0)
 
         if title is None:
             title = "Table X. {}".format(name)
@@ -1013,8 +1057,8 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
     def _write_header(self, sh, cols, include_units=True):
         names, units = self._get_names_units(cols)
 
-        border = self._workbook.add_format({"bottom": 2, "align": "center"})
-        center = self._workbook.add_format({"align": "center"})
+        border = self._formats.get(bottom=2, align="center")
+        center = self._formats.get(align="center")
         if include_units:
             t = ((names, False), (units, True))
         else:
@@ -1085,14 +1129,11 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             (i for i, c in enumerate(cols) if c.attr == "cumulative_ar39"), 0
         )
 
-        fmt = self._get_number_format("summary_age")
-        kcafmt = self._get_number_format("summary_kca")
+        fmt = self._get_number_format("summary_age", bottom=1)
+        kcafmt = self._get_number_format("summary_kca", bottom=1)
 
-        fmt.set_bottom(1)
-        kcafmt.set_bottom(1)
-
-        fmt2 = self._workbook.add_format({"bottom": 1, "bold": True})
-        border = self._workbook.add_format({"bottom": 1})
+        fmt2 = self._formats.get(bottom=1, bold=True)
+        border = self._formats.get(bottom=1)
 
         for i in range(age_idx + 1):
             sh.write_blank(row, i, "", fmt)
@@ -1134,14 +1175,20 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             sh.write_number(row, cum_idx, ag.valid_total_ar39(), fmt)
         self._current_row += 1
 
-    def _get_number_format(self, kind=None, use_scientific=False, sig_figs=2):
+    def _get_number_format(self, kind=None, use_scientific=False, sig_figs=2, **kw):
+        """
+        :param kw: additional format properties e.g. bold=True
+        """
+        props = self._get_number_format_props(kind, use_scientific, sig_figs)
+        return self._formats.get(props, **kw)
+
+    def _get_number_format_props(self, kind=None, use_scientific=False, sig_figs=2):
         if kind:
             try:
                 sig_figs = getattr(self._options, "{}_sig_figs".format(kind))
             except AttributeError as e:
                 sig_figs = self._options.sig_figs
 
-        fn = self._workbook.add_format()
         if use_scientific:
             fmt = "0.0E+00"
         else:
@@ -1151,27 +1198,29 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         # if not self._options.ensure_trailing_zeros:
         #     fmt = '{}#'.format(fmt)
 
-        fn.set_num_format(fmt)
-        return fn
+        return {"num_format": fmt}
 
     def _make_analysis(
         self, sh, cols, item, is_last=False, is_plateau_step=None, cum=""
     ):
         row = self._current_row
 
-        fmt = self._workbook.add_format()
+        # properties added to every cell of this row
+        rprops = {}
+        if is_last:
+            rprops["bottom"] = 1
 
         status = "X" if item.is_omitted() else ""
-        highlight_color = self._options.highlight_color.name()
         if is_plateau_step is False:
-            fmt.set_bg_color(highlight_color)
-            sh.set_row(0, -1, fmt)
+            rprops["bg_color"] = self._options.highlight_color.name()
+            sh.set_row(0, -1, self._formats.get(bg_color=rprops["bg_color"]))
             if not status:
                 status = "pX"
 
+        fmt = self._formats.get(rprops)
         sh.write(row, 0, status, fmt)
 
-        pcfmt = None
+        pcprops = None
         for j, c in enumerate(cols[1:]):
             if c.attr == "cumulative_ar39":
                 txt = cum
@@ -1181,24 +1230,17 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             if self._options.use_standard_sigfigs:
                 if isinstance(c, SigFigColumn):
                     # get the txt from the next column to determine number of sigfigs
-                    cfmt = pcfmt = self._get_standard_sigfig_fmt(
+                    cprops = pcprops = self._get_standard_sigfig_props(
                         c, self._get_txt(item, cols[j + 2])
                     )
                 elif isinstance(c, SigFigEColumn):
-                    cfmt = pcfmt
+                    cprops = pcprops
                 else:
-                    cfmt = self._get_fmt(c)
+                    cprops = self._get_fmt_props(c)
             else:
-                cfmt = self._get_fmt(c)
+                cprops = self._get_fmt_props(c)
 
-            if cfmt:
-                if is_plateau_step is False:
-                    cfmt.set_bg_color(highlight_color)
-            else:
-                cfmt = fmt
-
-            if is_last:
-                cfmt.set_bottom(1)
+            cfmt = self._formats.get(cprops, rprops) if cprops else fmt
 
             if c.label in ("N", "Power"):
                 sh.write(row, j + 1, txt, cfmt)
@@ -1218,8 +1260,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         fmt = self._bold
         start_col = 0
         if self._options.include_summary_kca:
-            nfmt = self._get_number_format("asummary_kca")
-            nfmt.set_bold(True)
+            nfmt = self._get_number_format("asummary_kca", bold=True)
 
             kcalabel = "Ca/K" if self._options.invert_kca_kcl else "K/Ca"
             idx = next((i for i, c in enumerate(cols) if c.label == kcalabel), 3)
@@ -1251,8 +1292,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             sh.write_string(self._current_row, idx + 2, pv.error_kind, fmt)
             self._current_row += 1
 
-        nfmt = self._get_number_format("asummary_age")
-        nfmt.set_bold(True)
+        nfmt = self._get_number_format("asummary_age", bold=True)
 
         idx = next((i for i, c in enumerate(cols) if c.label == "Age"), 5)
 
@@ -1381,15 +1421,14 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
                 " {}".format(PLUSMINUS_NSIGMA.format(nsigma)),
             )
 
-            nfmt = self._get_number_format("asummary_trapped_ratio")
-            nfmt.set_bold(True)
+            nfmt = self._get_number_format("asummary_trapped_ratio", bold=True)
             sh.write_number(self._current_row, idx, trapped_value, nfmt)
             sh.write_number(self._current_row, idx + 1, trapped_error * nsigma, nfmt)
 
             self._current_row += 1
 
     def _make_notes(self, groups, sh, ncols, key):
-        top = self._workbook.add_format({"top": 1, "bold": True})
+        top = self._formats.get(top=1, bold=True)
 
         sh.write_string(self._current_row, 0, "Notes:", top)
         for i in range(1, ncols):
@@ -1450,15 +1489,15 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
 
         self._write_notes(sh, notes)
 
-    def _make_blanks_notes(self, sh):
+    def _make_blanks_notes(self, groups, sh):
         notes = six.text_type(self._options.blank_notes)
         self._write_notes(sh, notes)
 
-    def _make_airs_notes(self, sh):
+    def _make_airs_notes(self, groups, sh):
         notes = six.text_type(self._options.air_notes)
         self._write_notes(sh, notes)
 
-    def _make_monitor_notes(self, sh):
+    def _make_monitors_notes(self, groups, sh):
         notes = six.text_type(self._options.monitor_notes)
         self._write_notes(sh, notes)
 
@@ -1479,7 +1518,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         units = [c.units for c in cols]
         return names, units
 
-    def _get_standard_sigfig_fmt(self, col, txt):
+    def _get_standard_sigfig_props(self, col, txt):
         try:
             kind = None
             sf = math.ceil((abs(math.log10(txt))))
@@ -1487,26 +1526,30 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             kind = col.sigformat
             sf = 2
 
-        fmt = self._get_number_format(
+        props = self._get_number_format_props(
             kind=kind, use_scientific=col.use_scientific, sig_figs=sf
         )
 
         if txt >= 1:
-            fmt.set_num_format("0")
+            props["num_format"] = "0"
 
-        return fmt
+        return props
 
     def _get_fmt(self, col):
-        fmt = None
+        props = self._get_fmt_props(col)
+        if props:
+            return self._formats.get(props)
+
+    def _get_fmt_props(self, col):
+        props = None
         if col.sigformat:
-            fmt = self._get_number_format(col.sigformat, col.use_scientific)
+            props = self._get_number_format_props(col.sigformat, col.use_scientific)
 
         elif col.fformat:
-            fmt = self._workbook.add_format()
-            for cmd, args in col.fformat:
-                getattr(fmt, cmd)(*args)
+            # e.g. ("set_num_format", ("mm/dd/yy hh:mm",))
+            props = {cmd[4:]: args[0] for cmd, args in col.fformat}
 
-        return fmt
+        return props
 
     def _get_txt(self, item, col):
         attr = col.attr
@@ -24,12 +24,22 @@ from binascii import hexlify
 from math import isnan, isinf
 
 import six
-from numpy import array, Inf, polyfit, gradient, array_split, mean, isfinite
+from numpy import (
+    array,
+    Inf,
+    polyfit,
+    gradient,
+    array_split,
+    mean,
+    isfinite,
+    float64,
+)
 from uncertainties import ufloat, nominal_value, std_dev
 
 from pychron.core.geometry.geometry import curvature_at
-from pychron.core.helpers.binpack import unpack
+from pychron.core.helpers.binpack import unpack_columns, pack_columns
 from pychron.core.helpers.fits import natural_name_fit, fit_to_degree
+from pychron.core.helpers.growable_buffer import GrowableBuffer
 from pychron.core.regression.least_squares_regressor import (
     ExponentialRegressor,
     FitError,
@@ -61,6 +71,8 @@ class BaseMeasurement(object):
     detector_serial_id = None
     group_data = 0
     _regressor = None
+    _buffer = None
+    _buffer_xs = None
 
     @property
     def n(self):
@@ -100,12 +112,36 @@ class BaseMeasurement(object):
 
         return xs, ys
 
+    def append_data(self, x, y):
+        """
+        append a single sample. samples are accumulated in a GrowableBuffer and ``xs``, ``ys``
+        are views into it until ``freeze_data`` is called
+        """
+        buf = self._buffer
+        # xs was replaced (e.g. unpacked or cleared) since the last append. reseed the buffer
+        if buf is None or self.xs is not self._buffer_xs:
+            buf = self._buffer = GrowableBuffer(self.xs, self.ys)
+
+        buf.append(x, y)
+        self.xs = self._buffer_xs = buf.xs
+        self.ys = buf.ys
+
+    def freeze_data(self):
+        """
+        replace the acquisition buffer views with trimmed arrays
+        """
+        buf = self._buffer
+        if buf is not None:
+            if self.xs is self._buffer_xs:
+                self.xs, self.ys = buf.freeze()
+            self._buffer = None
+            self._buffer_xs = None
+
     def pack(self, endianness=None, as_hex=True):
         if endianness is None:
             endianness = self.endianness
 
-        fmt = "{}ff".format(endianness)
-        txt = b"".join((struct.pack(fmt, x, y) for x, y in zip(self.xs, self.ys)))
+        txt = pack_columns("{}ff".format(endianness), self.xs, self.ys)
         if as_hex:
             txt = hexlify(txt)
         return txt
@@ -123,19 +159,40 @@ class BaseMeasurement(object):
         if n_only:
             self.n = len(xs)
         else:
-            self.xs = array(xs)
-            self.ys = array(ys)
+            self.xs = xs
+            self.ys = ys
 
             # print self.name, self.xs.shape, self.ys.shape
             # print self.name, self.ys
 
+    def set_unpacked_data(self, xs, ys, n_only=False):
+        """
+        set data that has already been decoded, e.g. from a raw data sidecar. xs, ys are the
+        first and second columns of the blob and are used as is (no copy)
+        """
+        if xs is None:
+            return
+
+        if self.reverse_unpack:
+            xs, ys = ys, xs
+
+        if n_only:
+            self.n = len(xs)
+        else:
+            self.xs = xs
+            self.ys = ys
+
     def _unpack_blob(self, blob, endianness=None):
         if endianness is None:
             endianness = self.endianness
 
         try:
-            x, y = unpack(blob, fmt="{}ff".format(endianness))
-            # x, y = zip(*[struct.unpack('{}ff'.format(endianness), blob[i:i + 8]) for i in range(0, len(blob), 8)])
+            x, y = unpack_columns(blob, fmt="{}ff".format(endianness))
+            if not len(x):
+                raise ValueError("no complete records in blob")
+
+            # convert to float64 to match the arrays previously built from python floats
+            x, y = x.astype(float64), y.astype(float64)
             if self.reverse_unpack:
                 return y, x
             else:
@@ -18,7 +18,6 @@
 import logging
 import os
 
-from numpy import append as npappend
 from traits.api import Property, Dict, Str
 from traits.has_traits import HasTraits
 from uncertainties import ufloat
@@ -266,10 +265,7 @@ class IsotopeGroup(HasTraits):
             if kind == "sniff":
                 isotope._value = signal
 
-            xs = npappend(isotope.xs, x)
-            ys = npappend(isotope.ys, signal)
-            isotope.xs = xs
-            isotope.ys = ys
+            isotope.append_data(x, signal)
             # isotope.dirty = True
 
         isotopes = self.isotopes
@@ -288,6 +284,14 @@ class IsotopeGroup(HasTraits):
                     _append(isotopes[i])
                     return True
 
+    def freeze_data(self):
+        """
+        release the acquisition buffers used by append_data. call when data collection is finished
+        """
+        for iso in self.itervalues():
+            for m in (iso, iso.baseline, iso.sniff, iso.whiff):
+                m.freeze_data()
+
     def clear_baselines(self):
         for k in self.isotopes:
             self.set_baseline(k, None, (0, 0))
@@ -0,0 +1,105 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+Refit isotope evolutions in worker processes.
+
+An isotope is shipped to a worker as a plain payload (data, fit, filtering and truncation
+settings). The worker rebuilds the measurement and calls ``regression_stats``, the same function
+the serial refit uses, so both paths produce identical results.
+"""
+from pychron.processing.isotope import Isotope, Baseline
+
+MEASUREMENT_ATTRS = (
+    "xs",
+    "ys",
+    "time_zero_offset",
+    "group_data",
+    "_n",
+    "_fit",
+    "error_type",
+    "filter_outliers_dict",
+    "truncate",
+    "use_stored_value",
+    "user_defined_value",
+    "user_defined_error",
+    "_value",
+    "_error",
+)
+
+
+def measurement_payload(iso):
+    """
+    :param iso: Isotope or Baseline
+    :return: picklable dict
+    """
+    p = {a: getattr(iso, a) for a in MEASUREMENT_ATTRS}
+    p["name"] = iso.name
+    p["detector"] = iso.detector
+
+    baseline = getattr(iso, "baseline", None)
+    p["baseline"] = measurement_payload(baseline) if baseline is not None else None
+    return p
+
+
+def measurement_factory(p):
+    if p["baseline"] is None:
+        m = Baseline(p["name"], p["detector"])
+    else:
+        m = Isotope(p["name"], p["detector"])
+        m.baseline = measurement_factory(p["baseline"])
+
+    for a in MEASUREMENT_ATTRS:
+        setattr(m, a, p[a])
+    return m
+
+
+def regression_stats(iso, curvature_at=None):
+    """
+    fit ``iso`` and return the values needed to evaluate the goodness of the fit
+
+    :param curvature_at: if not None calculate the curvature at this x
+    :return: dict
+    """
+    value, error = iso.value, iso.error
+    stats = {
+        "value": value,
+        "error": error,
+        "baseline_error": iso.baseline.error if hasattr(iso, "baseline") else None,
+        "slope": iso.get_slope(),
+        "noutliers": iso.noutliers(),
+        "curvature": 0,
+        "n": iso.n,
+        "rsquared_adj": iso.rsquared_adj,
+        "regression_str": iso.regressor.tostring(),
+        "fit": iso.fit,
+    }
+    if curvature_at is not None:
+        stats["curvature"] = iso.get_curvature(curvature_at)
+
+    return stats
+
+
+def refit_measurements(payloads):
+    """
+    process pool entry point
+
+    :param payloads: list of (measurement payload, curvature_at)
+    :return: list of regression_stats dicts
+    """
+    return [regression_stats(measurement_factory(p), c) for p, c in payloads]
+
+
+# ============= EOF =============================================
@@ -72,20 +72,24 @@ class Plateau(HasTraits):
             self.use_overlap = True
 
         n = len(self.ages)
-        excludes = self.excludes
+        excludes = set(self.excludes)
         ss = [s for i, s in enumerate(self.signals) if i not in excludes]
 
         self.total_signal = float(sum(ss))
         # log.info(self.total_signal)
 
+        # plain python floats are much faster to index than numpy scalars
+        ages = [float(a) for a in self.ages]
+        errors = [float(e) for e in self.errors]
+        signals = [0 if i in excludes else s for i, s in enumerate(self.signals)]
+
         idxs = []
         spans = []
 
-        overlap_func = memoize(self._overlap)
         for i in range(n):
             if i in excludes:
                 continue
-            idx = self._find_plateaus(n, i, excludes, overlap_func)
+            idx = self._find_plateaus(n, i, excludes, ages, errors, signals)
             if idx:
                 # log.debug('found {} {}'.format(*idx))
                 idxs.append(idx)
@@ -96,25 +100,72 @@ class Plateau(HasTraits):
 
         return idxs
 
-    def _find_plateaus(self, n, start, excludes, overlap_func):
+    def _find_plateaus(self, n, start, excludes, ages, errors, signals):
+        """
+        scan forward from start keeping running values so that each end is checked in constant
+        time
+
+        overlap (fleck). every pair of steps in start..end, including excluded steps, must overlap.
+        the steps before end already overlap pairwise so only the new step needs to be checked
+        against the max lower bound and min upper bound of the previous steps
+
+        released gas. running sum of the non-excluded signals
+
+        mswd (mahon). running weighted mean and chi2 of the non-excluded steps
+        """
+        use_overlap, use_mswd = self.use_overlap, self.use_mswd
+        sigma = self.overlap_sigma
+        nsteps = self.nsteps
+        total_signal = self.total_signal
+        gas_fraction = self.gas_fraction / 100.0
+
+        max_lower = min_upper = None
+        overlap_failed = False
+
+        released = 0
+        sum_weights = wmean = chi2 = 0
+        m = 0
+
         potential_end = None
         for i in range(start, n, 1):
+            if use_overlap and not overlap_failed:
+                a, e = ages[i], errors[i] * sigma
+                lower, upper = a - e, a + e
+                if i == start:
+                    max_lower, min_upper = lower, upper
+                elif lower < min_upper and max_lower < upper:
+                    max_lower = max(max_lower, lower)
+                    min_upper = min(min_upper, upper)
+                else:
+                    overlap_failed = True
+
+            released += signals[i]
+
             if i in excludes:
                 continue
 
-            if not self.check_nsteps(start, i):
+            if use_mswd:
+                w = errors[i] ** -2 if errors[i] else float("inf")
+                m += 1
+                sum_weights += w
+                delta = ages[i] - wmean
+                wmean += delta * w / sum_weights
+                chi2 += w * delta * (ages[i] - wmean)
+
+            if (i - start) + 1 < nsteps:
                 log.debug("{} {} nsteps failed".format(start, i))
                 continue
 
-            if self.use_overlap and not self.check_overlap(start, i, overlap_func):
+            if use_overlap and overlap_failed:
                 log.debug("{} {} overlap failed".format(start, i))
-                # potential_end=None
                 break
 
-            if self.use_mswd and not self.check_mswd(start, i):
-                continue
+            if use_mswd:
+                mswd = chi2 / (m - 1) if m > 1 else 0
+                if not validate_mswd(mswd, m):
+                    continue
 
-            if not self.check_percent_released(start, i):
+            if not released / total_signal >= gas_fraction:
                 log.debug("{} {} percent failed".format(start, i))
                 continue
 
@@ -138,8 +189,9 @@ class Plateau(HasTraits):
         """
         return False if not valid
         """
-        ages = self.ages[start, end + 1]
-        errors = self.errors[start, end + 1]
+        idx = [i for i in range(start, end + 1) if i not in self.excludes]
+        ages = self.ages[idx]
+        errors = self.errors[idx]
         mswd = calculate_mswd(ages, errors)
         return validate_mswd(mswd, len(ages))
 
@@ -0,0 +1,70 @@
+import multiprocessing
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from numpy import linspace
+from numpy.random import RandomState
+
+from pychron.processing.isotope import Isotope
+from pychron.processing.isotope_refit import (
+    measurement_payload,
+    refit_measurements,
+    regression_stats,
+)
+
+
+def make_isotope(name, fit, seed):
+    rs = RandomState(seed)
+    iso = Isotope(name, "H1")
+    iso.xs = linspace(10, 200, 100)
+    iso.ys = 100 - 0.05 * iso.xs + rs.normal(0, 0.2, 100)
+    iso.ys[[10, 55]] += 5
+    iso.baseline.xs = linspace(0, 30, 30)
+    iso.baseline.ys = rs.normal(0.01, 0.002, 30)
+    iso.baseline.set_fit("average")
+
+    iso.set_fit(fit)
+    iso.set_filter_outliers_dict(filter_outliers=True, iterations=2, std_devs=2)
+    return iso
+
+
+class IsotopeRefitTestCase(unittest.TestCase):
+    def setUp(self):
+        self.isotopes = [
+            make_isotope("Ar40", "linear", 1),
+            make_isotope("Ar39", "parabolic", 2),
+            make_isotope("Ar36", "average", 3),
+        ]
+        self.payloads = [(measurement_payload(iso), 0.5) for iso in self.isotopes]
+
+    def test_payload_picklable(self):
+        p = pickle.loads(pickle.dumps(self.payloads))
+        self.assertEqual(p[0][0]["name"], "Ar40")
+        self.assertEqual(p[0][0]["baseline"]["name"], "Ar40 bs")
+
+    def test_identical(self):
+        serial = [regression_stats(iso, 0.5) for iso in self.isotopes]
+        self.assertEqual(serial, refit_measurements(self.payloads))
+
+    def test_identical_process(self):
+        serial = [regression_stats(iso, 0.5) for iso in self.isotopes]
+
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=2, mp_context=ctx) as executor:
+            parallel = executor.submit(refit_measurements, self.payloads).result()
+
+        self.assertEqual(serial, parallel)
+
+    def test_outliers(self):
+        stats = refit_measurements(self.payloads[:1])[0]
+
+        iso = self.isotopes[0]
+        iso.regressor.calculate()
+        self.assertIn(10, iso.outlier_excluded)
+        self.assertIn(55, iso.outlier_excluded)
+        self.assertEqual(stats["noutliers"], len(iso.outlier_excluded))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,46 @@ __author__ = "ross"
 
 import unittest
 
-from pychron.processing.plateau import Plateau
+from numpy import argmax, array
+from numpy.random import RandomState
+
+from pychron.processing.plateau import Plateau, memoize
+from pychron.pychron_constants import MAHON
+
+
+def reference_find_plateaus(p, method=""):
+    """
+    exhaustive search using the pairwise checks
+    """
+    p.find_plateaus(method)
+    n = len(p.ages)
+    overlap_func = memoize(p._overlap)
+
+    idxs = []
+    for start in range(n):
+        if start in p.excludes:
+            continue
+
+        potential_end = None
+        for i in range(start, n):
+            if i in p.excludes:
+                continue
+            if not p.check_nsteps(start, i):
+                continue
+            if p.use_overlap and not p.check_overlap(start, i, overlap_func):
+                break
+            if p.use_mswd and not p.check_mswd(start, i):
+                continue
+            if not p.check_percent_released(start, i):
+                continue
+            potential_end = i
+
+        if potential_end:
+            idxs.append((start, potential_end))
+
+    if idxs:
+        return idxs[argmax(array([e - s for s, e in idxs]))]
+    return idxs
 
 
 class PlateauTestCase(unittest.TestCase):
@@ -152,6 +191,26 @@ class PlateauTestCase(unittest.TestCase):
         idx = (1, 4)
         return ages, errors, signals, exclude, idx
 
+    def test_random(self):
+        rs = RandomState(0)
+        for trial in range(200):
+            n = rs.randint(3, 40)
+            ages = 10 + rs.normal(0, 0.5, n)
+            errors = rs.uniform(0.1, 1, n)
+            signals = rs.uniform(0, 1, n)
+            excludes = list(rs.choice(n, rs.randint(0, 3), replace=False))
+            for method in ("", MAHON):
+                p = Plateau(
+                    ages=ages,
+                    errors=errors,
+                    signals=signals,
+                    excludes=excludes,
+                    gas_fraction=rs.choice((30, 50)),
+                )
+                self.assertEqual(
+                    p.find_plateaus(method), reference_find_plateaus(p, method)
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
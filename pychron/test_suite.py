@@ -3,10 +3,12 @@ import unittest
 
 from pychron.canvas.canvas2D.tests.calibration_item import CalibrationObjectTestCase
 from pychron.core.helpers.tests.floatfmt import SigFigStdFmtTestCase
+from pychron.core.stats.tests.monte_carlo_test import MonteCarloTestCase
 from pychron.core.stats.tests.mswd_tests import MSWDTestCase
 
 # # Core
 from pychron.core.stats.tests.peak_detection_test import MultiPeakDetectionTestCase
+from pychron.core.stats.tests.probability_curves_test import ProbabilityCurvesTestCase
 from pychron.core.tests.spell_correct import SpellCorrectTestCase
 from pychron.core.tests.filtering_tests import FilteringTestCase
 
@@ -22,12 +24,27 @@ from pychron.core.regression.tests.regression import (
     TruncateRegressionTest,
 )
 from pychron.core.tests.alpha_tests import AlphaTestCase
+from pychron.core.tests.growable_buffer import (
+    GrowableBufferTestCase,
+    IsotopeAppendTestCase,
+)
+from pychron.database.tests.scoped_session import ScopedSessionTestCase
+from pychron.dvc.tests.browser_queries import BrowserQueriesTestCase
+from pychron.dvc.tests.cache import DVCCacheTestCase
+from pychron.dvc.tests.currents import CurrentsTestCase
+from pychron.dvc.tests.meta_repo import IrradiationInfoCacheTestCase
+from pychron.dvc.tests.persistence_worker import PersistenceWorkerTestCase
+from pychron.dvc.tests.raw_sidecar import RawSidecarTestCase
+from pychron.dvc.tests.sync_repos import SyncReposTestCase
 from pychron.experiment.tests.backup import BackupTestCase
+from pychron.experiment.tests.cadence import CadenceSchedulerTestCase
 from pychron.experiment.tests.comment_template import CommentTemplaterTestCase
+from pychron.experiment.tests.data_collector import DataCollectorConsumerTestCase
 from pychron.experiment.tests.conditionals import (
     ConditionalsTestCase,
     ParseConditionalsTestCase,
 )
+from pychron.experiment.tests.duration_cache import DurationCacheTestCase
 from pychron.experiment.tests.duration_tracker import DurationTrackerTestCase
 from pychron.experiment.tests.frequency_test import (
     FrequencyTestCase,
@@ -38,8 +55,23 @@ from pychron.experiment.tests.peak_hop_parse import PeakHopYamlCase1, PeakHopTxt
 from pychron.experiment.tests.peak_hop_parse import PeakHopYamlCase2
 from pychron.experiment.tests.position_regex_test import XYTestCase
 from pychron.experiment.tests.renumber_aliquot_test import RenumberAliquotTestCase
+from pychron.experiment.tests.run_lookahead import (
+    ExecutorLookaheadTestCase,
+    RunLookaheadTestCase,
+)
+from pychron.dashboard.tests.scheduler import PollSchedulerTestCase
 from pychron.external_pipette.tests.external_pipette import ExternalPipetteTestCase
+from pychron.extraction_line.tests.switch_state_refresher import (
+    SwitchStateRefresherTestCase,
+)
+from pychron.git_archive.test.repo_manager import (
+    AddPathsTestCase,
+    RepositoryLockTestCase,
+)
+from pychron.graph.tests.regression_graph import RegressionGraphRefreshTestCase
+from pychron.graph.tests.streaming_data import StreamingSeriesTestCase
 from pychron.processing.tests.age_converter import AgeConverterTestCase
+from pychron.processing.tests.isotope_refit import IsotopeRefitTestCase
 from pychron.processing.tests.plateau import PlateauTestCase
 from pychron.processing.tests.ratio import RatioTestCase
 
@@ -78,6 +110,8 @@ def suite():
         CalibrationObjectTestCase,
         # Core
         AlphaTestCase,
+        GrowableBufferTestCase,
+        IsotopeAppendTestCase,
         SpellCorrectTestCase,
         FilteringTestCase,
         MultiPeakDetectionTestCase,
@@ -92,6 +126,8 @@ def suite():
         OLSRegressionTest2,
         TruncateRegressionTest,
         MSWDTestCase,
+        MonteCarloTestCase,
+        ProbabilityCurvesTestCase,
         # old
         # ExpoRegressionTest,
         # ExpoRegressionTest2,
@@ -104,6 +140,7 @@ def suite():
         PeakHopYamlCase2,
         BackupTestCase,
         PeakHopTxtCase,
+        DurationCacheTestCase,
         DurationTrackerTestCase,
         FrequencyTestCase,
         FrequencyTemplateTestCase,
@@ -113,12 +150,37 @@ def suite():
         ParseConditionalsTestCase,
         IdentifierTestCase,
         CommentTemplaterTestCase,
+        CadenceSchedulerTestCase,
+        DataCollectorConsumerTestCase,
+        RunLookaheadTestCase,
+        ExecutorLookaheadTestCase,
+        # Dashboard
+        PollSchedulerTestCase,
+        # Database
+        ScopedSessionTestCase,
+        # Graph
+        RegressionGraphRefreshTestCase,
+        StreamingSeriesTestCase,
+        # DVC
+        BrowserQueriesTestCase,
+        DVCCacheTestCase,
+        CurrentsTestCase,
+        IrradiationInfoCacheTestCase,
+        RawSidecarTestCase,
+        PersistenceWorkerTestCase,
+        SyncReposTestCase,
+        # Git
+        AddPathsTestCase,
+        RepositoryLockTestCase,
         # ExternalPipette
         ExternalPipetteTestCase,
+        # ExtractionLine
+        SwitchStateRefresherTestCase,
         # Processing
         PlateauTestCase,
         RatioTestCase,
         AgeConverterTestCase,
+        IsotopeRefitTestCase,
         # Pyscripts
         # WaitForTestCase,
         # InterpolationTestCase,
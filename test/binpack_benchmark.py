@@ -0,0 +1,126 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+micro-benchmarks comparing the legacy per-sample struct codec with the numpy codec used by
+binpack and BaseMeasurement.
+
+python -m unittest test.binpack_benchmark -v
+"""
+# ============= standard library imports ========================
+import struct
+import timeit
+import unittest
+
+from numpy import array, linspace
+from numpy.random import RandomState
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.binpack import pack, unpack
+from pychron.processing.isotope import Isotope
+
+COUNTS = (100, 1000, 10000)
+NUMBER = 20
+
+
+def legacy_pack(fmt, xs, ys):
+    return b"".join((struct.pack(fmt, x, y) for x, y in zip(xs, ys)))
+
+
+def legacy_unpack(blob, fmt=">ff", step=8):
+    return list(
+        zip(*[struct.unpack(fmt, blob[i : i + step]) for i in range(0, len(blob), step)])
+    )
+
+
+def make_isotope(n, seed=0):
+    rs = RandomState(seed)
+    iso = Isotope("Ar40", "H1")
+    iso.xs = linspace(0, n * 0.524288, n)
+    iso.ys = 1000 + rs.normal(0, 10, n)
+    return iso
+
+
+class BinpackBenchmark(unittest.TestCase):
+    def _report(self, name, n, told, tnew):
+        print(
+            "{:<10s} n={:<6d} legacy={:8.3f}ms numpy={:8.3f}ms speedup={:6.1f}x".format(
+                name, n, told * 1000, tnew * 1000, told / tnew
+            )
+        )
+
+    def test_pack(self):
+        for n in COUNTS:
+            iso = make_isotope(n)
+            self.assertEqual(iso.pack(as_hex=False), legacy_pack(">ff", iso.xs, iso.ys))
+
+            told = timeit.timeit(lambda: legacy_pack(">ff", iso.xs, iso.ys), number=NUMBER)
+            tnew = timeit.timeit(lambda: iso.pack(as_hex=False), number=NUMBER)
+            self._report("pack", n, told / NUMBER, tnew / NUMBER)
+
+    def test_unpack(self):
+        for n in COUNTS:
+            iso = make_isotope(n)
+            blob = iso.pack(as_hex=False)
+
+            oxs, oys = legacy_unpack(blob)
+            iso.unpack_data(blob)
+            self.assertEqual(list(iso.xs), list(array(oxs)))
+            self.assertEqual(list(iso.ys), list(array(oys)))
+
+            told = timeit.timeit(lambda: [array(c) for c in legacy_unpack(blob)], number=NUMBER)
+            tnew = timeit.timeit(lambda: iso.unpack_data(blob), number=NUMBER)
+            self._report("unpack", n, told / NUMBER, tnew / NUMBER)
+
+    def test_binpack_unpack(self):
+        for n in COUNTS:
+            iso = make_isotope(n)
+            data = list(zip(iso.xs, iso.ys))
+            blob = pack(">ff", data)
+            self.assertEqual(unpack(blob), legacy_unpack(blob))
+
+            told = timeit.timeit(lambda: legacy_unpack(blob), number=NUMBER)
+            tnew = timeit.timeit(lambda: unpack(blob), number=NUMBER)
+            self._report("binpack", n, told / NUMBER, tnew / NUMBER)
+
+    def test_partial_blob(self):
+        iso = make_isotope(100)
+        blob = iso.pack(as_hex=False)[:-3]
+        iso.unpack_data(blob)
+        self.assertEqual(iso.xs.shape[0], 99)
+        self.assertEqual(len(unpack(blob)[0]), 99)
+
+    def test_reverse_unpack(self):
+        iso = make_isotope(100)
+        xs, ys = iso.xs, iso.ys
+        blob = iso.pack(as_hex=False)
+        iso.reverse_unpack = True
+        iso.unpack_data(blob)
+        self.assertEqual(list(iso.xs), list(ys.astype("f4")))
+        self.assertEqual(list(iso.ys), list(xs.astype("f4")))
+
+    def test_endianness(self):
+        iso = make_isotope(100)
+        blob = iso.pack(endianness="<", as_hex=False)
+        self.assertEqual(blob, legacy_pack("<ff", iso.xs, iso.ys))
+
+        iso.endianness = "<"
+        iso.unpack_data(blob)
+        self.assertEqual(list(iso.xs), list(array(legacy_unpack(blob, "<ff")[0])))
+
+
+if __name__ == "__main__":
+    unittest.main()
+# ============= EOF =============================================
@@ -0,0 +1,119 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+benchmark the Locator threshold band search modes.
+
+stored calibration images (e.g. autocenter snapshots of a tray) are read from the directory
+PYCHRON_LOCATOR_IMAGES. PYCHRON_LOCATOR_DIM is the hole radius in pixels. if no directory is
+given synthetic images of a dark hole on a noisy background are used
+
+PYCHRON_LOCATOR_IMAGES=~/Pychron/data/snapshots/autocenter python -m unittest test.locator_benchmark -v
+"""
+# ============= standard library imports ========================
+import os
+import time
+import unittest
+
+from numpy import ogrid, clip
+from numpy.random import RandomState
+
+# ============= local library imports  ==========================
+from pychron.mv.locator import Locator
+
+MODES = (
+    ("new style", {}),
+    ("otsu", {"search_mode": "otsu"}),
+    ("otsu 4 workers", {"search_mode": "otsu", "nworkers": 4}),
+)
+EXTENSIONS = (".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp")
+
+
+def make_frame(seed, size=240, radius=45):
+    rs = RandomState(seed)
+    cx, cy = size / 2 + rs.uniform(-10, 10), size / 2 + rs.uniform(-10, 10)
+    y, x = ogrid[:size, :size]
+    hole = (x - cx) ** 2 + (y - cy) ** 2 < radius ** 2
+
+    frame = 170 + rs.normal(0, 8, (size, size))
+    frame[hole] = 70 + rs.normal(0, 8, hole.sum())
+    return clip(frame, 0, 255).astype("uint8")
+
+
+def load_frames():
+    root = os.environ.get("PYCHRON_LOCATOR_IMAGES")
+    if root:
+        from skimage.io import imread
+
+        root = os.path.expanduser(root)
+        names = sorted(n for n in os.listdir(root) if n.lower().endswith(EXTENSIONS))
+        dim = float(os.environ.get("PYCHRON_LOCATOR_DIM", 45))
+        return [(n, imread(os.path.join(root, n)), dim) for n in names]
+    else:
+        return [("synthetic{}".format(i), make_frame(i), 45) for i in range(5)]
+
+
+class LocatorBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.frames = load_frames()
+
+    def _search(self, frame, dim, search):
+        loc = Locator()
+        st = time.time()
+        targets = loc._find_targets(None, frame, dim, search=dict(search))
+        return targets, loc.search_report, time.time() - st
+
+    def test_modes(self):
+        totals = {name: 0 for name, _ in MODES}
+        for fname, frame, dim in self.frames:
+            reports = {}
+            for name, search in MODES:
+                targets, report, et = self._search(frame, dim, search)
+                totals[name] += et
+                reports[name] = report
+                print(
+                    "{:<20s} {:<16s} time={:8.3f}s band={}".format(
+                        fname,
+                        name,
+                        et,
+                        "{index} ({low}-{high})".format(**report) if report else None,
+                    )
+                )
+
+            # the concurrent search must pick the same band as the serial search
+            a, b = reports["otsu"], reports["otsu 4 workers"]
+            if a is None:
+                self.assertIsNone(b)
+            else:
+                self.assertEqual(
+                    (a["index"], a["low"], a["high"]),
+                    (b["index"], b["low"], b["high"]),
+                )
+
+        for name, _ in MODES:
+            print("total {:<16s} {:8.3f}s".format(name, totals[name]))
+
+    def test_synthetic_found(self):
+        for i in range(3):
+            frame = make_frame(i)
+            for name, search in MODES:
+                targets, report, et = self._search(frame, 45, search)
+                self.assertTrue(targets, "{} failed on frame {}".format(name, i))
+
+
+if __name__ == "__main__":
+    unittest.main()
+# ============= EOF =============================================
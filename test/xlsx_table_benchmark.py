@@ -0,0 +1,236 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+benchmark the XLSX analysis table writer with a 10,000 analysis, 5 sheet data repository table
+(formatted and machine unknowns, airs, blanks and monitors) written in the default and the
+constant memory mode.
+
+python -m unittest test.xlsx_table_benchmark -v
+"""
+# ============= standard library imports ========================
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+import unittest
+from datetime import datetime, timedelta
+
+from numpy.random import RandomState
+from uncertainties import ufloat
+
+# ============= local library imports  ==========================
+from pychron.paths import paths
+
+NANALYSES = 2000
+GROUP_SIZE = 100
+DETECTORS = ("H1", "AX", "L1", "L2", "CDD")
+
+
+class Constants(object):
+    age_units = "Ma"
+    atm4036 = ufloat(298.56, 0.31)
+
+    def scale_age(self, v, units):
+        return v
+
+
+class Value(object):
+    def __init__(self, v, e, kind="Plateau"):
+        self.value = v
+        self.error = e
+        self.uvalue = ufloat(v, e)
+        self.kind = kind
+        self.computed_kind = kind
+        self.error_kind = "Analytical"
+
+
+class Isotope(object):
+    def __init__(self, rs, detector):
+        self.detector = detector
+        self.uvalue = ufloat(rs.uniform(1, 100), rs.uniform(0.01, 1))
+        self.blank = Value(rs.uniform(0, 1), rs.uniform(0, 0.01))
+
+    def get_intensity(self):
+        return self.uvalue
+
+
+class Analysis(object):
+    """
+    numeric attributes not defined here return a random value
+    """
+
+    arar_constants = Constants()
+    tag = "ok"
+    identifier = "12345"
+    sample = "MB-1234"
+    material = "sanidine"
+    project = "Benchmark"
+    irradiation_label = "NM-300 A1"
+    monitor_name = "FC-2"
+    monitor_material = "sanidine"
+    interference_corrections = {}
+
+    def __init__(self, rs, i):
+        self._rs = rs
+        self.aliquot_step_str = "{:02n}".format(i % 100)
+        self.rundate = datetime(2026, 1, 1) + timedelta(hours=i)
+        self.isotopes = {
+            "Ar{}".format(m): Isotope(rs, DETECTORS[j % len(DETECTORS)])
+            for j, m in enumerate((40, 39, 38, 37, 36))
+        }
+        self.production_ratios = {"Ca_K": 1.312, "Cl_K": 0.2}
+        self._omitted = not i % 17
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return ufloat(self._rs.uniform(0.001, 1000), self._rs.uniform(0.0001, 1))
+
+    def is_omitted(self):
+        return self._omitted
+
+    def get_ic_factor(self, det):
+        return ufloat(1.001, 0.001)
+
+
+class Group(object):
+    sample = "MB-1234"
+    identifier = "12345"
+    material = "sanidine"
+    flatlon = "34.0N, 106.9W"
+    unit = ""
+    location = ""
+    irradiation_label = "NM-300 A1"
+    j = 0.001
+    j_err = 0.000001
+    nratio = "100/100"
+    mswd = 1.1
+    comments = ""
+    plateau_steps_str = "A-J"
+    integrated_enabled = True
+    monitor_info = 28.201, "Kuiper et al. 2008"
+    arar_constants = Constants()
+
+    def __init__(self, rs, analyses):
+        self.analyses = analyses
+        self.nanalyses = self.total_n = len(analyses)
+        self._cum = rs.uniform(0, 1, len(analyses)).cumsum()
+        self._cum *= 100 / self._cum[-1]
+
+        age = ufloat(rs.uniform(1, 100), rs.uniform(0.01, 1))
+        self.uage = self.weighted_age = self.arith_age = self.plateau_age = age
+        self.isochron_age = self.integrated_age = age
+        self.isochron_4036 = ufloat(298, 2)
+        self.total_k2o = ufloat(1, 0.1)
+
+    def get_preferred_obj(self, attr):
+        return Value(10.0, 0.1)
+
+    def cumulative_ar39(self, i):
+        return float(self._cum[i])
+
+    def get_is_plateau_step(self, i):
+        return 10 < i < 90
+
+    def scaled_age(self, a, units):
+        return a
+
+    def get_preferred_mswd_tuple(self):
+        return 1.1, True, self.nanalyses - 1, 0.3
+
+    def isochron_mswd(self):
+        return 1.2, True, self.nanalyses - 2, 0.3
+
+    def plateau_total_ar39(self):
+        return 80.0
+
+    def valid_total_ar39(self):
+        return 100.0
+
+
+def make_groups(seed, n=NANALYSES, size=GROUP_SIZE):
+    rs = RandomState(seed)
+    return [
+        Group(rs, [Analysis(rs, i) for i in range(size)]) for _ in range(n // size)
+    ]
+
+
+class XLSXTableBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        paths.build("_bench")
+
+        unknowns = make_groups(1)
+        cls.groups = {
+            "unknowns": unknowns,
+            "machine_unknowns": unknowns,
+            "airs": make_groups(2),
+            "blanks": make_groups(3),
+            "monitors": make_groups(4),
+        }
+        cls.root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.root)
+
+    def _write(self, constant_memory):
+        from pychron.pipeline.tables.xlsx_table_options import (
+            XLSXAnalysisTableWriterOptions,
+        )
+        from pychron.pipeline.tables.xlsx_table_writer import XLSXAnalysisTableWriter
+
+        options = XLSXAnalysisTableWriterOptions("xlsx_table_benchmark")
+        options.use_constant_memory = constant_memory
+        options.include_summary_sheet = False
+
+        path = os.path.join(self.root, "table{}.xlsx".format(int(constant_memory)))
+        writer = XLSXAnalysisTableWriter()
+
+        tracemalloc.start()
+        st = time.time()
+        writer._write_workbook(self.groups, path, options)
+        et = time.time() - st
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        nformats = len(writer._formats)
+        print(
+            "constant_memory={:<5} time={:8.2f}s peak={:8.1f}MB formats={} "
+            "size={:0.1f}MB".format(
+                str(constant_memory),
+                et,
+                peak / 1024.0**2,
+                nformats,
+                os.path.getsize(path) / 1024.0**2,
+            )
+        )
+        return peak, nformats
+
+    def test_write(self):
+        peak, nformats = self._write(False)
+        cpeak, cnformats = self._write(True)
+
+        # formats are interned so their number does not grow with the number of analyses
+        self.assertLess(nformats, 100)
+        self.assertEqual(nformats, cnformats)
+        self.assertLess(cpeak, peak)
+
+
+if __name__ == "__main__":
+    unittest.main()
+# ============= EOF =============================================